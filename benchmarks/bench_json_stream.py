@@ -0,0 +1,59 @@
+"""Compare `json.load` against the streaming validator on a large generated JSON file (time and peak memory).
+
+Usage:
+    python benchmarks/bench_json_stream.py --resources 50000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from devopstoolbox.jsonstream import validate_json_stream
+
+
+def write_state(file_path: Path, resources: int) -> None:
+    """Write a Terraform-state-like document with ``resources`` entries."""
+    with open(file_path, "w") as f:
+        f.write('{"version": 4, "serial": 1, "resources": [\n')
+        for index in range(resources):
+            resource = {
+                "mode": "managed",
+                "type": "aws_instance",
+                "name": f"node_{index}",
+                "instances": [{"attributes": {"id": f"i-{index:017x}", "tags": {"Name": f"node-{index}"}, "cpu": 2, "ebs": [{"size": 100}]}}],
+            }
+            f.write(("," if index else "") + json.dumps(resource, indent=2) + "\n")
+        f.write("]}\n")
+
+
+def profiled(check, file_path: Path) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    with open(file_path) as f:
+        check(f)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024**2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resources", type=int, default=50000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = Path(tmp) / "terraform.tfstate.json"
+        write_state(file_path, args.resources)
+        print(f"{file_path.stat().st_size / 1024**2:.1f} MiB document")
+        print(f"{'validator':>22} {'seconds':>10} {'peak MiB':>10}")
+        for name, check in (("json.load", json.load), ("validate_json_stream", validate_json_stream)):
+            elapsed, peak = profiled(check, file_path)
+            print(f"{name:>22} {elapsed:>10.3f} {peak:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
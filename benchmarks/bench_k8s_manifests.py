@@ -0,0 +1,91 @@
+"""Measure `validate k8s-manifests` throughput (documents per minute) on generated Deployments.
+
+Point --schema-dir at an offline copy of the cluster schemas, for example the output of
+`kubectl get --raw /openapi/v2 > schemas/swagger.json`.
+
+Usage:
+    python benchmarks/bench_k8s_manifests.py --schema-dir ./schemas --files 1000 --documents 20 --jobs 1 4
+"""
+
+import argparse
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+
+from devopstoolbox.k8sschema import load_schema_store
+from devopstoolbox.validate import run_validation, validate_k8s_manifest_file
+
+DEPLOYMENT = """\
+---
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: app-{index}
+  labels:
+    app: app-{index}
+spec:
+  replicas: 2
+  selector:
+    matchLabels:
+      app: app-{index}
+  template:
+    metadata:
+      labels:
+        app: app-{index}
+    spec:
+      containers:
+        - name: app
+          image: registry.example.com/app:{index}
+          ports:
+            - containerPort: 8080
+          resources:
+            requests:
+              cpu: 100m
+              memory: 128Mi
+            limits:
+              cpu: 1
+              memory: 256Mi
+          readinessProbe:
+            httpGet:
+              path: /healthz
+              port: 8080
+"""
+
+
+def generate_tree(root: Path, files: int, documents: int) -> list[Path]:
+    paths = []
+    for file_index in range(files):
+        path = root / f"manifest-{file_index:05d}.yaml"
+        path.write_text("".join(DEPLOYMENT.format(index=file_index * documents + doc) for doc in range(documents)))
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--schema-dir", type=Path, required=True)
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--documents", type=int, default=20, help="Documents per file.")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--strict", action="store_true")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    store = load_schema_store(args.schema_dir.resolve(), args.strict)
+    print(f"Indexed {len(store)} kinds in {time.perf_counter() - start:.2f}s")
+
+    validator = partial(validate_k8s_manifest_file, schema_dir=args.schema_dir.resolve(), strict=args.strict)
+    with tempfile.TemporaryDirectory() as tmp:
+        files = generate_tree(Path(tmp), args.files, args.documents)
+        total = args.files * args.documents
+        print(f"{'jobs':>6} {'seconds':>10} {'docs/min':>12}")
+        for jobs in args.jobs:
+            start = time.perf_counter()
+            invalid = sum(1 for _, is_valid, _ in run_validation(files, validator, jobs) if not is_valid)
+            elapsed = time.perf_counter() - start
+            print(f"{jobs:>6} {elapsed:>10.2f} {total / elapsed * 60:>12,.0f}" + (f"  ({invalid} invalid files)" if invalid else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Compare model deserialization against the raw JSON fast path used by `k8s pods list` (time and peak memory).
+
+Runs offline on a PodList: either a recording (`kubectl get pods -A -o json > podlist.json`) passed with
+--fixture, or a generated one with realistic pod specs and statuses.
+
+Usage:
+    python benchmarks/bench_pod_listing.py --pods 5000
+    python benchmarks/bench_pod_listing.py --fixture podlist.json
+"""
+
+import argparse
+import inspect
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+from kubernetes.client import ApiClient
+
+from devopstoolbox.k8s.pods import _pod_row
+
+
+class RecordedResponse:
+    """Stands in for the urllib3 response the client returns with ``_preload_content=False``."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def release_conn(self):
+        pass
+
+
+def make_pod(index: int) -> dict:
+    name = f"web-{index:06d}"
+    container = {
+        "name": "web",
+        "image": "registry.example.com/web:1.2.3",
+        "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+        "env": [{"name": f"VAR_{n}", "value": f"value-{n}"} for n in range(8)],
+        "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}, "limits": {"cpu": "1", "memory": "256Mi"}},
+        "readinessProbe": {"httpGet": {"path": "/healthz", "port": 8080, "scheme": "HTTP"}, "periodSeconds": 10},
+        "volumeMounts": [{"name": "config", "mountPath": "/etc/web"}],
+    }
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": f"team-{index % 40}",
+            "uid": f"00000000-0000-0000-0000-{index:012d}",
+            "resourceVersion": str(1000 + index),
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+            "labels": {"app": "web", "pod-template-hash": "5d4f8b7c9"},
+            "ownerReferences": [{"apiVersion": "apps/v1", "kind": "ReplicaSet", "name": "web-5d4f8b7c9", "uid": "1", "controller": True}],
+        },
+        "spec": {
+            "containers": [container, {**container, "name": "sidecar"}],
+            "volumes": [{"name": "config", "configMap": {"name": "web-config"}}],
+            "nodeName": f"node-{index % 200}",
+            "serviceAccountName": "default",
+            "tolerations": [{"key": "node.kubernetes.io/not-ready", "operator": "Exists", "effect": "NoExecute", "tolerationSeconds": 300}],
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": "10.0.0.1",
+            "startTime": "2024-01-01T00:00:05Z",
+            "conditions": [{"type": kind, "status": "True", "lastTransitionTime": "2024-01-01T00:00:05Z"} for kind in ("Initialized", "Ready", "ContainersReady", "PodScheduled")],
+            "containerStatuses": [
+                {
+                    "name": name,
+                    "ready": True,
+                    "restartCount": index % 3,
+                    "image": "registry.example.com/web:1.2.3",
+                    "imageID": "registry.example.com/web@sha256:0123",
+                    "containerID": "containerd://0123",
+                    "state": {"running": {"startedAt": "2024-01-01T00:00:06Z"}},
+                }
+                for name in ("web", "sidecar")
+            ],
+        },
+    }
+
+
+def deserialize(body: bytes):
+    api_client = ApiClient()
+    # Newer generated clients take the response text and content type instead of a response object.
+    if "content_type" in inspect.signature(api_client.deserialize).parameters:
+        return api_client.deserialize(body.decode(), "V1PodList", "application/json")
+    return api_client.deserialize(RecordedResponse(body), "V1PodList")
+
+
+def model_rows(body: bytes) -> list:
+    pods = deserialize(body)
+    rows = []
+    for pod in pods.items:
+        statuses = pod.status.container_statuses or []
+        restart_count = sum((status.restart_count or 0) for status in statuses)
+        rows.append((pod.metadata.namespace or "-", pod.metadata.name, pod.status.phase, str(restart_count)))
+    return rows
+
+
+def raw_rows(body: bytes) -> list:
+    return [_pod_row(pod) for pod in json.loads(body)["items"]]
+
+
+def profiled(extract, body: bytes) -> tuple[float, float, list]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = extract(body)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024**2, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pods", type=int, default=5000)
+    parser.add_argument("--fixture", type=Path, help="Recorded PodList JSON (kubectl get pods -A -o json).")
+    args = parser.parse_args()
+
+    if args.fixture:
+        body = args.fixture.read_bytes()
+    else:
+        body = json.dumps({"apiVersion": "v1", "kind": "PodList", "metadata": {}, "items": [make_pod(index) for index in range(args.pods)]}).encode()
+
+    print(f"{len(body) / 1024**2:.1f} MiB PodList")
+    print(f"{'path':>8} {'seconds':>10} {'peak MiB':>10}")
+    results = {}
+    for name, extract in (("models", model_rows), ("raw", raw_rows)):
+        elapsed, peak, rows = profiled(extract, body)
+        results[name] = rows
+        print(f"{name:>8} {elapsed:>10.3f} {peak:>10.2f}")
+    assert results["models"] == results["raw"], "fast path rows differ from model rows"
+
+
+if __name__ == "__main__":
+    main()
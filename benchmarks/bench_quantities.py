@@ -0,0 +1,87 @@
+"""Compare per-row quantity conversion against the column engine used by `k8s pods metrics`,
+and time the `--group-by` reduction over the same containers.
+
+Generates containers whose requests, limits and usage repeat the way workload replicas do, then times
+converting every row with the scalar helpers against parsing and formatting whole columns at once.
+The column engine uses NumPy when it is installed.
+
+Usage:
+    python benchmarks/bench_quantities.py --containers 200000 --repeat 3
+"""
+
+import argparse
+import random
+import time
+
+from devopstoolbox.k8s import quantity, utils
+from devopstoolbox.k8s.pods import _aggregate, _container_rows, _group_key_func, _group_rows
+
+CPU_LIMITS = ["100m", "250m", "500m", "1", "2", "1500m"]
+MEMORY_LIMITS = ["128Mi", "256Mi", "512Mi", "1Gi", "1.5Gi", "2G", "134217728"]
+
+
+def generate(containers: int, workloads: int) -> tuple[list, dict]:
+    rng = random.Random(0)
+    pods, usage = [], {}
+    for index in range(containers):
+        workload = index % workloads
+        cpu, memory = CPU_LIMITS[workload % len(CPU_LIMITS)], MEMORY_LIMITS[workload % len(MEMORY_LIMITS)]
+        name = f"app-{workload}-{index}"
+        resources = {"requests": {"cpu": cpu, "memory": memory}, "limits": {"cpu": cpu, "memory": memory}}
+        metadata = {"namespace": f"team-{workload % 40}", "name": name, "labels": {"app": f"app-{workload}"}}
+        pods.append({"metadata": metadata, "spec": {"containers": [{"name": "main", "resources": resources}]}})
+        usage[(f"team-{workload % 40}", name, "main")] = {"cpu": f"{rng.randrange(1, 10**9)}n", "memory": f"{rng.randrange(1, 10**6)}Ki"}
+    return pods, usage
+
+
+def per_row(pods: list, usage_by_key: dict) -> list:
+    rows = []
+    for pod in pods:
+        for container in pod["spec"]["containers"]:
+            limits = container["resources"]["limits"]
+            usage = usage_by_key[(pod["metadata"]["namespace"], pod["metadata"]["name"], container["name"])]
+            rows.append(
+                (
+                    utils.parse_cpu(usage["cpu"]),
+                    utils.calculate_cpu_percentage(usage["cpu"], limits["cpu"]),
+                    utils.parse_memory(usage["memory"]),
+                    utils.calculate_memory_percentage(usage["memory"], limits["memory"]),
+                )
+            )
+    return rows
+
+
+def best_of(repeat: int, func, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--containers", type=int, default=200_000)
+    parser.add_argument("--workloads", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pods, usage = generate(args.containers, args.workloads)
+    print(f"{args.containers} containers, {args.workloads} workloads, column backend: {'numpy' if quantity._numpy() is not None else 'array'}")
+
+    row_seconds = best_of(args.repeat, per_row, pods, usage)
+    column_seconds = best_of(args.repeat, _container_rows, pods, usage)
+    print(f"{'method':>10} {'seconds':>10} {'rows/sec':>12}")
+    for name, elapsed in (("per-row", row_seconds), ("columns", column_seconds)):
+        print(f"{name:>10} {elapsed:>10.3f} {args.containers / elapsed:>12,.0f}")
+
+    print(f"\n{'group by':>10} {'seconds':>10} {'groups':>12}")
+    for group_by in ("namespace", "label=app"):
+        group_key = _group_key_func(group_by)
+        elapsed = best_of(args.repeat, lambda: _group_rows(_aggregate([(pods, usage)], group_key)))
+        print(f"{group_by:>10} {elapsed:>10.3f} {len(_aggregate([(pods, usage)], group_key)):>12,}")
+
+
+if __name__ == "__main__":
+    main()
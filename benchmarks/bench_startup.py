@@ -0,0 +1,71 @@
+"""Measure CLI startup per subcommand with ``python -X importtime`` and fail when one exceeds its budget.
+
+Each subcommand runs in a fresh interpreter. The reported import time is the sum of the cumulative
+times of the top-level imports, so it covers everything the command loads before doing any work.
+
+Usage:
+    python benchmarks/bench_startup.py --repeat 5
+    python benchmarks/bench_startup.py --scale 2  # slower machines, e.g. CI runners
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Subcommand -> import time budget in milliseconds.
+BUDGETS_MS = {
+    "version": 200,
+    "generate password": 200,
+    "validate --help": 500,
+    "k8s services --help": 1000,
+    "k8s pods --help": 1500,
+}
+
+# Modules whose presence is reported, to show which heavy dependencies a subcommand pulled in.
+HEAVY_MODULES = ("kubernetes", "yaml", "urllib3", "rich.console", "numpy")
+
+
+def measure(command: str) -> tuple[float, float, list[str]]:
+    """Return (import ms, wall-clock ms, heavy modules imported) for one run of ``command``."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-m", "devopstoolbox.main", *command.split()], capture_output=True, text=True)
+    wall = (time.perf_counter() - start) * 1000
+    import_us = 0
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        imported.add(name.strip())
+        # Top-level imports are not indented; nested ones are already counted in their parent.
+        if not name[1:].startswith(" "):
+            import_us += int(cumulative)
+    return import_us / 1000, wall, [module for module in HEAVY_MODULES if module in imported]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget by this factor")
+    args = parser.parse_args()
+
+    over_budget = []
+    print(f"{'subcommand':>22} {'import ms':>10} {'wall ms':>8} {'budget':>7}  heavy modules")
+    for command, budget in BUDGETS_MS.items():
+        runs = [measure(command) for _ in range(args.repeat)]
+        import_ms = statistics.median(run[0] for run in runs)
+        wall_ms = statistics.median(run[1] for run in runs)
+        budget *= args.scale
+        flag = "" if import_ms <= budget else "  OVER BUDGET"
+        print(f"{command:>22} {import_ms:>10.1f} {wall_ms:>8.1f} {budget:>7.0f}  {', '.join(runs[0][2]) or '-'}{flag}")
+        if flag:
+            over_budget.append(command)
+
+    if over_budget:
+        sys.exit(f"over budget: {', '.join(over_budget)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark `validate` throughput (files/sec) against the number of worker processes.
+
+Usage:
+    python benchmarks/bench_validate_jobs.py --files 5000 --jobs 1 2 4 8
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from devopstoolbox.validate import run_validation, validate_json_file, validate_yaml_file
+
+MANIFEST = """apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: app-{index}
+  labels:
+    app: app-{index}
+spec:
+  replicas: 3
+  selector:
+    matchLabels:
+      app: app-{index}
+  template:
+    metadata:
+      labels:
+        app: app-{index}
+    spec:
+      containers:
+        - name: main
+          image: registry.example.com/app:{index}
+          ports:
+            - containerPort: 8080
+          resources:
+            requests: {{cpu: 100m, memory: 128Mi}}
+            limits: {{cpu: 500m, memory: 256Mi}}
+"""
+
+
+def generate_tree(root: Path, count: int, fmt: str) -> list[Path]:
+    """Write ``count`` manifests spread over nested directories."""
+    files = []
+    for index in range(count):
+        directory = root / f"team-{index % 16}" / f"service-{index % 64}"
+        directory.mkdir(parents=True, exist_ok=True)
+        file_path = directory / f"manifest-{index}.{fmt}"
+        if fmt == "json":
+            file_path.write_text(json.dumps({"kind": "ConfigMap", "metadata": {"name": f"cm-{index}"}, "data": {"key": "x" * 512}}))
+        else:
+            file_path.write_text(MANIFEST.format(index=index))
+        files.append(file_path)
+    return sorted(files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--format", choices=["yaml", "json"], default="yaml")
+    parser.add_argument("--jobs", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    validator = validate_json_file if args.format == "json" else validate_yaml_file
+    with tempfile.TemporaryDirectory() as tmp:
+        files = generate_tree(Path(tmp), args.files, args.format)
+        print(f"{len(files)} {args.format} files, {os.cpu_count()} CPUs")
+        print(f"{'jobs':>6} {'seconds':>10} {'files/sec':>12} {'speedup':>8}")
+        baseline = None
+        for jobs in args.jobs:
+            start = time.perf_counter()
+            invalid = sum(1 for _, is_valid, _ in run_validation(files, validator, jobs) if not is_valid)
+            elapsed = time.perf_counter() - start
+            assert invalid == 0
+            baseline = baseline or elapsed
+            print(f"{jobs:>6} {elapsed:>10.3f} {len(files) / elapsed:>12.1f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
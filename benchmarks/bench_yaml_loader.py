@@ -0,0 +1,111 @@
+"""Compare the pure-Python SafeLoader against libyaml's CSafeLoader on large multi-document files,
+and full validation against ``--syntax-only`` validation (time and peak Python memory).
+
+Usage:
+    python benchmarks/bench_yaml_loader.py --documents 2000 --repeat 3
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import yaml as pyyaml
+
+from devopstoolbox import validate
+
+DOCUMENT = """---
+# Source: app/templates/deployment.yaml
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: app-{index}
+  labels:
+    app.kubernetes.io/name: app-{index}
+    app.kubernetes.io/managed-by: Helm
+  annotations:
+    checksum/config: "{checksum}"
+spec:
+  replicas: 3
+  selector:
+    matchLabels:
+      app.kubernetes.io/name: app-{index}
+  template:
+    metadata:
+      labels:
+        app.kubernetes.io/name: app-{index}
+    spec:
+      containers:
+        - name: main
+          image: "registry.example.com/app:1.{index}.0"
+          args: ["--port=8080", "--log-level=info", "--feature-gates=A=true,B=false"]
+          env:
+            - name: POD_NAME
+              valueFrom:
+                fieldRef:
+                  fieldPath: metadata.name
+            - name: CONFIG
+              value: |
+                server:
+                  port: 8080
+                  timeout: 30s
+          resources:
+            requests: {{cpu: 100m, memory: 128Mi}}
+            limits: {{cpu: 500m, memory: 256Mi}}
+"""
+
+
+def timed(loader: type, file_path: Path, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with open(file_path) as f:
+            for _ in pyyaml.load_all(f, Loader=loader):
+                pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def profiled(validator, file_path: Path) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    is_valid, error = validator(file_path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert is_valid, error
+    return elapsed, peak / 1024**2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = Path(tmp) / "rendered.yaml"
+        file_path.write_text("".join(DOCUMENT.format(index=index, checksum=f"{index:064x}") for index in range(args.documents)))
+        size_mb = file_path.stat().st_size / 1024**2
+        print(f"{args.documents} documents, {size_mb:.1f} MiB, validator uses {validate.YAML_LOADER.__name__}")
+
+        results = {"SafeLoader": timed(pyyaml.SafeLoader, file_path, args.repeat)}
+        if pyyaml.__with_libyaml__:
+            results["CSafeLoader"] = timed(pyyaml.CSafeLoader, file_path, args.repeat)
+        else:
+            print("PyYAML was built without libyaml; CSafeLoader is not available")
+
+        baseline = results["SafeLoader"]
+        print(f"{'loader':>12} {'seconds':>10} {'MiB/sec':>10} {'speedup':>8}")
+        for name, elapsed in results.items():
+            print(f"{name:>12} {elapsed:>10.3f} {size_mb / elapsed:>10.2f} {baseline / elapsed:>7.2f}x")
+
+        print(f"\n{'validator':>22} {'seconds':>10} {'peak MiB':>10}")
+        for validator in (validate.validate_yaml_file, validate.validate_yaml_syntax):
+            elapsed, peak = profiled(validator, file_path)
+            print(f"{validator.__name__:>22} {elapsed:>10.3f} {peak:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
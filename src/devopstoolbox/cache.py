@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+# (size, mtime_ns, sha256 hex digest) of a file, recorded with each cached result.
+FileStamp = tuple[int, int, str]
+
+CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_ENTRIES = 100_000
+# Only refresh an entry's last-used time once per hour so warm runs do not rewrite the cache file.
+LAST_USED_RESOLUTION = 3600
+# Entries not used for this many seconds (e.g. deleted or moved files) are dropped on save.
+STALE_AFTER = 30 * 24 * 3600
+
+
+def get_cache_dir() -> Path:
+    """Return the devopstoolbox cache directory (DEVOPSTOOLBOX_CACHE_DIR, XDG_CACHE_HOME or ~/.cache)."""
+    override = os.environ.get("DEVOPSTOOLBOX_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "devopstoolbox"
+
+
+def file_digest(file_path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_stamp(file_path: Path) -> Optional[FileStamp]:
+    """Return the size, mtime and content digest of a file, or None when it cannot be read."""
+    try:
+        stat = os.stat(file_path)
+        return stat.st_size, stat.st_mtime_ns, file_digest(file_path)
+    except OSError:
+        return None
+
+
+def write_json_atomic(path: Path, data) -> None:
+    """Write JSON to ``path`` through a temporary file so concurrent readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class ValidationCache:
+    """Persistent map of file path -> validation result.
+
+    An entry is a hit when the file's size and mtime are unchanged. When only the mtime changed
+    (e.g. after a fresh checkout) the content hash is compared before the file is re-validated.
+    """
+
+    def __init__(self, path: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries: dict[str, list] = {}
+        self._dirty = False
+
+    @classmethod
+    def open(cls, name: str, max_entries: int = DEFAULT_MAX_ENTRIES) -> "ValidationCache":
+        """Load the cache file ``validate-<name>.json`` from the cache directory."""
+        cache = cls(get_cache_dir() / f"validate-{name}.json", max_entries=max_entries)
+        cache.load()
+        return cache
+
+    def load(self) -> None:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_FORMAT_VERSION:
+            self.entries = data.get("entries", {})
+
+    def get(self, file_path: Path) -> Optional[tuple[bool, str]]:
+        """Return the cached (is_valid, error) for ``file_path`` or None when it must be re-validated."""
+        key = str(file_path)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        size, mtime_ns, digest, is_valid, error, _ = entry
+        if stat.st_size != size:
+            return None
+        if stat.st_mtime_ns != mtime_ns:
+            try:
+                if file_digest(file_path) != digest:
+                    return None
+            except OSError:
+                return None
+            entry[1] = stat.st_mtime_ns
+            self._dirty = True
+        now = time.time()
+        if now - entry[5] > LAST_USED_RESOLUTION:
+            entry[5] = now
+            self._dirty = True
+        return is_valid, error
+
+    def put(self, file_path: Path, is_valid: bool, error: str, stamp: Optional[FileStamp] = None) -> None:
+        """Record the validation result for the content of ``file_path`` described by ``stamp``.
+
+        Pass the ``file_stamp`` taken before validating: if the file is saved again meanwhile, the entry
+        then describes the older content and the next ``get`` misses. Without it the file is stamped now.
+        """
+        if stamp is None:
+            stamp = file_stamp(file_path)
+            if stamp is None:
+                return
+        size, mtime_ns, digest = stamp
+        self.entries[str(file_path)] = [size, mtime_ns, digest, is_valid, error, time.time()]
+        self._dirty = True
+
+    def prune(self) -> None:
+        """Drop stale entries and evict the least recently used ones above ``max_entries``."""
+        cutoff = time.time() - STALE_AFTER
+        for key in [key for key, entry in self.entries.items() if entry[5] < cutoff]:
+            del self.entries[key]
+            self._dirty = True
+        overflow = len(self.entries) - self.max_entries
+        if overflow > 0:
+            for key, _ in sorted(self.entries.items(), key=lambda item: item[1][5])[:overflow]:
+                del self.entries[key]
+            self._dirty = True
+
+    def save(self) -> None:
+        self.prune()
+        if not self._dirty:
+            return
+        try:
+            write_json_atomic(self.path, {"version": CACHE_FORMAT_VERSION, "entries": self.entries})
+        except OSError:
+            return
+        self._dirty = False
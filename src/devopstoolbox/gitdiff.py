@@ -0,0 +1,57 @@
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+
+class GitError(Exception):
+    """Raised when a git command fails (not a repository, unknown ref, git missing)."""
+
+
+def _git(cwd: Path, *args: str, input: Optional[str] = None) -> str:
+    try:
+        result = subprocess.run(["git", *args], cwd=cwd, input=input, capture_output=True, text=True, check=False)
+    except OSError as e:
+        raise GitError(f"Could not run git: {e}") from e
+    if result.returncode != 0:
+        raise GitError(result.stderr.strip() or f"git {' '.join(args)} failed with exit code {result.returncode}")
+    return result.stdout
+
+
+def _split(output: str) -> list[str]:
+    return [name for name in output.split("\0") if name]
+
+
+def repo_root(path: Path) -> Path:
+    """Return the top-level directory of the git repository containing ``path``."""
+    return Path(_git(path, "rev-parse", "--show-toplevel").strip())
+
+
+def changed_files(path: Path, since: Optional[str] = None, staged: bool = False) -> list[Path]:
+    """List existing files changed in the repository containing ``path``, using only local git plumbing.
+
+    With ``staged`` this is the index compared to HEAD (what the next commit will contain). With
+    ``since`` it is the working tree compared to the merge base of ``since`` and HEAD, plus untracked
+    files, so changes that landed on ``since`` after branching are not reported.
+    """
+    root = repo_root(path)
+    if staged:
+        names = _split(_git(root, "diff", "--cached", "--name-only", "-z", "--diff-filter=d"))
+    else:
+        base = _git(root, "merge-base", since, "HEAD").strip()
+        names = _split(_git(root, "diff", "--name-only", "-z", "--diff-filter=d", base, "--"))
+        names += _split(_git(root, "ls-files", "--others", "--exclude-standard", "-z"))
+    return [root / name for name in dict.fromkeys(names) if (root / name).is_file()]
+
+
+def export_staged(paths: list[Path], destination: Path) -> dict[Path, Path]:
+    """Write the staged (index) content of ``paths`` under ``destination`` and return ``{copy: path}``.
+
+    Each copy keeps its path relative to the repository root, so a partially staged file is checked
+    as it will be committed rather than as it is in the working tree.
+    """
+    if not paths:
+        return {}
+    root = repo_root(paths[0].parent)
+    names = [path.relative_to(root).as_posix() for path in paths]
+    _git(root, "checkout-index", f"--prefix={destination}/", "-z", "--stdin", input="\0".join(names))
+    return {destination / name: path for name, path in zip(names, paths)}
@@ -0,0 +1,205 @@
+"""Constant-memory JSON syntax validation.
+
+``validate_json_stream`` walks a text stream with an explicit container stack instead of building the
+document. Containers that fit in the read buffer are skipped at C speed with the stdlib scanner; the
+rest are descended one level at a time. Errors carry the same message, line and column as
+``json.load`` would report for the whole document.
+"""
+
+import json
+import re
+import sys
+from typing import TextIO
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+NUMBER_RE = re.compile(r"(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?")
+LITERALS = {"n": "null", "t": "true", "f": "false", "N": "NaN", "I": "Infinity", "-": "-Infinity"}
+# Longest literal ("-Infinity"); enough lookahead to classify any value start.
+VALUE_LOOKAHEAD = 9
+# Room for the fraction/exponent of a number that may continue in the next chunk ("1e+5").
+NUMBER_LOOKAHEAD = 3
+# Python 3.13 reports trailing commas with a dedicated message.
+TRAILING_COMMA_ERRORS = sys.version_info >= (3, 13)
+
+_scan_once = json.scanner.make_scanner(json.JSONDecoder())
+
+
+class JSONStreamDecodeError(json.JSONDecodeError):
+    """``JSONDecodeError`` raised without holding the document in memory."""
+
+    def __init__(self, msg: str, pos: int, lineno: int, colno: int):
+        ValueError.__init__(self, f"{msg}: line {lineno} column {colno} (char {pos})")
+        self.msg = msg
+        self.doc = None
+        self.pos = pos
+        self.lineno = lineno
+        self.colno = colno
+
+    def __reduce__(self):
+        return self.__class__, (self.msg, self.pos, self.lineno, self.colno)
+
+
+class _Buffer:
+    """Sliding window over a text stream that keeps track of absolute positions and line numbers."""
+
+    def __init__(self, stream: TextIO, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.base = 0
+        self.lines = 0
+        self.last_newline = -1
+        self.fast_path = True
+
+    def fill(self, size: int = 0) -> None:
+        chunk = self.stream.read(max(self.chunk_size, size))
+        if not chunk:
+            self.eof = True
+            return
+        consumed = self.buf[: self.pos]
+        newlines = consumed.count("\n")
+        if newlines:
+            self.lines += newlines
+            self.last_newline = self.base + consumed.rfind("\n")
+        self.base += self.pos
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+
+    def ensure(self, count: int) -> None:
+        while not self.eof and len(self.buf) - self.pos < count:
+            self.fill()
+
+    def char(self) -> str:
+        self.ensure(1)
+        return self.buf[self.pos : self.pos + 1]
+
+    def skip_ws(self) -> None:
+        while True:
+            self.pos = WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or self.eof:
+                return
+            self.fill()
+
+    def error(self, msg: str, pos: int) -> JSONStreamDecodeError:
+        lineno = self.lines + self.buf.count("\n", 0, pos) + 1
+        newline = self.buf.rfind("\n", 0, pos)
+        last_newline = self.base + newline if newline >= 0 else self.last_newline
+        return JSONStreamDecodeError(msg, self.base + pos, lineno, self.base + pos - last_newline)
+
+    def scan_string(self) -> None:
+        while True:
+            try:
+                self.pos = json.decoder.scanstring(self.buf, self.pos + 1, True)[1]
+                return
+            except json.JSONDecodeError as e:
+                truncated = e.msg.startswith("Unterminated string") or e.pos + 6 >= len(self.buf)
+                if self.eof or not truncated:
+                    raise self.error(e.msg, e.pos) from None
+            # Grow geometrically so very long strings are rescanned a logarithmic number of times.
+            self.fill(len(self.buf) - self.pos)
+
+    def scan_key(self) -> None:
+        self.scan_string()
+        self.skip_ws()
+        if self.char() != ":":
+            raise self.error("Expecting ':' delimiter", self.pos)
+        self.pos += 1
+        self.skip_ws()
+
+    def scan_scalar(self) -> None:
+        literal = LITERALS.get(self.buf[self.pos : self.pos + 1])
+        if literal and self.buf.startswith(literal, self.pos):
+            self.pos += len(literal)
+            return
+        match = NUMBER_RE.match(self.buf, self.pos)
+        while match and not self.eof and len(self.buf) - match.end() < NUMBER_LOOKAHEAD:
+            self.fill()
+            match = NUMBER_RE.match(self.buf, self.pos)
+        if match is None:
+            raise self.error("Expecting value", self.pos)
+        self.pos = match.end()
+
+    def skip_container(self) -> bool:
+        """Skip the container at ``pos`` with the C scanner when it is complete within the buffer."""
+        if not self.fast_path:
+            return False
+        try:
+            self.pos = _scan_once(self.buf, self.pos)[1]
+            return True
+        except (ValueError, StopIteration):
+            return False
+        except RecursionError:
+            # Every enclosing level would hit the limit again; stay on the explicit stack.
+            self.fast_path = False
+            return False
+
+
+def validate_json_stream(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """Check that ``stream`` holds exactly one JSON document, raising ``json.JSONDecodeError`` otherwise."""
+    reader = _Buffer(stream, chunk_size)
+    if reader.char() == "\ufeff":
+        raise reader.error("Unexpected UTF-8 BOM (decode using utf-8-sig)", 0)
+    reader.skip_ws()
+    stack = []
+
+    while True:
+        # A value is expected at reader.pos.
+        reader.ensure(VALUE_LOOKAHEAD)
+        start = reader.buf[reader.pos : reader.pos + 1]
+        if start == '"':
+            reader.scan_string()
+        elif start in ("{", "[") and reader.skip_container():
+            pass
+        elif start == "{":
+            reader.pos += 1
+            reader.skip_ws()
+            next_char = reader.char()
+            if next_char == "}":
+                reader.pos += 1
+            elif next_char != '"':
+                raise reader.error("Expecting property name enclosed in double quotes", reader.pos)
+            else:
+                reader.scan_key()
+                stack.append("}")
+                continue
+        elif start == "[":
+            reader.pos += 1
+            reader.skip_ws()
+            if reader.char() == "]":
+                reader.pos += 1
+            else:
+                stack.append("]")
+                continue
+        else:
+            reader.scan_scalar()
+
+        # The value is complete: close finished containers until another value is expected.
+        while True:
+            reader.skip_ws()
+            if not stack:
+                if reader.pos < len(reader.buf):
+                    raise reader.error("Extra data", reader.pos)
+                return
+            next_char = reader.char()
+            if next_char == stack[-1]:
+                reader.pos += 1
+                stack.pop()
+                continue
+            if next_char != ",":
+                raise reader.error("Expecting ',' delimiter", reader.pos)
+            comma = reader.pos
+            reader.pos += 1
+            reader.skip_ws()
+            next_char = reader.char()
+            if TRAILING_COMMA_ERRORS and next_char == stack[-1]:
+                kind = "object" if next_char == "}" else "array"
+                raise reader.error(f"Illegal trailing comma before end of {kind}", comma)
+            if stack[-1] == "}":
+                if next_char != '"':
+                    raise reader.error("Expecting property name enclosed in double quotes", reader.pos)
+                reader.scan_key()
+            break
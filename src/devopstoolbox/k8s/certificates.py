@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 import typer
 from kubernetes.client import CustomObjectsApi
@@ -11,34 +11,57 @@ app = typer.Typer(no_args_is_help=True)
 console = Console()
 
 
+def _list_certificates(custom_api: CustomObjectsApi, namespaces: list[str], all_namespaces: bool, selectors: dict):
+    def fetch_pages(namespace: Optional[str]):
+        if namespace is None:
+            certificates = custom_api.list_cluster_custom_object(group="cert-manager.io", version="v1", plural="certificates", **selectors)
+        else:
+            certificates = custom_api.list_namespaced_custom_object(group="cert-manager.io", version="v1", namespace=namespace, plural="certificates", **selectors)
+        return [certificates.get("items", [])]
+
+    return utils.fan_out_pages(fetch_pages, namespaces, all_namespaces)
+
+
+def _certificate_row(certificate: dict) -> tuple:
+    status = certificate.get("status", {})
+    renewal_time = status.get("renewalTime", "-")
+    conditions = status.get("conditions", [{}])
+    condition_type = conditions[0].get("type", "-") if conditions else "-"
+    return certificate["metadata"].get("namespace") or "-", certificate["metadata"]["name"], renewal_time, condition_type
+
+
+def _certificates_table(scope: str, contexts: list[str]) -> Table:
+    table = utils.cluster_table(f"List Certificates in {scope}", contexts)
+    table.add_column("Namespace", style="cyan", justify="center")
+    table.add_column("Name", style="cyan", justify="center")
+    table.add_column("Renewal Time", style="green", justify="center")
+    table.add_column("Status", style="green", justify="center")
+    return table
+
+
 @app.command()
-def list(namespace: Annotated[str, typer.Option("--namespace", "-n")] = None, all_namespaces: Annotated[bool, typer.Option("--all-namespaces", "-A")] = False):
+def list(
+    namespace: utils.NamespaceOption = None,
+    all_namespaces: Annotated[bool, typer.Option("--all-namespaces", "-A")] = False,
+    label_selector: utils.LabelSelectorOption = None,
+    field_selector: utils.FieldSelectorOption = None,
+    context: utils.ContextOption = None,
+    all_contexts: utils.AllContextsOption = False,
+    cluster_timeout: utils.ClusterTimeoutOption = utils.DEFAULT_CLUSTER_TIMEOUT,
+):
     """List cert-manager certificates with renewal time and status."""
-    utils.load_kube_config()
-    namespace = namespace or utils.get_current_namespace()
-    scope = "all namespaces" if all_namespaces else f"namespace {namespace}"
+    contexts = utils.resolve_contexts(context, all_contexts)
+    scope = utils.describe_scope(namespace, all_namespaces, contexts)
     console.print(f"[bold blue]Listing certificates resources in {scope}...[/bold blue]")
 
-    custom_api = CustomObjectsApi()
+    selectors = utils.selector_kwargs(label_selector, field_selector)
+
+    def fetch_cluster(api_client, cluster):
+        pages = _list_certificates(CustomObjectsApi(api_client), utils.resolve_namespaces(namespace, cluster), all_namespaces, selectors)
+        return ([_certificate_row(certificate) for certificate in page] for page in pages)
+
     try:
-        if all_namespaces:
-            certificates = custom_api.list_cluster_custom_object(group="cert-manager.io", version="v1", plural="certificates")
-        else:
-            certificates = custom_api.list_namespaced_custom_object(group="cert-manager.io", version="v1", namespace=namespace, plural="certificates")
-
-        table = Table(title=f"List Certificates in {scope}")
-        table.add_column("Namespace", style="cyan", justify="center")
-        table.add_column("Name", style="cyan", justify="center")
-        table.add_column("Renewal Time", style="green", justify="center")
-        table.add_column("Status", style="green", justify="center")
-
-        for certificate in certificates.get("items", []):
-            status = certificate.get("status", {})
-            renewal_time = status.get("renewalTime", "-")
-            conditions = status.get("conditions", [{}])
-            condition_type = conditions[0].get("type", "-") if conditions else "-"
-            table.add_row(namespace, certificate["metadata"]["name"], renewal_time, condition_type)
-        console.print(table)
+        utils.print_table_pages(console, _certificates_table(scope, contexts), utils.query_clusters(console, contexts, fetch_cluster, cluster_timeout))
     except Exception as e:
         print("Error accessing Cert API. Ensure Certificate Server is installed.")
         print(f"Details: {e}")
@@ -46,34 +69,28 @@ def list(namespace: Annotated[str, typer.Option("--namespace", "-n")] = None, al
 
 
 @app.command()
-def not_ready(namespace: Annotated[str, typer.Option("--namespace", "-n")] = None, all_namespaces: Annotated[bool, typer.Option("--all-namespaces", "-A")] = False):
+def not_ready(
+    namespace: utils.NamespaceOption = None,
+    all_namespaces: Annotated[bool, typer.Option("--all-namespaces", "-A")] = False,
+    label_selector: utils.LabelSelectorOption = None,
+    field_selector: utils.FieldSelectorOption = None,
+    context: utils.ContextOption = None,
+    all_contexts: utils.AllContextsOption = False,
+    cluster_timeout: utils.ClusterTimeoutOption = utils.DEFAULT_CLUSTER_TIMEOUT,
+):
     """List certificates that are not in Ready state."""
-    utils.load_kube_config()
-    namespace = namespace or utils.get_current_namespace()
-    scope = "all namespaces" if all_namespaces else f"namespace {namespace}"
+    contexts = utils.resolve_contexts(context, all_contexts)
+    scope = utils.describe_scope(namespace, all_namespaces, contexts)
     console.print(f"[bold blue]Listing certificates resources in {scope}...[/bold blue]")
 
-    custom_api = CustomObjectsApi()
+    selectors = utils.selector_kwargs(label_selector, field_selector)
+
+    def fetch_cluster(api_client, cluster):
+        pages = _list_certificates(CustomObjectsApi(api_client), utils.resolve_namespaces(namespace, cluster), all_namespaces, selectors)
+        return ([row for row in map(_certificate_row, page) if row[3] != "Ready"] for page in pages)
+
     try:
-        if all_namespaces:
-            certificates = custom_api.list_cluster_custom_object(group="cert-manager.io", version="v1", plural="certificates")
-        else:
-            certificates = custom_api.list_namespaced_custom_object(group="cert-manager.io", version="v1", namespace=namespace, plural="certificates")
-
-        table = Table(title=f"List Certificates in {scope}")
-        table.add_column("Namespace", style="cyan", justify="center")
-        table.add_column("Name", style="cyan", justify="center")
-        table.add_column("Renewal Time", style="green", justify="center")
-        table.add_column("Status", style="green", justify="center")
-
-        for certificate in certificates.get("items", []):
-            status = certificate.get("status", {})
-            renewal_time = status.get("renewalTime", "-")
-            conditions = status.get("conditions", [{}])
-            condition_type = conditions[0].get("type", "-") if conditions else "-"
-            if condition_type != "Ready":
-                table.add_row(namespace, certificate["metadata"]["name"], renewal_time, condition_type)
-        console.print(table)
+        utils.print_table_pages(console, _certificates_table(scope, contexts), utils.query_clusters(console, contexts, fetch_cluster, cluster_timeout))
     except Exception as e:
         print("Error accessing Cert API. Ensure Certificate Server is installed.")
         print(f"Details: {e}")
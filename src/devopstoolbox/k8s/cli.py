@@ -0,0 +1,40 @@
+from typing import Annotated
+
+import typer
+from rich.console import Console
+
+from devopstoolbox.k8s import kubeconfig, utils
+from devopstoolbox.lazy import LazyGroup
+
+
+class K8sGroup(LazyGroup):
+    lazy_subcommands = {
+        "pods": ("devopstoolbox.k8s.pods:app", "Manager Pods"),
+        "services": ("devopstoolbox.k8s.services:app", "Manager Services"),
+        "certificates": ("devopstoolbox.k8s.certificates:app", "Manager Certificates"),
+    }
+
+
+app = typer.Typer(cls=K8sGroup, no_args_is_help=True)
+
+
+@app.callback()
+def k8s_options(
+    ctx: typer.Context,
+    pool_size: Annotated[int, typer.Option("--pool-size", min=1, help="Connections kept open per apiserver.")] = utils.DEFAULT_CONNECTION_POOL_MAXSIZE,
+    request_timeout: Annotated[float, typer.Option("--request-timeout", min=0, help="Seconds before an apiserver request gives up (0 waits forever).")] = 0,
+    timings: Annotated[bool, typer.Option("--timings", help="Print the latency of every apiserver request to stderr when the command ends.")] = False,
+    kubeconfig_cache: Annotated[
+        bool,
+        typer.Option(
+            "--kubeconfig-cache/--no-kubeconfig-cache",
+            envvar="DEVOPSTOOLBOX_KUBECONFIG_CACHE",
+            help="Keep a pre-parsed copy of the kubeconfig on disk, reused until a kubeconfig file changes.",
+        ),
+    ] = False,
+):
+    """Kubernetes utilities"""
+    kubeconfig.configure_kube_config(kubeconfig_cache)
+    utils.configure_api_clients(pool_size, request_timeout, timings)
+    if timings:
+        ctx.call_on_close(lambda: utils.print_request_timings(Console(stderr=True)))
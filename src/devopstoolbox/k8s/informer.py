@@ -0,0 +1,219 @@
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Hashable
+from typing import Optional
+
+from devopstoolbox.k8s import utils
+from devopstoolbox.k8s.listcache import ResourceVersionGone, compact, item_key, list_items, watch_changes
+
+# Seconds the apiserver keeps a watch open before it is renewed from the last resourceVersion.
+WATCH_TIMEOUT_SECONDS = 300
+# Seconds between full relists that correct any drift between the store and the apiserver.
+DEFAULT_RESYNC_PERIOD = 30 * 60
+# First and longest pause between reconnection attempts after a failed list or watch.
+INITIAL_BACKOFF = 1
+MAX_BACKOFF = 30
+
+
+class Store:
+    """Thread-safe map of object UID -> object, indexed by namespace and by label.
+
+    Lookups by UID, namespace or ``key=value`` label cost one dict access plus the size of the result.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._objects: dict[str, dict] = {}
+        self._by_namespace: dict[str, set[str]] = defaultdict(set)
+        self._by_label: dict[tuple[str, str], set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def _index(self, key: str, obj: dict) -> None:
+        metadata = obj.get("metadata") or {}
+        self._by_namespace[metadata.get("namespace") or ""].add(key)
+        for label in (metadata.get("labels") or {}).items():
+            self._by_label[label].add(key)
+
+    def _unindex(self, key: str, obj: dict) -> None:
+        metadata = obj.get("metadata") or {}
+        self._discard(self._by_namespace, metadata.get("namespace") or "", key)
+        for label in (metadata.get("labels") or {}).items():
+            self._discard(self._by_label, label, key)
+
+    @staticmethod
+    def _discard(index: dict, value: Hashable, key: str) -> None:
+        keys = index.get(value)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[value]
+
+    def upsert(self, obj: dict) -> None:
+        key = item_key(obj)
+        obj = compact(obj)
+        with self._lock:
+            previous = self._objects.get(key)
+            if previous is not None:
+                self._unindex(key, previous)
+            self._objects[key] = obj
+            self._index(key, obj)
+
+    def delete(self, obj: dict) -> None:
+        key = item_key(obj)
+        with self._lock:
+            previous = self._objects.pop(key, None)
+            if previous is not None:
+                self._unindex(key, previous)
+
+    def replace(self, objects: list[dict]) -> None:
+        """Swap the whole content for a fresh list."""
+        with self._lock:
+            self._objects.clear()
+            self._by_namespace.clear()
+            self._by_label.clear()
+            for obj in objects:
+                self.upsert(obj)
+
+    def apply(self, event_type: str, obj: dict) -> None:
+        """Apply an ADDED, MODIFIED or DELETED watch event."""
+        if event_type in ("ADDED", "MODIFIED"):
+            self.upsert(obj)
+        elif event_type == "DELETED":
+            self.delete(obj)
+
+    def get(self, uid: str) -> Optional[dict]:
+        return self._objects.get(uid)
+
+    def list(self, namespace: Optional[str] = None, labels: Optional[dict] = None) -> list[dict]:
+        """Return the objects in ``namespace`` (all when None) that carry every ``labels`` pair."""
+        with self._lock:
+            candidates = [] if namespace is None else [self._by_namespace.get(namespace, set())]
+            candidates += [self._by_label.get(label, set()) for label in (labels or {}).items()]
+            if not candidates:
+                return [*self._objects.values()]
+            keys = set.intersection(*sorted(candidates, key=len))
+            return [self._objects[key] for key in keys]
+
+
+class Informer(threading.Thread):
+    """Keep a ``Store`` in sync with one list call: list once, then apply watch events.
+
+    ``list_func(*args)`` is a raw Kubernetes list function such as ``CoreV1Api.list_namespaced_pod``.
+    The watch is renewed from the last resourceVersion whenever the apiserver closes it, everything is
+    listed again after a 410 Gone and every ``resync_period`` seconds, and failed requests are retried
+    with exponential backoff. Listeners (``on_change`` and those added later) are called from the
+    informer's thread after every update.
+    """
+
+    def __init__(
+        self,
+        list_func: Callable,
+        *args,
+        selectors: Optional[dict] = None,
+        page_size: int = utils.DEFAULT_PAGE_SIZE,
+        resync_period: float = DEFAULT_RESYNC_PERIOD,
+        on_change: Optional[Callable[[], None]] = None,
+    ):
+        super().__init__(daemon=True)
+        self.list_func = list_func
+        self.args = args
+        self.selectors = selectors or {}
+        self.page_size = page_size
+        self.resync_period = resync_period
+        self.listeners: list[Callable[[], None]] = [on_change] if on_change else []
+        self.store = Store()
+        self.error: Optional[Exception] = None
+        self.synced = threading.Event()
+        self.stopped = threading.Event()
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Block until the first list is in the store."""
+        return self.synced.wait(timeout)
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        self.listeners.append(listener)
+
+    def _notify(self) -> None:
+        for listener in self.listeners:
+            listener()
+
+    def run(self) -> None:
+        resource_version = None
+        listed_at = 0.0
+        backoff = INITIAL_BACKOFF
+        while not self.stopped.is_set():
+            try:
+                if resource_version is None or time.monotonic() - listed_at >= self.resync_period:
+                    resource_version = self.relist()
+                    listed_at = time.monotonic()
+                timeout_seconds = max(1, int(min(WATCH_TIMEOUT_SECONDS, self.resync_period - (time.monotonic() - listed_at))))
+                changes = watch_changes(self.list_func, *self.args, resource_version=resource_version, timeout_seconds=timeout_seconds, **self.selectors)
+                if self.error is not None:
+                    # The watch is back: stop reporting the failure before the next event, which may be minutes away.
+                    self.error = None
+                    self._notify()
+                for event_type, obj in changes:
+                    if self.stopped.is_set():
+                        return
+                    if event_type != "BOOKMARK":
+                        self.store.apply(event_type, obj)
+                        self._notify()
+                    resource_version = (obj.get("metadata") or {}).get("resourceVersion") or resource_version
+                backoff = INITIAL_BACKOFF
+            except ResourceVersionGone:
+                resource_version = None
+            except Exception as e:
+                self.error = e
+                self._notify()
+                self.stopped.wait(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF)
+
+    def relist(self) -> Optional[str]:
+        objects = []
+        resource_version = None
+        for page, page_version in list_items(self.list_func, *self.args, page_size=self.page_size, **self.selectors):
+            objects.extend(page)
+            resource_version = page_version or resource_version
+        self.store.replace(objects)
+        self.error = None
+        self.synced.set()
+        self._notify()
+        return resource_version
+
+
+class SharedInformers:
+    """Started informers keyed by what they list, so callers asking for the same objects share one watch."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._informers: dict[Hashable, Informer] = {}
+
+    def get(self, key: Hashable, list_func: Callable, *args, on_change: Optional[Callable[[], None]] = None, **kwargs) -> Informer:
+        """Return the running informer for ``key``, starting ``Informer(list_func, *args, **kwargs)`` on first use.
+
+        ``on_change`` is added as a listener either way.
+        """
+        with self._lock:
+            informer = self._informers.get(key)
+            if informer is None:
+                informer = self._informers[key] = Informer(list_func, *args, on_change=on_change, **kwargs)
+                informer.start()
+            elif on_change is not None:
+                informer.add_listener(on_change)
+            return informer
+
+    def stop_all(self) -> None:
+        with self._lock:
+            for informer in self._informers.values():
+                informer.stop()
+            self._informers.clear()
+
+
+# Process-wide informers, shared by every command that watches the same objects.
+shared_informers = SharedInformers()
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Optional
+
+from kubernetes.client import Configuration
+from kubernetes.config.kube_config import ENV_KUBECONFIG_PATH_SEPARATOR, ConfigException, ConfigNode, KubeConfigLoader, KubeConfigMerger
+
+from devopstoolbox.cache import get_cache_dir, write_json_atomic
+
+KUBECONFIG_CACHE_FORMAT_VERSION = 1
+# Entries of a kubeconfig that are merged by name across files; every other key comes from the first file.
+MERGED_SECTIONS = ("clusters", "contexts", "users")
+
+# Whether load() keeps a pre-parsed copy on disk; see configure_kube_config.
+_kube_config_settings = {"disk_cache": False}
+_kube_config: Optional["KubeConfig"] = None
+_kube_config_lock = threading.Lock()
+
+
+class KubeConfig:
+    """The merged kubeconfig of ``$KUBECONFIG`` (or ``~/.kube/config``), with contexts indexed by name.
+
+    ``merged`` is the ``ConfigNode`` built by the Kubernetes client's ``KubeConfigMerger``: every cluster,
+    context and user remembers the file it came from, so relative certificate paths keep resolving
+    against that file's directory.
+    """
+
+    def __init__(self, merged: ConfigNode, persister: Optional[Callable[[], None]] = None):
+        self.merged = merged
+        self.persister = persister
+        self._contexts = {entry.value["name"]: entry.value for entry in merged.value["contexts"]}
+        self._clusters = {entry.value["name"]: entry.value for entry in merged.value["clusters"]}
+
+    def contexts(self) -> list[dict]:
+        return [*self._contexts.values()]
+
+    def context(self, name: Optional[str] = None) -> dict:
+        """Return the context called ``name``, or the current context when None."""
+        name = name or self.merged.value.get("current-context")
+        try:
+            return self._contexts[name]
+        except KeyError:
+            raise ConfigException(f"Context {name!r} not found in kubeconfig") from None
+
+    def cluster(self, name: str) -> dict:
+        """Return the cluster called ``name``."""
+        try:
+            return self._clusters[name]
+        except KeyError:
+            raise ConfigException(f"Cluster {name!r} not found in kubeconfig") from None
+
+    def load_and_set(self, configuration: Configuration, context: Optional[str] = None) -> None:
+        """Fill ``configuration`` with the cluster and credentials of ``context`` (the current one when None)."""
+        loader = KubeConfigLoader(config_dict=self.merged, active_context=context, config_base_path=None, config_persister=self.persister)
+        loader.load_and_set(configuration)
+
+
+def configure_kube_config(disk_cache: bool = False) -> None:
+    """Keep a pre-parsed copy of the kubeconfig in the devopstoolbox cache directory.
+
+    Later processes then read it instead of parsing YAML, for as long as no kubeconfig file changes.
+    """
+    _kube_config_settings.update(disk_cache=disk_cache)
+
+
+def reset_kube_config() -> None:
+    """Forget the parsed kubeconfig, so the next load() reads the files again."""
+    global _kube_config
+    with _kube_config_lock:
+        _kube_config = None
+
+
+def config_paths() -> list[str]:
+    """Return the existing kubeconfig files, in the order they are merged."""
+    paths = [os.path.expanduser(path) for path in os.environ.get("KUBECONFIG", "~/.kube/config").split(ENV_KUBECONFIG_PATH_SEPARATOR) if path]
+    return [path for path in paths if os.path.exists(path)]
+
+
+def load() -> KubeConfig:
+    """Return the kubeconfig, parsing it on first use only. Raises ``ConfigException`` when there is none."""
+    global _kube_config
+    with _kube_config_lock:
+        if _kube_config is None:
+            _kube_config = _read(config_paths())
+        return _kube_config
+
+
+def _file_stamps(paths: list[str]) -> list[list]:
+    stamps = []
+    for path in paths:
+        stat = os.stat(path)
+        stamps.append([path, stat.st_mtime_ns, stat.st_size])
+    return stamps
+
+
+def _cache_path(paths: list[str]) -> Path:
+    return get_cache_dir() / "kubeconfig" / f"{hashlib.sha256(json.dumps(paths).encode()).hexdigest()}.json"
+
+
+def _read(paths: list[str]) -> KubeConfig:
+    if not paths:
+        raise ConfigException("Invalid kube-config file. No configuration found.")
+    if not _kube_config_settings["disk_cache"]:
+        merger = KubeConfigMerger(ENV_KUBECONFIG_PATH_SEPARATOR.join(paths))
+        return KubeConfig(merger.config, merger.save_changes)
+
+    cache_path = _cache_path(paths)
+    stamps = _file_stamps(paths)
+    cached = _load_cached(cache_path, stamps)
+    if cached is not None:
+        return cached
+    merger = KubeConfigMerger(ENV_KUBECONFIG_PATH_SEPARATOR.join(paths))
+    _save_cached(cache_path, stamps, merger.config)
+    return KubeConfig(merger.config, merger.save_changes)
+
+
+def _load_cached(cache_path: Path, stamps: list[list]) -> Optional[KubeConfig]:
+    """Rebuild the merged ``ConfigNode`` from a cache entry, when every file still has the recorded mtime and size."""
+    try:
+        with open(cache_path) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("version") != KUBECONFIG_CACHE_FORMAT_VERSION or entry.get("files") != stamps:
+        return None
+    merged = entry["config"]
+    for section in MERGED_SECTIONS:
+        merged[section] = [ConfigNode(f"{path}/{item}", item, path) for path, item in entry[section]]
+    # Credentials refreshed by auth plugins are not written back to the kubeconfig files from here.
+    return KubeConfig(ConfigNode(entry["path"], merged, entry["path"]))
+
+
+def _save_cached(cache_path: Path, stamps: list[list], merged: ConfigNode) -> None:
+    """Store the merged kubeconfig as JSON, next to the file of origin of every cluster, context and user.
+
+    The entry holds credentials, so it keeps the owner-only permissions of the temporary file it is written through.
+    """
+    entry = {
+        "version": KUBECONFIG_CACHE_FORMAT_VERSION,
+        "files": stamps,
+        "path": merged.path,
+        "config": {key: value for key, value in merged.value.items() if key not in MERGED_SECTIONS},
+    }
+    for section in MERGED_SECTIONS:
+        entry[section] = [[node.path, node.value] for node in merged.value[section]]
+    try:
+        write_json_atomic(cache_path, entry)
+    except (OSError, TypeError, ValueError):
+        return
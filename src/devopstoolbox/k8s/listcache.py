@@ -0,0 +1,225 @@
+import hashlib
+import json
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+from kubernetes.client.exceptions import ApiException
+from rich.console import Console
+
+from devopstoolbox.cache import get_cache_dir, write_json_atomic
+from devopstoolbox.k8s import utils
+
+LIST_CACHE_FORMAT_VERSION = 1
+# Seconds a cached list is served as-is before it is revalidated against the apiserver.
+DEFAULT_CACHE_TTL = 5.0
+# The apiserver closes the revalidation watch after this many seconds, once it has sent every change since the cached resourceVersion.
+REVALIDATE_WATCH_SECONDS = 1
+# A revalidation watch whose last event arrived this close to its end may have been cut off before sending every change.
+REVALIDATE_QUIET_SECONDS = 0.2
+# Stale lists of at most this many items are listed again: one page costs less than waiting for the watch to end.
+RELIST_MAX_ITEMS = utils.DEFAULT_PAGE_SIZE
+# Seconds a watch may stay silent beyond its timeoutSeconds before the client gives up on the connection.
+WATCH_READ_GRACE_SECONDS = 10
+
+CacheOption = Annotated[bool, typer.Option("--cache/--no-cache", help="Keep the list on disk and refresh it with only the changes since the last run.")]
+CacheTtlOption = Annotated[float, typer.Option("--cache-ttl", min=0, help="Seconds a cached list is shown without asking the apiserver for changes.")]
+
+
+class ResourceVersionGone(Exception):
+    """The cached resourceVersion is older than the apiserver's watch history (HTTP 410 Gone)."""
+
+
+def item_key(item: dict) -> str:
+    metadata = item.get("metadata") or {}
+    return metadata.get("uid") or f"{metadata.get('namespace', '')}/{metadata.get('name', '')}"
+
+
+def compact(item: dict) -> dict:
+    """Drop managedFields, which are never displayed and often make up most of an object's size."""
+    metadata = item.get("metadata")
+    if metadata and "managedFields" in metadata:
+        item = {**item, "metadata": {key: value for key, value in metadata.items() if key != "managedFields"}}
+    return item
+
+
+def _sorted_items(items: dict) -> list:
+    # Same order as a list call: by namespace, then name.
+    return sorted(items.values(), key=lambda item: ((item.get("metadata") or {}).get("namespace") or "", (item.get("metadata") or {}).get("name") or ""))
+
+
+def watch_events(response) -> Iterator[dict]:
+    """Decode the newline-delimited JSON events of a watch requested with ``_preload_content=False``."""
+    buffer = b""
+    try:
+        for chunk in response.stream(amt=None, decode_content=False):
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+        if buffer.strip():
+            yield json.loads(buffer)
+    finally:
+        response.release_conn()
+
+
+def list_items(list_func: Callable, *args, page_size: int = utils.DEFAULT_PAGE_SIZE, **selectors) -> Iterator[tuple[list, Optional[str]]]:
+    """Yield each page of a raw, paginated list call with the list's resourceVersion."""
+    kwargs = {**selectors, "_preload_content": False}
+    if page_size:
+        kwargs["limit"] = page_size
+    while True:
+        response = utils.read_json(list_func(*args, **kwargs))
+        metadata = response.get("metadata") or {}
+        yield response.get("items", []), metadata.get("resourceVersion")
+        if not metadata.get("continue"):
+            return
+        kwargs["_continue"] = metadata["continue"]
+
+
+def watch_changes(list_func: Callable, *args, resource_version: str, timeout_seconds: int, **selectors) -> Iterator[tuple[str, dict]]:
+    """Start a watch and return an iterator of ``(event type, object)`` for every change since ``resource_version``.
+
+    The request is made before this returns, so a connection that cannot be established fails here rather
+    than on the first event. Bookmarks are yielded too, so callers can keep the latest resourceVersion.
+    Raises ``ResourceVersionGone`` when the version is too old to watch from. The client's request timeout
+    is raised to outlast the watch, which may legitimately stay silent for ``timeout_seconds``.
+    """
+    try:
+        response = list_func(
+            *args,
+            watch=True,
+            resource_version=resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=timeout_seconds,
+            _preload_content=False,
+            _request_timeout=timeout_seconds + WATCH_READ_GRACE_SECONDS,
+            **selectors,
+        )
+    except ApiException as e:
+        if e.status == 410:
+            raise ResourceVersionGone() from e
+        raise
+    return _changes(response)
+
+
+def _changes(response) -> Iterator[tuple[str, dict]]:
+    for event in watch_events(response):
+        event_type = event.get("type")
+        obj = event.get("object") or {}
+        if event_type == "ERROR":
+            if obj.get("code") == 410:
+                raise ResourceVersionGone()
+            raise ApiException(status=obj.get("code"), reason=obj.get("message"))
+        yield event_type, obj
+
+
+def apply_change(items: dict, event_type: str, obj: dict) -> None:
+    """Apply one watch event to ``items``, a map of object UID to object."""
+    if event_type in ("ADDED", "MODIFIED"):
+        items[item_key(obj)] = compact(obj)
+    elif event_type == "DELETED":
+        items.pop(item_key(obj), None)
+
+
+class ListCache:
+    """On-disk copies of list results, keyed by cluster, user, resource, namespace and selectors.
+
+    A copy younger than ``ttl`` seconds is served without contacting the apiserver. An older one of
+    more than ``relist_max_items`` items is revalidated by watching from its ``resourceVersion``, so only
+    the objects that changed since are transferred; smaller ones, and those whose version the apiserver
+    no longer has (410 Gone), are listed again. Lists whose watch ended while changes were still
+    arriving are recorded in ``stale``.
+    """
+
+    def __init__(self, directory: Path, ttl: float = DEFAULT_CACHE_TTL, relist_max_items: int = RELIST_MAX_ITEMS):
+        self.directory = directory
+        self.ttl = ttl
+        self.relist_max_items = relist_max_items
+        self.stale: list[str] = []
+
+    @classmethod
+    def open(cls, ttl: float = DEFAULT_CACHE_TTL) -> "ListCache":
+        """Use the ``k8s-lists`` directory of the devopstoolbox cache directory."""
+        return cls(get_cache_dir() / "k8s-lists", ttl=ttl)
+
+    def path(self, context: Optional[str], resource: str, namespace: Optional[str], selectors: dict) -> Path:
+        # Keyed by apiserver and user too: a context name alone may stand for another cluster in another kubeconfig.
+        key = json.dumps([*utils.cluster_identity(context), resource, namespace or "*", selectors], sort_keys=True)
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def load(self, path: Path) -> Optional[dict]:
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != LIST_CACHE_FORMAT_VERSION:
+            return None
+        return entry
+
+    def save(self, path: Path, resource_version: str, items: dict, complete: bool = True) -> None:
+        """Store ``items`` at ``resource_version``; an incomplete copy is revalidated on its next use, whatever the TTL."""
+        fetched_at = time.time() if complete else 0.0
+        try:
+            write_json_atomic(path, {"version": LIST_CACHE_FORMAT_VERSION, "resourceVersion": resource_version, "fetchedAt": fetched_at, "items": items})
+        except OSError:
+            return
+
+    def pages(
+        self, context: Optional[str], resource: str, namespace: Optional[str], list_func: Callable, *args, page_size: int = utils.DEFAULT_PAGE_SIZE, **selectors
+    ) -> Iterator[list]:
+        """Yield pages of raw items like ``utils.paginate(list_func, *args, raw=True, **selectors)``, through the cache.
+
+        ``context`` is None for the current context. Cached and revalidated lists are yielded as one page.
+        """
+        path = self.path(context, resource, namespace, selectors)
+        entry = self.load(path)
+        if entry is not None:
+            items = entry["items"]
+            if time.time() - entry["fetchedAt"] < self.ttl:
+                yield _sorted_items(items)
+                return
+            if len(items) > self.relist_max_items:
+                try:
+                    resource_version, complete = self.revalidate(list_func, args, selectors, entry["resourceVersion"], items)
+                except ResourceVersionGone:
+                    pass
+                else:
+                    self.save(path, resource_version, items, complete)
+                    if not complete:
+                        self.stale.append(f"{resource} in {f'namespace {namespace}' if namespace else 'all namespaces'}" + (f" of context {context}" if context else ""))
+                    yield _sorted_items(items)
+                    return
+
+        items = {}
+        resource_version = None
+        for page, page_version in list_items(list_func, *args, page_size=page_size, **selectors):
+            for item in page:
+                items[item_key(item)] = compact(item)
+            resource_version = page_version or resource_version
+            yield page
+        if resource_version:
+            self.save(path, resource_version, items)
+
+    def revalidate(self, list_func: Callable, args: tuple, selectors: dict, resource_version: str, items: dict) -> tuple[str, bool]:
+        """Apply the changes since ``resource_version`` to ``items`` in place.
+
+        Return the new resourceVersion, and whether the watch had gone quiet before the apiserver closed
+        it; when it had not, more changes may have been pending.
+        """
+        last_event = None
+        for event_type, obj in watch_changes(list_func, *args, resource_version=resource_version, timeout_seconds=REVALIDATE_WATCH_SECONDS, **selectors):
+            apply_change(items, event_type, obj)
+            resource_version = (obj.get("metadata") or {}).get("resourceVersion") or resource_version
+            if event_type != "BOOKMARK":
+                last_event = time.monotonic()
+        return resource_version, last_event is None or time.monotonic() - last_event >= REVALIDATE_QUIET_SECONDS
+
+    def warn_stale(self, console: Console) -> None:
+        """Print a warning for every list whose revalidation may have missed changes."""
+        for description in self.stale:
+            console.print(f"[yellow]Warning: cached {description} may be missing recent changes; run again or use --no-cache.[/yellow]")
@@ -1,147 +1,456 @@
-from typing import Annotated
+import math
+import threading
+from array import array
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Optional
 
 import typer
 from kubernetes import client
 from kubernetes.client import CustomObjectsApi
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 
-from devopstoolbox.k8s import utils
+from devopstoolbox.k8s import quantity, utils
+from devopstoolbox.k8s.informer import Informer, shared_informers
+from devopstoolbox.k8s.listcache import DEFAULT_CACHE_TTL, CacheOption, CacheTtlOption, ListCache
+from devopstoolbox.k8s.quantity import Quantity
 
 app = typer.Typer(no_args_is_help=True)
 console = Console()
 
+PageSizeOption = Annotated[int, typer.Option("--page-size", min=0, help="Pods fetched per API request; rows print as each page arrives (0 fetches all at once).")]
+WatchOption = Annotated[bool, typer.Option("--watch", "-w", help="Keep the table open and update it from the watch API until interrupted.")]
+GroupByOption = Annotated[Optional[str], typer.Option("--group-by", help="Aggregate containers per namespace, node, owner or label=<key> instead of listing them.")]
+TopOption = Annotated[int, typer.Option("--top", min=0, help="With --group-by, only show the N groups using the most CPU (0 shows all).")]
+
+
+# Pods that are neither running nor completed, filtered by the apiserver.
+UNHEALTHY_FIELD_SELECTOR = "status.phase!=Running,status.phase!=Succeeded"
+
+# Redraws per second at most while --watch applies changes.
+WATCH_MAX_FPS = 4
+
+# Resources summed by --group-by, in table order.
+RESOURCES = ("cpu", "memory")
+
+
+def _list_pods(
+    v1: client.CoreV1Api,
+    namespaces: list[str],
+    all_namespaces: bool,
+    page_size: int,
+    selectors: dict,
+    cache: Optional[ListCache] = None,
+    cluster: Optional[str] = None,
+):
+    # Raw JSON pages: building V1Pod models costs far more than the few fields we read.
+    def fetch_pages(namespace: Optional[str]):
+        if cache is not None:
+            if namespace is None:
+                return cache.pages(cluster, "pods", None, v1.list_pod_for_all_namespaces, page_size=page_size, **selectors)
+            return cache.pages(cluster, "pods", namespace, v1.list_namespaced_pod, namespace, page_size=page_size, **selectors)
+        if namespace is None:
+            return utils.paginate(v1.list_pod_for_all_namespaces, watch=False, page_size=page_size, raw=True, **selectors)
+        return utils.paginate(v1.list_namespaced_pod, namespace, watch=False, page_size=page_size, raw=True, **selectors)
+
+    return utils.fan_out_pages(fetch_pages, namespaces, all_namespaces)
+
+
+def _pod_row(pod: dict) -> tuple:
+    metadata = pod.get("metadata") or {}
+    status = pod.get("status") or {}
+    restart_count = sum((container_status.get("restartCount") or 0) for container_status in status.get("containerStatuses") or [])
+    return metadata.get("namespace") or "-", metadata.get("name"), status.get("phase"), str(restart_count)
+
+
+def _pods_table(title: str, contexts: list[str]) -> Table:
+    table = utils.cluster_table(title, contexts)
+    table.add_column("Namespace", style="cyan", justify="center")
+    table.add_column("Pod Name", style="green", justify="center")
+    table.add_column("Status", style="green", justify="center")
+    table.add_column("Restart Count", justify="center")
+    return table
+
+
+def _start_pod_informers(contexts: list[str], namespace: Optional[list[str]], all_namespaces: bool, page_size: int, selectors: dict, changed: threading.Event):
+    """Return ``(cluster, informer)`` for every cluster and namespace to watch; cluster is None for the current context."""
+    informers = []
+    for cluster in contexts or [None]:
+        v1 = client.CoreV1Api(utils.get_api_client(cluster))
+        for target in [None] if all_namespaces else utils.resolve_namespaces(namespace, cluster):
+            list_func, args = (v1.list_pod_for_all_namespaces, ()) if target is None else (v1.list_namespaced_pod, (target,))
+            key = (cluster, "pods", target, tuple(sorted(selectors.items())))
+            informer = shared_informers.get(key, list_func, *args, selectors=selectors, page_size=page_size, on_change=changed.set)
+            informers.append((cluster, informer))
+    return informers
+
+
+def _render_watch(title: str, contexts: list[str], informers: list[tuple[Optional[str], Informer]]) -> Table:
+    table = _pods_table(title, contexts)
+    rows = [(cluster, *_pod_row(pod)) if cluster else _pod_row(pod) for cluster, informer in informers for pod in informer.store.list()]
+    for row in sorted(rows, key=lambda row: tuple(str(cell) for cell in row)):
+        table.add_row(*row)
+    errors = [f"{cluster or 'current context'}: {informer.error}" for cluster, informer in informers if informer.error is not None]
+    table.caption = "Reconnecting - " + "; ".join(errors) if errors else None
+    return table
+
+
+def _watch_pods(title: str, contexts: list[str], namespace: Optional[list[str]], all_namespaces: bool, page_size: int, selectors: dict, stop: Optional[threading.Event] = None):
+    """Show pods in a live table that is redrawn at most ``WATCH_MAX_FPS`` times per second, until interrupted or ``stop`` is set."""
+    stop = stop or threading.Event()
+    changed = threading.Event()
+    informers = _start_pod_informers(contexts, namespace, all_namespaces, page_size, selectors, changed)
+    try:
+        with Live(_pods_table(title, contexts), console=console, auto_refresh=False) as live:
+            while not stop.is_set():
+                if not changed.wait(0.5):
+                    continue
+                changed.clear()
+                live.update(_render_watch(title, contexts, informers), refresh=True)
+                stop.wait(1 / WATCH_MAX_FPS)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shared_informers.stop_all()
+
+
+def _fetch_metrics(custom_api: CustomObjectsApi, namespaces: list[str], all_namespaces: bool, page_size: int, label_selector: str) -> dict:
+    """Return metrics.k8s.io usage keyed by (namespace, pod, container)."""
+
+    def fetch_pages(namespace: Optional[str]):
+        if namespace is None:
+            return utils.paginate(
+                custom_api.list_cluster_custom_object, group="metrics.k8s.io", version="v1beta1", plural="pods", page_size=page_size, **utils.selector_kwargs(label_selector)
+            )
+        return utils.paginate(
+            custom_api.list_namespaced_custom_object,
+            group="metrics.k8s.io",
+            version="v1beta1",
+            namespace=namespace,
+            plural="pods",
+            page_size=page_size,
+            **utils.selector_kwargs(label_selector),
+        )
+
+    metrics_by_container = {}
+    for page in utils.fan_out_pages(fetch_pages, namespaces, all_namespaces):
+        for pod in page:
+            pod_name = pod.get("metadata", {}).get("name", "")
+            pod_ns = pod.get("metadata", {}).get("namespace", "")
+            for container in pod.get("containers", []):
+                key = (pod_ns, pod_name, container.get("name"))
+                metrics_by_container[key] = container.get("usage", {})
+    return metrics_by_container
+
+
+def _container_rows(page: list, usage_by_key: dict) -> list[tuple]:
+    names, requests, limits, usages = [], [], [], []
+    for pod in page:
+        pod_ns = pod["metadata"].get("namespace") or "-"
+        pod_name = pod["metadata"]["name"]
+        for container in pod["spec"]["containers"]:
+            resources = container.get("resources") or {}
+            names.append((pod_ns, pod_name, container["name"]))
+            requests.append(resources.get("requests") or {})
+            limits.append(resources.get("limits") or {})
+            usages.append(usage_by_key.get((pod_ns, pod_name, container["name"]), {}))
+
+    # Parse each resource as one column, then format whole columns, instead of converting row by row.
+    cpu_usage = quantity.parse_quantities([usage.get("cpu") for usage in usages])
+    memory_usage = quantity.parse_quantities([usage.get("memory") for usage in usages])
+    cpu_percent = quantity.percentages(cpu_usage, quantity.parse_quantities([limit.get("cpu") for limit in limits]))
+    memory_percent = quantity.percentages(memory_usage, quantity.parse_quantities([limit.get("memory") for limit in limits]))
+    cpu_text, cpu_percent_text = quantity.format_cpu(cpu_usage), quantity.format_percentages(cpu_percent)
+    memory_text, memory_percent_text = quantity.format_memory(memory_usage), quantity.format_percentages(memory_percent)
+    return [
+        (
+            *names[i],
+            requests[i].get("cpu", "-"),
+            limits[i].get("cpu", "-"),
+            cpu_text[i],
+            cpu_percent_text[i],
+            requests[i].get("memory", "-"),
+            limits[i].get("memory", "-"),
+            memory_text[i],
+            memory_percent_text[i],
+        )
+        for i in range(len(names))
+    ]
+
+
+def _joined_pages(api_client, namespaces: list[str], all_namespaces: bool, page_size: int, label_selector: str, field_selector: str):
+    """Yield each page of pods with the usage by container, which is fetched in the background."""
+    custom_api = CustomObjectsApi(api_client)
+    # Fetch usage in the background while the first page of pods is requested; rows wait for it below.
+    executor = ThreadPoolExecutor(max_workers=1)
+    metrics_future = executor.submit(_fetch_metrics, custom_api, namespaces, all_namespaces, page_size, label_selector)
+    executor.shutdown(wait=False)
+    metrics_by_container = None
+
+    def usage_by_container() -> dict:
+        nonlocal metrics_by_container
+        if metrics_by_container is None:
+            try:
+                metrics_by_container = metrics_future.result()
+            except Exception as e:
+                console.print("[yellow]Warning: Could not fetch metrics (Metrics Server may not be installed)[/yellow]")
+                console.print(f"[dim]Details: {e}[/dim]")
+                metrics_by_container = {}
+        return metrics_by_container
+
+    v1 = client.CoreV1Api(api_client)
+    for page in _list_pods(v1, namespaces, all_namespaces, page_size, utils.selector_kwargs(label_selector, field_selector)):
+        yield page, usage_by_container()
+
+
+def _metrics_pages(api_client, namespaces: list[str], all_namespaces: bool, page_size: int, label_selector: str, field_selector: str):
+    """Yield container rows page by page."""
+    for page, usage_by_key in _joined_pages(api_client, namespaces, all_namespaces, page_size, label_selector, field_selector):
+        yield _container_rows(page, usage_by_key)
+
+
+def _owner(metadata: dict) -> str:
+    """Return ``Kind/name`` of the controller of a pod; a Deployment's ReplicaSets are reported as the Deployment."""
+    owner = next((reference for reference in metadata.get("ownerReferences") or [] if reference.get("controller")), None)
+    if owner is None:
+        return f"Pod/{metadata.get('name')}"
+    kind, name = owner.get("kind"), owner.get("name") or ""
+    template_hash = (metadata.get("labels") or {}).get("pod-template-hash")
+    if kind == "ReplicaSet" and template_hash and name.endswith(f"-{template_hash}"):
+        return f"Deployment/{name[: -len(template_hash) - 1]}"
+    return f"{kind}/{name}"
+
+
+def _group_key_func(group_by: str) -> Optional[Callable[[dict], str]]:
+    """Return the function mapping a pod to its --group-by group, or None when ``group_by`` is not supported."""
+    if group_by == "namespace":
+        return lambda pod: pod["metadata"].get("namespace") or "-"
+    if group_by == "node":
+        return lambda pod: (pod.get("spec") or {}).get("nodeName") or "-"
+    if group_by == "owner":
+        return lambda pod: f"{pod['metadata'].get('namespace') or '-'}/{_owner(pod['metadata'])}"
+    if group_by.startswith("label=") and group_by[len("label=") :]:
+        key = group_by[len("label=") :]
+        return lambda pod: (pod["metadata"].get("labels") or {}).get(key) or "-"
+    return None
+
+
+class _ResourceGroup:
+    """Running totals of one --group-by group: exact sums in nano-units and usage/request ratios per container."""
+
+    __slots__ = ("pods", "containers", "requests", "limits", "usage", "utilization")
+
+    def __init__(self):
+        self.pods = 0
+        self.containers = 0
+        self.requests = dict.fromkeys(RESOURCES, 0)
+        self.limits = dict.fromkeys(RESOURCES, 0)
+        self.usage = dict.fromkeys(RESOURCES, 0)
+        self.utilization = {resource: array("d") for resource in RESOURCES}
+
+    def add(self, requests: dict, limits: dict, usage: dict) -> None:
+        self.containers += 1
+        for resource in RESOURCES:
+            request = Quantity.parse(requests.get(resource))
+            limit = Quantity.parse(limits.get(resource))
+            used = Quantity.parse(usage.get(resource))
+            if request is not None:
+                self.requests[resource] += request.nanos
+            if limit is not None:
+                self.limits[resource] += limit.nanos
+            if used is not None:
+                self.usage[resource] += used.nanos
+                if request:
+                    self.utilization[resource].append(used / request * 100)
+
+
+def _aggregate(pages, group_key: Callable[[dict], str]) -> dict[str, _ResourceGroup]:
+    """Reduce ``(page, usage by container)`` pairs to one ``_ResourceGroup`` per group in a single pass."""
+    groups: dict[str, _ResourceGroup] = {}
+    for page, usage_by_key in pages:
+        for pod in page:
+            key = group_key(pod)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = _ResourceGroup()
+            group.pods += 1
+            pod_ns = pod["metadata"].get("namespace") or "-"
+            pod_name = pod["metadata"]["name"]
+            for container in pod["spec"]["containers"]:
+                resources = container.get("resources") or {}
+                group.add(resources.get("requests") or {}, resources.get("limits") or {}, usage_by_key.get((pod_ns, pod_name, container["name"])) or {})
+    return groups
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    # Nearest-rank: the smallest value with at least ``percent`` of the values at or below it.
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def _utilization_summary(values: array) -> str:
+    if not values:
+        return "-"
+    ordered = sorted(values)
+    return f"{_percentile(ordered, 50):.0f}% / {_percentile(ordered, 95):.0f}% / {ordered[-1]:.0f}%"
+
+
+def _group_rows(groups: dict[str, _ResourceGroup], top: int = 0) -> list[tuple]:
+    """Return one row per group, highest CPU then memory usage first, keeping the first ``top`` (all when 0)."""
+    ranked = sorted(groups.items(), key=lambda item: (-item[1].usage["cpu"], -item[1].usage["memory"], item[0]))
+    if top:
+        ranked = ranked[:top]
+    rows = []
+    for key, group in ranked:
+        cpu = quantity.format_cpu([float(Quantity(totals["cpu"])) for totals in (group.requests, group.limits, group.usage)])
+        memory = quantity.format_memory([float(Quantity(totals["memory"])) for totals in (group.requests, group.limits, group.usage)])
+        rows.append((key, str(group.pods), str(group.containers), *cpu, _utilization_summary(group.utilization["cpu"]), *memory, _utilization_summary(group.utilization["memory"])))
+    return rows
+
+
+def _grouped_metrics_pages(
+    api_client, namespaces: list[str], all_namespaces: bool, page_size: int, label_selector: str, field_selector: str, group_key: Callable[[dict], str], top: int
+):
+    """Yield a single page with one row per group, once every page of pods has been reduced."""
+    yield _group_rows(_aggregate(_joined_pages(api_client, namespaces, all_namespaces, page_size, label_selector, field_selector), group_key), top)
+
 
 @app.command()
-def list(namespace: Annotated[str, typer.Option("--namespace", "-n")] = None, all_namespaces: Annotated[bool, typer.Option("--all-namespaces", "-A")] = False):
+def list(
+    namespace: utils.NamespaceOption = None,
+    all_namespaces: Annotated[bool, typer.Option("--all-namespaces", "-A")] = False,
+    page_size: PageSizeOption = utils.DEFAULT_PAGE_SIZE,
+    label_selector: utils.LabelSelectorOption = None,
+    field_selector: utils.FieldSelectorOption = None,
+    context: utils.ContextOption = None,
+    all_contexts: utils.AllContextsOption = False,
+    cluster_timeout: utils.ClusterTimeoutOption = utils.DEFAULT_CLUSTER_TIMEOUT,
+    cache: CacheOption = False,
+    cache_ttl: CacheTtlOption = DEFAULT_CACHE_TTL,
+    watch: WatchOption = False,
+):
     """List pods"""
-    utils.load_kube_config()
-    namespace = namespace or utils.get_current_namespace()
-    scope = "all namespaces" if all_namespaces else f"namespace {namespace}"
+    contexts = utils.resolve_contexts(context, all_contexts)
+    scope = utils.describe_scope(namespace, all_namespaces, contexts)
     console.print(f"[bold blue]Listing pods in {scope}...[/bold blue]")
 
-    try:
-        v1 = client.CoreV1Api()
-        pods = v1.list_pod_for_all_namespaces(watch=False) if all_namespaces else v1.list_namespaced_pod(namespace, watch=False)
+    selectors = utils.selector_kwargs(label_selector, field_selector)
 
-        table = Table(title=f"Pods in {scope}")
-        table.add_column("Namespace", style="cyan", justify="center")
-        table.add_column("Pod Name", style="green", justify="center")
-        table.add_column("Status", style="green", justify="center")
-        table.add_column("Restart Count", justify="center")
+    list_cache = ListCache.open(cache_ttl) if cache else None
 
-        for pod in pods.items:
-            statuses = pod.status.container_statuses or []
-            restart_count = sum((status.restart_count or 0) for status in statuses)
-            table.add_row(pod.metadata.namespace or "-", pod.metadata.name, pod.status.phase, str(restart_count))
+    def fetch_cluster(api_client, cluster):
+        pages = _list_pods(client.CoreV1Api(api_client), utils.resolve_namespaces(namespace, cluster), all_namespaces, page_size, selectors, list_cache, cluster)
+        return ([_pod_row(pod) for pod in page] for page in pages)
 
-        console.print(table)
+    try:
+        if watch:
+            _watch_pods(f"Pods in {scope}", contexts, namespace, all_namespaces, page_size, selectors)
+            return
+        utils.print_table_pages(console, _pods_table(f"Pods in {scope}", contexts), utils.query_clusters(console, contexts, fetch_cluster, cluster_timeout))
+        if list_cache is not None:
+            list_cache.warn_stale(console)
     except Exception as err:
         console.print(f"[bold red]Error accessing Kubernetes:[/bold red] \n\n{err}")
 
 
 @app.command()
-def metrics(namespace: Annotated[str, typer.Option("--namespace", "-n")] = None, all_namespaces: Annotated[bool, typer.Option("--all-namespaces", "-A")] = False):
+def metrics(
+    namespace: utils.NamespaceOption = None,
+    all_namespaces: Annotated[bool, typer.Option("--all-namespaces", "-A")] = False,
+    page_size: PageSizeOption = utils.DEFAULT_PAGE_SIZE,
+    label_selector: utils.LabelSelectorOption = None,
+    field_selector: utils.FieldSelectorOption = None,
+    context: utils.ContextOption = None,
+    all_contexts: utils.AllContextsOption = False,
+    cluster_timeout: utils.ClusterTimeoutOption = utils.DEFAULT_CLUSTER_TIMEOUT,
+    group_by: GroupByOption = None,
+    top: TopOption = 0,
+):
     """
     Retrieves CPU and memory resources (requests, limits, usage) for all pods.
     """
-    utils.load_kube_config()
-    namespace = namespace or utils.get_current_namespace()
-    scope = "all namespaces" if all_namespaces else f"namespace {namespace}"
-    console.print(f"[bold blue]Listing pod resources in {scope}...[/bold blue]")
+    if top and group_by is None:
+        console.print("[red]Error: --top requires --group-by.[/red]")
+        raise typer.Exit(1)
 
-    custom_api = CustomObjectsApi()
-    metrics_by_container = {}
-    try:
-        if all_namespaces:
-            pod_metrics = custom_api.list_cluster_custom_object(group="metrics.k8s.io", version="v1beta1", plural="pods")
-        else:
-            pod_metrics = custom_api.list_namespaced_custom_object(group="metrics.k8s.io", version="v1beta1", namespace=namespace, plural="pods")
+    group_key = None
+    if group_by is not None:
+        group_key = _group_key_func(group_by)
+        if group_key is None:
+            console.print("[red]Error: --group-by must be namespace, node, owner or label=<key>.[/red]")
+            raise typer.Exit(1)
 
-        for pod in pod_metrics.get("items", []):
-            pod_name = pod.get("metadata", {}).get("name", "")
-            pod_ns = pod.get("metadata", {}).get("namespace", "")
-            for container in pod.get("containers", []):
-                key = (pod_ns, pod_name, container.get("name"))
-                metrics_by_container[key] = container.get("usage", {})
-    except Exception as e:
-        console.print("[yellow]Warning: Could not fetch metrics (Metrics Server may not be installed)[/yellow]")
-        console.print(f"[dim]Details: {e}[/dim]")
+    contexts = utils.resolve_contexts(context, all_contexts)
+    scope = utils.describe_scope(namespace, all_namespaces, contexts)
+    console.print(f"[bold blue]Listing pod resources in {scope}...[/bold blue]")
 
-    try:
-        v1 = client.CoreV1Api()
-        pods = v1.list_pod_for_all_namespaces(watch=False) if all_namespaces else v1.list_namespaced_pod(namespace, watch=False)
+    def fetch_cluster(api_client, cluster):
+        namespaces = utils.resolve_namespaces(namespace, cluster)
+        if group_key is not None:
+            return _grouped_metrics_pages(api_client, namespaces, all_namespaces, page_size, label_selector, field_selector, group_key, top)
+        return _metrics_pages(api_client, namespaces, all_namespaces, page_size, label_selector, field_selector)
 
-        table = Table(title=f"Pod Resources in {scope}")
-        table.add_column("Namespace", style="cyan", justify="center")
-        table.add_column("Pod Name", style="cyan", justify="center")
-        table.add_column("Container", style="cyan", justify="center")
+    try:
+        if group_key is not None:
+            table = utils.cluster_table(f"Pod Resources by {group_by} in {scope}", contexts)
+            table.add_column(group_by[len("label=") :] if group_by.startswith("label=") else group_by.capitalize(), style="cyan", justify="center")
+            table.add_column("Pods", justify="center")
+            table.add_column("Containers", justify="center")
+        else:
+            table = utils.cluster_table(f"Pod Resources in {scope}", contexts)
+            table.add_column("Namespace", style="cyan", justify="center")
+            table.add_column("Pod Name", style="cyan", justify="center")
+            table.add_column("Container", style="cyan", justify="center")
         table.add_column("CPU Req", style="green", justify="center")
         table.add_column("CPU Limit", style="yellow", justify="center")
         table.add_column("CPU Usage", style="magenta", justify="center")
-        table.add_column("CPU Usage %", style="magenta", justify="center")
+        table.add_column("CPU Usage/Req p50 / p95 / max" if group_key is not None else "CPU Usage %", style="magenta", justify="center")
         table.add_column("Mem Req", style="green", justify="center")
         table.add_column("Mem Limit", style="yellow", justify="center")
         table.add_column("Mem Usage", style="magenta", justify="center")
-        table.add_column("Mem Usage %", style="magenta", justify="center")
-
-        for pod in pods.items:
-            pod_ns = pod.metadata.namespace or "-"
-            pod_name = pod.metadata.name
-            for container in pod.spec.containers:
-                resources = container.resources
-                limits = getattr(resources, "limits", None) or {}
-                requests = getattr(resources, "requests", None) or {}
-
-                key = (pod_ns, pod_name, container.name)
-                usage = metrics_by_container.get(key, {})
-                cpu_percent_usage = utils.calculate_cpu_percentage(usage.get("cpu"), limits.get("cpu"))
-                memory_percent_usage = utils.calculate_memory_percentage(usage.get("memory"), limits.get("memory"))
-                table.add_row(
-                    pod_ns,
-                    pod_name,
-                    container.name,
-                    requests.get("cpu", "-"),
-                    limits.get("cpu", "-"),
-                    utils.parse_cpu(usage.get("cpu", "0n")) if usage else "-",
-                    cpu_percent_usage,
-                    requests.get("memory", "-"),
-                    limits.get("memory", "-"),
-                    utils.parse_memory(usage.get("memory", "0Ki")) if usage else "-",
-                    memory_percent_usage,
-                )
-
-        console.print(table)
+        table.add_column("Mem Usage/Req p50 / p95 / max" if group_key is not None else "Mem Usage %", style="magenta", justify="center")
+
+        utils.print_table_pages(console, table, utils.query_clusters(console, contexts, fetch_cluster, cluster_timeout))
     except Exception as err:
         console.print(f"[bold red]Error accessing Kubernetes:[/bold red] \n\n{err}")
 
 
 @app.command()
-def unhealthy(namespace: Annotated[str, typer.Option("--namespace", "-n")] = None, all_namespaces: Annotated[bool, typer.Option("--all-namespaces", "-A")] = False):
+def unhealthy(
+    namespace: utils.NamespaceOption = None,
+    all_namespaces: Annotated[bool, typer.Option("--all-namespaces", "-A")] = False,
+    page_size: PageSizeOption = utils.DEFAULT_PAGE_SIZE,
+    label_selector: utils.LabelSelectorOption = None,
+    field_selector: utils.FieldSelectorOption = None,
+    context: utils.ContextOption = None,
+    all_contexts: utils.AllContextsOption = False,
+    cluster_timeout: utils.ClusterTimeoutOption = utils.DEFAULT_CLUSTER_TIMEOUT,
+    cache: CacheOption = False,
+    cache_ttl: CacheTtlOption = DEFAULT_CACHE_TTL,
+    watch: WatchOption = False,
+):
     """
     List pods with issues (not in Running or Succeeded state).
     """
-    utils.load_kube_config()
-    namespace = namespace or utils.get_current_namespace()
-    scope = "all namespaces" if all_namespaces else f"namespace {namespace}"
+    contexts = utils.resolve_contexts(context, all_contexts)
+    scope = utils.describe_scope(namespace, all_namespaces, contexts)
     console.print(f"[bold blue]Listing Issued pods in {scope}...[/bold blue]")
 
+    selectors = utils.selector_kwargs(label_selector, UNHEALTHY_FIELD_SELECTOR, field_selector)
+
+    list_cache = ListCache.open(cache_ttl) if cache else None
+
+    def fetch_cluster(api_client, cluster):
+        pages = _list_pods(client.CoreV1Api(api_client), utils.resolve_namespaces(namespace, cluster), all_namespaces, page_size, selectors, list_cache, cluster)
+        return ([_pod_row(pod) for pod in page] for page in pages)
+
     try:
-        v1 = client.CoreV1Api()
-        pods = v1.list_pod_for_all_namespaces(watch=False) if all_namespaces else v1.list_namespaced_pod(namespace, watch=False)
-
-        table = Table(title=f"Pods in {scope}")
-        table.add_column("Namespace", style="cyan", justify="center")
-        table.add_column("Pod Name", style="green", justify="center")
-        table.add_column("Status", style="green", justify="center")
-        table.add_column("Restart Count", justify="center")
-
-        for pod in pods.items:
-            statuses = pod.status.container_statuses or []
-            restart_count = sum((status.restart_count or 0) for status in statuses)
-            if pod.status.phase not in ("Running", "Succeeded"):
-                table.add_row(pod.metadata.namespace or "-", pod.metadata.name, pod.status.phase, str(restart_count))
-
-        console.print(table)
+        if watch:
+            _watch_pods(f"Pods in {scope}", contexts, namespace, all_namespaces, page_size, selectors)
+            return
+        utils.print_table_pages(console, _pods_table(f"Pods in {scope}", contexts), utils.query_clusters(console, contexts, fetch_cluster, cluster_timeout))
+        if list_cache is not None:
+            list_cache.warn_stale(console)
     except Exception as err:
         console.print(f"[bold red]Error accessing Kubernetes:[/bold red] \n\n{err}")
@@ -0,0 +1,205 @@
+import functools
+import math
+import re
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Optional, Union
+
+# The numpy module once _numpy() has imported it, None when it is not installed.
+_NOT_IMPORTED = object()
+numpy = _NOT_IMPORTED
+
+# <signedNumber><suffix> from the Kubernetes resource.Quantity grammar, plus the n/u suffixes metrics-server reports.
+QUANTITY_PATTERN = re.compile(r"([+-]?(?:\d+(?:\.\d*)?|\.\d+))(?:([KMGTPE]i)|([numkMGTPE])|[eE]([+-]?\d+))?")
+BINARY_SUFFIXES = {"Ki": 2**10, "Mi": 2**20, "Gi": 2**30, "Ti": 2**40, "Pi": 2**50, "Ei": 2**60}
+DECIMAL_EXPONENTS = {"n": -9, "u": -6, "m": -3, "k": 3, "M": 6, "G": 9, "T": 12, "P": 15, "E": 18}
+# Like the apiserver, values are kept to nano precision: 1n is the smallest non-zero quantity.
+NANOS_PER_UNIT = 10**9
+# Larger exponents are rejected rather than turned into huge integers.
+MAX_EXPONENT = 64
+# Distinct strings whose parsed Quantity is kept; clusters reuse a small set of requests and limits.
+PARSE_CACHE_SIZE = 16384
+
+# A column of float64 values: a NumPy array when NumPy is installed, an ``array("d")`` otherwise.
+Column = Union["numpy.ndarray", array]
+
+
+@functools.total_ordering
+class Quantity:
+    """A Kubernetes quantity stored exactly, as an integer number of nano-units (10**-9 cores or bytes).
+
+    ``Quantity.parse("1.5Gi") == Quantity.parse("1610612736")``; sums are exact, and dividing two
+    quantities gives their ratio as a float.
+    """
+
+    __slots__ = ("nanos",)
+
+    def __init__(self, nanos: int = 0):
+        self.nanos = nanos
+
+    @staticmethod
+    def parse(value: Optional[str]) -> Optional["Quantity"]:
+        """Return the quantity a string holds, or None when it is missing or not a quantity.
+
+        Results are memoized, so repeated strings cost one dict lookup.
+        """
+        return _parse(value) if isinstance(value, str) else None
+
+    def __float__(self) -> float:
+        return self.nanos / NANOS_PER_UNIT
+
+    def __add__(self, other):
+        if isinstance(other, Quantity):
+            return Quantity(self.nanos + other.nanos)
+        if other == 0:
+            return self
+        return NotImplemented
+
+    # Lets sum() start from 0.
+    __radd__ = __add__
+
+    def __truediv__(self, other):
+        if isinstance(other, Quantity):
+            return self.nanos / other.nanos
+        return NotImplemented
+
+    def __eq__(self, other):
+        if isinstance(other, Quantity):
+            return self.nanos == other.nanos
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, Quantity):
+            return self.nanos < other.nanos
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.nanos)
+
+    def __bool__(self) -> bool:
+        return self.nanos != 0
+
+    def __repr__(self) -> str:
+        return f"Quantity({self.nanos}n)"
+
+
+def _scale(power: int) -> tuple[int, int]:
+    """Return ``(multiplier, divisor)`` turning a number times ``10**power`` into nano-units."""
+    power += 9
+    return (10**power, 1) if power >= 0 else (1, 10**-power)
+
+
+# (multiplier, divisor) to nano-units for each suffix, and for none.
+SUFFIX_SCALES = {
+    **{suffix: (factor * NANOS_PER_UNIT, 1) for suffix, factor in BINARY_SUFFIXES.items()},
+    **{suffix: _scale(power) for suffix, power in DECIMAL_EXPONENTS.items()},
+    None: _scale(0),
+}
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse(value: str) -> Optional[Quantity]:
+    match = QUANTITY_PATTERN.fullmatch(value)
+    if match is None:
+        return None
+    number, binary, decimal, exponent = match.groups()
+    if exponent is None:
+        multiplier, divisor = SUFFIX_SCALES[binary or decimal]
+    elif abs(int(exponent)) > MAX_EXPONENT:
+        return None
+    else:
+        multiplier, divisor = _scale(int(exponent))
+    if "." in number:
+        whole, _, fraction = number.partition(".")
+        # int() keeps the sign of ``whole`` ("-1" + "5" is -15), and accepts "-" + "5" for "-.5".
+        number = whole + fraction
+        divisor *= 10 ** len(fraction)
+    nanos = int(number) * multiplier
+    # Round up to the nearest nano-unit, as the apiserver does.
+    return Quantity(nanos if divisor == 1 else -(-nanos // divisor))
+
+
+def parse_quantity(value: Optional[Union[str, int, float]]) -> float:
+    """Return a quantity in base units (cores, bytes), or NaN when it is missing or not a quantity."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    parsed = Quantity.parse(value)
+    return math.nan if parsed is None else float(parsed)
+
+
+def _numpy():
+    """Return numpy, importing it on first use so k8s commands that never build a column do not pay for it."""
+    global numpy
+    if numpy is _NOT_IMPORTED:
+        try:
+            import numpy as module
+        except ImportError:  # pragma: no cover - exercised when the optional dependency is missing
+            module = None
+        numpy = module
+    return numpy
+
+
+def _column(values: Sequence[float]) -> Column:
+    np = _numpy()
+    if np is not None:
+        return np.array(values, dtype=np.float64)
+    return array("d", values)
+
+
+def parse_quantities(values: Iterable[Optional[str]]) -> Column:
+    """Parse a sequence of quantities into one numeric column in a single pass.
+
+    Each distinct string is parsed once; containers of the same workload repeat the same requests and
+    limits, so most of a column is a dict lookup. Missing and invalid values become NaN.
+    """
+    parsed: dict = {}
+    result = []
+    for value in values:
+        number = parsed.get(value)
+        if number is None:
+            number = parsed[value] = parse_quantity(value)
+        result.append(number)
+    return _column(result)
+
+
+def _floats(column: Union[Column, list]) -> list[float]:
+    # Iterating Python floats is much faster than iterating NumPy scalars.
+    return column if isinstance(column, list) else column.tolist()
+
+
+def percentages(numerators: Column, denominators: Column) -> Column:
+    """Return ``numerators / denominators * 100`` element-wise, NaN where either is missing or the denominator is 0."""
+    np = _numpy()
+    if np is not None:
+        numerators = np.asarray(numerators, dtype=np.float64)
+        denominators = np.asarray(denominators, dtype=np.float64)
+        result = np.full(len(numerators), np.nan)
+        np.divide(numerators, denominators, out=result, where=denominators > 0)
+        return result * 100
+    return array("d", (n / d * 100 if d > 0 else math.nan for n, d in zip(numerators, denominators)))
+
+
+def format_cpu(cores: Column) -> list[str]:
+    """Format a column of cores as millicores (``25.16m``), ``-`` for missing values."""
+    return ["-" if math.isnan(value) else f"{value * 1000:.2f}m" for value in _floats(cores)]
+
+
+def _format_bytes(value: float) -> str:
+    if math.isnan(value):
+        return "-"
+    if value >= 2**30:
+        return f"{value / 2**30:.2f} Gi"
+    if value >= 2**20:
+        return f"{value / 2**20:.2f} Mi"
+    if value >= 2**10:
+        return f"{value / 2**10:.2f} Ki"
+    return f"{value:.0f} B"
+
+
+def format_memory(sizes: Column) -> list[str]:
+    """Format a column of bytes in the largest binary unit up to Gi (``7.80 Mi``), ``-`` for missing values."""
+    return [_format_bytes(value) for value in _floats(sizes)]
+
+
+def format_percentages(values: Column) -> list[str]:
+    return ["-" if math.isnan(value) else f"{value:.2f}%" for value in _floats(values)]
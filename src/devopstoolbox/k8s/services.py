@@ -1,42 +1,68 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 import typer
 from kubernetes import client
 from rich.console import Console
-from rich.table import Table
 
 from devopstoolbox.k8s import utils
+from devopstoolbox.k8s.listcache import DEFAULT_CACHE_TTL, CacheOption, CacheTtlOption, ListCache
 
 app = typer.Typer(no_args_is_help=True)
 console = Console()
 
 
+def _service_row(service: dict) -> tuple:
+    metadata = service.get("metadata") or {}
+    spec = service.get("spec") or {}
+    return metadata.get("namespace") or "-", metadata.get("name"), spec.get("type"), spec.get("internalTrafficPolicy") or "none"
+
+
 @app.command()
-def list(namespace: Annotated[str, typer.Option("--namespace", "-n")] = None, all_namespaces: Annotated[bool, typer.Option("--all-namespaces", "-A")] = False):
+def list(
+    namespace: utils.NamespaceOption = None,
+    all_namespaces: Annotated[bool, typer.Option("--all-namespaces", "-A")] = False,
+    page_size: Annotated[int, typer.Option("--page-size", min=0, help="Services fetched per API request (0 fetches all at once).")] = utils.DEFAULT_PAGE_SIZE,
+    label_selector: utils.LabelSelectorOption = None,
+    field_selector: utils.FieldSelectorOption = None,
+    context: utils.ContextOption = None,
+    all_contexts: utils.AllContextsOption = False,
+    cluster_timeout: utils.ClusterTimeoutOption = utils.DEFAULT_CLUSTER_TIMEOUT,
+    cache: CacheOption = False,
+    cache_ttl: CacheTtlOption = DEFAULT_CACHE_TTL,
+):
     """List services"""
-    utils.load_kube_config()
-    namespace = namespace or utils.get_current_namespace()
-    scope = "all namespaces" if all_namespaces else f"namespace {namespace}"
+    contexts = utils.resolve_contexts(context, all_contexts)
+    scope = utils.describe_scope(namespace, all_namespaces, contexts)
     console.print(f"[bold blue]Listing services in {scope}...[/bold blue]")
 
-    try:
-        v1 = client.CoreV1Api()
-        services = v1.list_service_for_all_namespaces(watch=False) if all_namespaces else v1.list_namespaced_service(namespace, watch=False)
+    # Raw JSON pages: only four fields are shown, so skip the V1Service model deserializer.
+    selectors = utils.selector_kwargs(label_selector, field_selector)
+    list_cache = ListCache.open(cache_ttl) if cache else None
+
+    def fetch_cluster(api_client, cluster):
+        v1 = client.CoreV1Api(api_client)
 
-        table = Table(title=f"Pods in {scope}")
+        def fetch_pages(namespace: Optional[str]):
+            if list_cache is not None:
+                if namespace is None:
+                    return list_cache.pages(cluster, "services", None, v1.list_service_for_all_namespaces, page_size=page_size, **selectors)
+                return list_cache.pages(cluster, "services", namespace, v1.list_namespaced_service, namespace, page_size=page_size, **selectors)
+            if namespace is None:
+                return utils.paginate(v1.list_service_for_all_namespaces, watch=False, page_size=page_size, raw=True, **selectors)
+            return utils.paginate(v1.list_namespaced_service, namespace, watch=False, page_size=page_size, raw=True, **selectors)
+
+        pages = utils.fan_out_pages(fetch_pages, utils.resolve_namespaces(namespace, cluster), all_namespaces)
+        return ([_service_row(service) for service in page] for page in pages)
+
+    try:
+        table = utils.cluster_table(f"Pods in {scope}", contexts)
         table.add_column("Namespace", style="cyan", justify="center")
         table.add_column("Service Name", style="green", justify="center")
         table.add_column("Service IP", justify="center")
         table.add_column("Internal Traffic Policy", justify="center")
 
-        for service in services.items:
-            table.add_row(
-                service.metadata.namespace or "-",
-                service.metadata.name,
-                service.spec.type,
-                service.spec.internal_traffic_policy or "none",
-            )
-
-        console.print(table)
+        utils.print_table_pages(console, table, utils.query_clusters(console, contexts, fetch_cluster, cluster_timeout))
+        if list_cache is not None:
+            list_cache.warn_stale(console)
     except Exception as err:
         console.print(f"[bold red]Error accessing Kubernetes:[/bold red] \n\n{err}")
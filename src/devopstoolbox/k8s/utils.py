@@ -1,13 +1,55 @@
-import re
+import concurrent.futures
+import functools
+import json
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Optional
 
+import typer
 import urllib3
 from kubernetes import config
+from kubernetes.client import ApiClient, Configuration
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+
+from devopstoolbox.k8s import kubeconfig, quantity
+from devopstoolbox.k8s.quantity import Quantity
 
 # Hide InsecureRequestWarning when CA certificate is not configured
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 _kube_config_loaded = False
 
+# Items requested per API call when listing; bounds client memory and apiserver response size.
+DEFAULT_PAGE_SIZE = 500
+
+# Upper bound for concurrent per-namespace requests; they share the API client's connection pool.
+MAX_PARALLEL_REQUESTS = 16
+
+# Seconds each cluster gets to answer when several kubeconfig contexts are queried at once.
+DEFAULT_CLUSTER_TIMEOUT = 30.0
+
+# Connections kept open per apiserver, so every concurrent namespace request can reuse one.
+DEFAULT_CONNECTION_POOL_MAXSIZE = MAX_PARALLEL_REQUESTS
+
+# How the shared API clients are built; see configure_api_clients.
+_api_client_settings = {"pool_maxsize": DEFAULT_CONNECTION_POOL_MAXSIZE, "request_timeout": None, "record_timings": False}
+_api_clients: dict[Optional[str], ApiClient] = {}
+_api_clients_lock = threading.Lock()
+# (method, url, status, seconds) of every request made while timings are recorded.
+_request_timings: list[tuple[str, str, Optional[int], float]] = []
+
+NamespaceOption = Annotated[list[str], typer.Option("--namespace", "-n", help="Namespace to query; repeat or comma-separate to query several concurrently.")]
+LabelSelectorOption = Annotated[str, typer.Option("--label-selector", "-l", help="Only list objects matching this label selector (e.g. app=web,tier!=db).")]
+FieldSelectorOption = Annotated[str, typer.Option("--field-selector", help="Only list objects matching this field selector (e.g. spec.nodeName=node-1).")]
+ContextOption = Annotated[list[str], typer.Option("--context", help="Kubeconfig context to query; repeat or comma-separate to query several clusters in parallel.")]
+AllContextsOption = Annotated[bool, typer.Option("--all-contexts", help="Query every context in the kubeconfig in parallel.")]
+ClusterTimeoutOption = Annotated[float, typer.Option("--cluster-timeout", min=0, help="Seconds to wait for each cluster when querying contexts (0 waits forever).")]
+
 
 def load_kube_config():
     """Load kubeconfig when K8s commands are called."""
@@ -15,82 +57,369 @@ def load_kube_config():
     if _kube_config_loaded:
         return
     try:
-        config.load_kube_config()
+        kube_config = kubeconfig.load()
     except config.ConfigException:
         config.load_incluster_config()
+    else:
+        configuration = Configuration()
+        kube_config.load_and_set(configuration)
+        Configuration.set_default(configuration)
     _kube_config_loaded = True
 
 
-def get_current_namespace():
-    """Get the current namespace from the active Kubernetes context."""
+def get_current_namespace(context: Optional[str] = None):
+    """Get the namespace of the given kubeconfig context, or of the active one."""
     try:
-        _, active_context = config.list_kube_config_contexts()
-        return active_context["context"].get("namespace", "default")
+        return kubeconfig.load().context(context)["context"].get("namespace", "default")
     except Exception:
         return "default"
 
 
-def parse_cpu(cpu_str: str, return_number: bool = False):
-    """Convert Kubernetes CPU units to human-readable format (millicores)."""
-    if cpu_str.endswith("n"):
-        nanocores = int(cpu_str[:-1])
-        millicores = nanocores / 1_000_000
-        if return_number:
-            return millicores
-        else:
-            return f"{millicores:.2f}m"
-    elif cpu_str.endswith("u"):
-        microcores = int(cpu_str[:-1])
-        millicores = microcores / 1_000
-        if return_number:
-            return millicores
+def current_context_name() -> str:
+    """Return the name of the active kubeconfig context, or "in-cluster" when there is none."""
+    try:
+        return kubeconfig.load().context()["name"]
+    except Exception:
+        return "in-cluster"
+
+
+def cluster_identity(context: Optional[str] = None) -> tuple[str, Optional[str], Optional[str]]:
+    """Return the name, apiserver URL and user of a kubeconfig context (the current one when None).
+
+    Names such as ``default`` or ``minikube`` repeat across kubeconfigs; the server and user tell their
+    clusters apart. Without a kubeconfig, the current context is the in-cluster apiserver.
+    """
+    try:
+        kube_config = kubeconfig.load()
+        entry = kube_config.context(context)
+    except config.ConfigException:
+        if context is not None:
+            raise
+        load_kube_config()
+        return "in-cluster", Configuration.get_default_copy().host, None
+    cluster = kube_config.cluster(entry["context"].get("cluster"))
+    return entry["name"], (cluster.get("cluster") or {}).get("server"), entry["context"].get("user")
+
+
+def resolve_contexts(contexts: Optional[list[str]], all_contexts: bool = False) -> list[str]:
+    """Return the kubeconfig contexts to query in order without duplicates; empty means the current context only."""
+    if all_contexts:
+        return [entry["name"] for entry in kubeconfig.load().contexts()]
+    return [*dict.fromkeys(name.strip() for value in contexts or [] for name in value.split(",") if name.strip())]
+
+
+def configure_api_clients(pool_maxsize: int = DEFAULT_CONNECTION_POOL_MAXSIZE, request_timeout: Optional[float] = None, record_timings: bool = False) -> None:
+    """Set the connection pool size, default request timeout and timing of the shared API clients.
+
+    Only clients created afterwards are affected, so call it before the first request.
+    """
+    _api_client_settings.update(pool_maxsize=pool_maxsize, request_timeout=request_timeout or None, record_timings=record_timings)
+
+
+def reset_api_clients() -> None:
+    """Close and forget the shared API clients and any recorded timings."""
+    with _api_clients_lock:
+        for api_client in _api_clients.values():
+            api_client.close()
+        _api_clients.clear()
+    _request_timings.clear()
+
+
+def _timed(request: Callable) -> Callable:
+    @functools.wraps(request)
+    def timed_request(method, url, *args, **kwargs):
+        status = None
+        start = time.perf_counter()
+        try:
+            response = request(method, url, *args, **kwargs)
+            status = getattr(response, "status", None)
+            return response
+        finally:
+            _request_timings.append((method, url, status, time.perf_counter() - start))
+
+    return timed_request
+
+
+def _bounded(request: Callable, timeout: float) -> Callable:
+    # The REST client hands urllib3 an explicit timeout on every request, overriding any pool default.
+    @functools.wraps(request)
+    def bounded_request(method, url, *args, _request_timeout=None, **kwargs):
+        return request(method, url, *args, _request_timeout=_request_timeout or timeout, **kwargs)
+
+    return bounded_request
+
+
+def _new_api_client(context: Optional[str], timeout: Optional[float]) -> ApiClient:
+    if context is None:
+        load_kube_config()
+        configuration = Configuration.get_default_copy()
+    else:
+        configuration = Configuration()
+    configuration.connection_pool_maxsize = _api_client_settings["pool_maxsize"]
+    # TCP keepalive probes with a short idle time, so pooled connections survive NAT and load balancer idle timeouts.
+    configuration.keep_alive = True
+    if context is not None:
+        kubeconfig.load().load_and_set(configuration, context)
+    api_client = ApiClient(configuration)
+    timeout = timeout or _api_client_settings["request_timeout"]
+    if timeout:
+        # Default timeout of every request the client makes, so a hung apiserver frees its thread.
+        api_client.rest_client.request = _bounded(api_client.rest_client.request, timeout)
+    if _api_client_settings["record_timings"]:
+        api_client.rest_client.request = _timed(api_client.rest_client.request)
+    return api_client
+
+
+def get_api_client(context: Optional[str] = None, timeout: Optional[float] = None) -> ApiClient:
+    """Return the shared API client of a kubeconfig context (the current one when None), creating it on first use.
+
+    Every command and thread talking to the same cluster goes through one client, so its pooled
+    keep-alive connections are reused instead of paying a TCP and TLS handshake per request.
+    ``timeout`` bounds each request in seconds and only applies when the client is created.
+    """
+    with _api_clients_lock:
+        api_client = _api_clients.get(context)
+        if api_client is None:
+            api_client = _api_clients[context] = _new_api_client(context, timeout)
+        return api_client
+
+
+def request_timings() -> list[tuple[str, str, Optional[int], float]]:
+    """Return ``(method, url, status, seconds)`` for every request recorded so far.
+
+    For raw responses (``_preload_content=False``) the time runs until the response headers arrive.
+    """
+    return [*_request_timings]
+
+
+def print_request_timings(console: Console) -> None:
+    timings = request_timings()
+    table = Table(title=f"Kubernetes API requests ({len(timings)})")
+    table.add_column("Method", style="cyan")
+    table.add_column("URL", style="cyan", overflow="fold")
+    table.add_column("Status", justify="right")
+    table.add_column("Time (ms)", style="magenta", justify="right")
+    for method, url, status, seconds in timings:
+        table.add_row(method, url, "-" if status is None else str(status), f"{seconds * 1000:.1f}")
+    if timings:
+        durations = sorted(seconds for _, _, _, seconds in timings)
+        table.caption = f"total {sum(durations) * 1000:.1f} ms, median {durations[len(durations) // 2] * 1000:.1f} ms, max {durations[-1] * 1000:.1f} ms"
+    console.print(table)
+
+
+def _run_detached(func: Callable, *args) -> concurrent.futures.Future:
+    """Run ``func(*args)`` on a daemon thread and return its future.
+
+    Unlike ``ThreadPoolExecutor`` workers, which the interpreter joins at exit, a call that never
+    returns does not keep the process alive once its result has been given up on.
+    """
+    future = concurrent.futures.Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def query_clusters(
+    console: Console, contexts: list[str], fetch_pages: Callable[[Optional[ApiClient], Optional[str]], Iterable[list[tuple]]], timeout: Optional[float] = DEFAULT_CLUSTER_TIMEOUT
+) -> Iterator[list[tuple]]:
+    """Yield pages of table rows from the current context, or from several contexts queried in parallel.
+
+    ``fetch_pages(api_client, context)`` lists one cluster. Without contexts it is called once with the
+    current context's shared client and ``None``, and its pages stream through as they arrive. Otherwise
+    each context gets its own client and thread, and its rows are yielded as one page, prefixed with the
+    context name, in the order given. A cluster that fails or does not answer within ``timeout`` seconds is
+    reported on ``console`` and left out, so the whole query takes as long as the slowest healthy cluster.
+    """
+    if not contexts:
+        yield from fetch_pages(get_api_client(), None)
+        return
+
+    slots = threading.BoundedSemaphore(MAX_PARALLEL_REQUESTS)
+
+    def list_cluster(context: str) -> list[tuple]:
+        return [row for page in fetch_pages(get_api_client(context, timeout), context) for row in page]
+
+    def fetch_cluster(context: str) -> list[tuple]:
+        # The clock starts once the cluster has a slot, so clusters queued behind slow ones keep their full timeout.
+        # A cluster that runs out of time gives its slot up; its abandoned thread does not hold the next one back.
+        with slots:
+            return _run_detached(list_cluster, context).result(timeout=timeout or None)
+
+    futures = [_run_detached(fetch_cluster, context) for context in contexts]
+    for context, future in zip(contexts, futures):
+        try:
+            rows = future.result()
+        except concurrent.futures.TimeoutError:
+            console.print(f"[yellow]Warning: context {context} did not answer within {timeout:g}s[/yellow]")
+            continue
+        except Exception as e:
+            console.print(f"[yellow]Warning: could not query context {context}[/yellow]")
+            console.print(f"[dim]Details: {e}[/dim]")
+            continue
+        yield [(context, *row) for row in rows]
+
+
+def cluster_table(title: str, contexts: list[str]) -> Table:
+    """Create a table that starts with a Cluster column when several contexts are queried."""
+    table = Table(title=title)
+    if contexts:
+        table.add_column("Cluster", style="cyan", justify="center")
+    return table
+
+
+def selector_kwargs(label_selector: Optional[str] = None, *field_selectors: Optional[str]) -> dict:
+    """Build the ``label_selector``/``field_selector`` arguments of a list call, leaving out unset ones.
+
+    Field selectors are ANDed by joining them with commas, so the apiserver filters before sending anything.
+    """
+    kwargs = {}
+    if label_selector:
+        kwargs["label_selector"] = label_selector
+    field_selector = ",".join(selector for selector in field_selectors if selector)
+    if field_selector:
+        kwargs["field_selector"] = field_selector
+    return kwargs
+
+
+def read_json(response) -> dict:
+    """Decode the body of a response requested with ``_preload_content=False`` and release its connection."""
+    try:
+        return json.loads(response.data)
+    finally:
+        response.release_conn()
+
+
+def paginate(list_func: Callable, *args, page_size: int = DEFAULT_PAGE_SIZE, raw: bool = False, **kwargs) -> Iterator[list]:
+    """Call a Kubernetes list function with ``limit``/``_continue`` and yield each page of items as it arrives.
+
+    Works with typed responses (``V1PodList``) and the dicts returned by ``CustomObjectsApi``.
+    With ``raw`` the body is decoded with ``json`` instead of the client's model deserializer, so
+    items are plain dicts with the API's camelCase field names. A ``page_size`` of 0 fetches
+    everything in a single request.
+    """
+    if page_size:
+        kwargs["limit"] = page_size
+    if raw:
+        kwargs["_preload_content"] = False
+    while True:
+        response = list_func(*args, **kwargs)
+        if raw:
+            response = read_json(response)
+        if isinstance(response, dict):
+            yield response.get("items", [])
+            token = (response.get("metadata") or {}).get("continue")
         else:
-            return f"{millicores:.2f}m"
-    elif cpu_str.endswith("m"):
-        if return_number:
-            return int(cpu_str[:-1])
+            yield response.items
+            token = response.metadata._continue if response.metadata else None
+        if not token:
+            return
+        kwargs["_continue"] = token
+
+
+def print_table_pages(console: Console, table: Table, pages: Iterable[Iterable[tuple]]) -> int:
+    """Print rows page by page and return how many were printed.
+
+    The first page is printed under ``table``'s title and header. Each later page continues it with the
+    same columns, pinned to the widths of the first page so the segments line up.
+    """
+    count = 0
+    widths = None
+    for page in pages:
+        rows = [tuple("" if cell is None else str(cell) for cell in row) for row in page]
+        if widths is not None and not rows:
+            continue
+        if widths is None:
+            segment = table
+            widths = [Text.from_markup(str(column.header)).cell_len for column in table.columns]
+            for row in rows:
+                widths = [max(width, Text.from_markup(cell).cell_len) for width, cell in zip(widths, row)]
         else:
-            return cpu_str
+            segment = Table(show_header=False, box=table.box)
+            for column, width in zip(table.columns, widths):
+                segment.add_column(style=column.style, justify=column.justify, min_width=width)
+        for row in rows:
+            segment.add_row(*row)
+        console.print(segment)
+        count += len(rows)
+    if widths is None:
+        console.print(table)
+    return count
+
+
+def resolve_namespaces(namespaces: Optional[list[str]], context: Optional[str] = None) -> list[str]:
+    """Return the requested namespaces in order without duplicates, or the context's own namespace."""
+    names = [name.strip() for value in namespaces or [] for name in value.split(",") if name.strip()]
+    return [*dict.fromkeys(names)] or [get_current_namespace(context)]
+
+
+def describe_scope(namespaces: Optional[list[str]], all_namespaces: bool, contexts: Optional[list[str]] = None) -> str:
+    """Describe what a listing covers, from the raw ``--namespace`` values and the resolved contexts."""
+    if all_namespaces:
+        scope = "all namespaces"
+    elif contexts and not namespaces:
+        scope = "each context's namespace"
     else:
-        cores = float(cpu_str)
-        if return_number:
-            return cores * 1000
-        else:
-            return f"{cores * 1000:.2f}m"
+        names = resolve_namespaces(namespaces)
+        scope = f"namespace {names[0]}" if len(names) == 1 else f"namespaces {', '.join(names)}"
+    if contexts:
+        scope += f" of {'context' if len(contexts) == 1 else 'contexts'} {', '.join(contexts)}"
+    return scope
+
+
+def fan_out_pages(fetch_pages: Callable[[Optional[str]], Iterable[list]], namespaces: list[str], all_namespaces: bool) -> Iterator[list]:
+    """Yield pages of items for all namespaces, one namespace, or several namespaces queried concurrently.
+
+    ``fetch_pages(namespace)`` lists a single namespace, or every namespace when given None. With several
+    namespaces each is listed on its own thread and yielded as one page, in the order requested.
+    """
+    if all_namespaces:
+        yield from fetch_pages(None)
+        return
+    if len(namespaces) == 1:
+        yield from fetch_pages(namespaces[0])
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_REQUESTS, len(namespaces))) as executor:
+        yield from executor.map(lambda namespace: [item for page in fetch_pages(namespace) for item in page], namespaces)
+
+
+def parse_cpu(cpu_str: str, return_number: bool = False):
+    """Convert Kubernetes CPU units to human-readable format (millicores)."""
+    millicores = quantity.parse_quantity(cpu_str) * 1000
+    if return_number:
+        return millicores
+    if cpu_str.endswith("m"):
+        return cpu_str
+    return quantity.format_cpu([millicores / 1000])[0]
 
 
 def parse_memory(mem_str: str, return_number: bool = False):
     """Convert Kubernetes memory units to human-readable format."""
-    units = {"Ki": 1024, "Mi": 1024**2, "Gi": 1024**3, "Ti": 1024**4}
-    match = re.match(r"^(\d+)(Ki|Mi|Gi|Ti)?$", mem_str)
-    if not match:
+    bytes_val = quantity.parse_quantity(mem_str)
+    if math.isnan(bytes_val):
         return mem_str
-    value = int(match.group(1))
-    unit = match.group(2) or ""
-    bytes_val = value * units.get(unit, 1)
     if return_number:
         return bytes_val
-    else:
-        if bytes_val >= 1024**3:
-            return f"{bytes_val / 1024**3:.2f} Gi"
-        elif bytes_val >= 1024**2:
-            return f"{bytes_val / 1024**2:.2f} Mi"
-        elif bytes_val >= 1024:
-            return f"{bytes_val / 1024:.2f} Ki"
-        return f"{bytes_val} B"
+    return quantity.format_memory([bytes_val])[0]
 
 
-def calculate_cpu_percentage(usage, limit):
-    if usage is None or limit is None or not (usage[:-1].isdigit() or usage.isdigit()) or not (limit[:-1].isdigit() or limit.isdigit()):
+def _percentage(usage, limit) -> str:
+    usage, limit = Quantity.parse(usage), Quantity.parse(limit)
+    if usage is None or not limit:
         return "-"
-    else:
-        result = parse_cpu(usage, return_number=True) / parse_cpu(limit, return_number=True) * 100
-        return f"{result:.2f}%"
+    return f"{usage / limit * 100:.2f}%"
+
+
+def calculate_cpu_percentage(usage, limit):
+    return _percentage(usage, limit)
 
 
 def calculate_memory_percentage(usage, limit):
-    if usage is None or limit is None or not usage[:-2].isdigit() or not limit[:-2].isdigit():
-        return "-"
-    else:
-        result = parse_memory(usage, return_number=True) / parse_memory(limit, return_number=True) * 100
-        return f"{result:.2f}%"
+    return _percentage(usage, limit)
@@ -0,0 +1,239 @@
+"""Offline validation of Kubernetes manifests against OpenAPI schemas.
+
+A schema directory holds JSON files in any of these layouts:
+
+* an OpenAPI v2 document (``swagger.json``) or a bare ``_definitions.json`` with a ``definitions`` map;
+* OpenAPI v3 documents (``/openapi/v3/apis/<group>/<version>``) with ``components.schemas``;
+* standalone per-kind schemas, as published by kubernetes-json-schema or generated from CRDs.
+
+Every file is read once and each schema is indexed by apiVersion/kind from its
+``x-kubernetes-group-version-kind`` extension (or the ``apiVersion``/``kind`` enums of standalone
+schemas). A kind is compiled into nested checker closures the first time a document uses it, so
+validating a document is a walk over the document, not over the schema.
+"""
+
+import datetime
+import json
+from collections.abc import Callable
+from functools import cache
+from pathlib import Path
+from typing import Any, Optional
+
+# (value, path, errors) -> None; appends one message per problem found.
+Checker = Callable[[Any, str, list], None]
+
+PYTHON_TYPES = {
+    "string": (str, datetime.date),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "object": (dict,),
+    "array": (list,),
+}
+
+# Definitions the API server accepts in more shapes than their declared type.
+LENIENT_TYPES = {
+    "io.k8s.apimachinery.pkg.api.resource.Quantity": ("string", "integer", "number"),
+    "io.k8s.apimachinery.pkg.util.intstr.IntOrString": ("string", "integer"),
+}
+
+
+class SchemaError(Exception):
+    """Raised when the schema directory is missing, empty or holds unreadable schemas."""
+
+
+def _type_name(value: Any) -> str:
+    for name in ("boolean", "integer", "number", "string", "object", "array"):
+        if isinstance(value, PYTHON_TYPES[name]):
+            return name
+    return "null" if value is None else type(value).__name__
+
+
+def _where(path: str) -> str:
+    # Paths are built as ".spec.containers[0].image"; the root object has an empty path.
+    return path[1:] if path else "(root)"
+
+
+def _accept(value: Any, path: str, errors: list) -> None:
+    pass
+
+
+def _api_version(group: str, version: str) -> str:
+    return f"{group}/{version}" if group else version
+
+
+def _standalone_kinds(schema: dict) -> list[tuple[str, str]]:
+    properties = schema.get("properties", {})
+    api_versions = properties.get("apiVersion", {}).get("enum", [])
+    kinds = properties.get("kind", {}).get("enum", [])
+    return [(api_version, kind) for api_version in api_versions for kind in kinds]
+
+
+class SchemaStore:
+    """Kubernetes schemas from a local directory, indexed by (apiVersion, kind) and compiled on first use.
+
+    With ``strict``, fields that are not declared by an object schema are reported, unless the schema
+    allows additional properties or sets ``x-kubernetes-preserve-unknown-fields``.
+    """
+
+    def __init__(self, schema_dir: Path, strict: bool = False):
+        self.strict = strict
+        self._definitions: dict[str, dict] = {}
+        self._index: dict[tuple[str, str], dict] = {}
+        self._compiled: dict[tuple[str, str], Checker] = {}
+        self._references: dict[str, Checker] = {}
+
+        if not schema_dir.is_dir():
+            raise SchemaError(f"Schema directory not found: {schema_dir}")
+        for schema_file in sorted(schema_dir.rglob("*.json")):
+            try:
+                with open(schema_file) as f:
+                    document = json.load(f)
+            except (OSError, ValueError) as e:
+                raise SchemaError(f"Could not read schema {schema_file}: {e}") from e
+            if isinstance(document, dict):
+                self._add_document(document)
+        if not self._index:
+            raise SchemaError(f"No Kubernetes schemas found in {schema_dir}")
+
+    def _add_document(self, document: dict) -> None:
+        definitions = document.get("definitions") or document.get("components", {}).get("schemas")
+        if definitions is None:
+            # A standalone schema for one kind, with every reference inlined.
+            definitions = {"": document}
+        for name, schema in definitions.items():
+            if not isinstance(schema, dict):
+                continue
+            if name:
+                self._definitions.setdefault(name, schema)
+            gvks = [(_api_version(gvk.get("group", ""), gvk.get("version", "")), gvk.get("kind", "")) for gvk in schema.get("x-kubernetes-group-version-kind", [])]
+            for key in gvks or _standalone_kinds(schema):
+                self._index.setdefault(key, schema)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def checker(self, api_version: str, kind: str) -> Optional[Checker]:
+        """Return the compiled checker for a kind, or None when no schema declares it."""
+        key = (api_version, kind)
+        checker = self._compiled.get(key)
+        if checker is None:
+            schema = self._index.get(key)
+            if schema is None:
+                return None
+            checker = self._compiled[key] = self._compile(schema)
+        return checker
+
+    def _reference(self, name: str) -> Checker:
+        checker = self._references.get(name)
+        if checker is None:
+            compiled = None
+
+            # Resolved on first call so self-referencing definitions (JSONSchemaProps) terminate.
+            def checker(value, path, errors):
+                nonlocal compiled
+                if compiled is None:
+                    compiled = self._compile(self._definitions.get(name, {}), name)
+                compiled(value, path, errors)
+
+            self._references[name] = checker
+        return checker
+
+    def _compile(self, schema: dict, name: str = "") -> Checker:
+        if not isinstance(schema, dict):
+            return _accept
+        if "$ref" in schema:
+            return self._reference(schema["$ref"].rpartition("/")[2])
+        if name in LENIENT_TYPES:
+            types = LENIENT_TYPES[name]
+        elif schema.get("x-kubernetes-int-or-string") or schema.get("format") == "int-or-string":
+            types = ("string", "integer")
+        else:
+            types = schema.get("type") or ()
+            types = (types,) if isinstance(types, str) else tuple(types)
+        types = tuple(kind for kind in types if kind in PYTHON_TYPES)
+        python_types = tuple(python_type for kind in types for python_type in PYTHON_TYPES[kind])
+        allow_bool = not types or "boolean" in types
+        expected = " or ".join(types)
+        enum = schema.get("enum")
+
+        properties = {key: self._compile(value) for key, value in schema.get("properties", {}).items()}
+        required = [key for key in schema.get("required", []) if isinstance(key, str)]
+        additional = schema.get("additionalProperties")
+        if isinstance(additional, dict):
+            additional = self._compile(additional)
+            closed = False
+        else:
+            open_object = additional is True or schema.get("x-kubernetes-preserve-unknown-fields") or not properties
+            closed = additional is False or (self.strict and not open_object)
+            additional = None
+        items = schema.get("items")
+        items = self._compile(items) if isinstance(items, dict) else None
+        all_of = [self._compile(sub) for sub in schema.get("allOf", [])]
+        any_of = [self._compile(sub) for sub in schema.get("anyOf", []) + schema.get("oneOf", [])]
+
+        def check(value, path, errors):
+            # The API server treats null as an omitted field.
+            if value is None:
+                return
+            if python_types and (not isinstance(value, python_types) or (not allow_bool and isinstance(value, bool))):
+                errors.append(f"{_where(path)}: expected {expected}, got {_type_name(value)}")
+                return
+            if enum is not None and value not in enum:
+                errors.append(f"{_where(path)}: {value!r} is not one of {', '.join(map(repr, enum))}")
+            if isinstance(value, dict):
+                for key in required:
+                    if key not in value:
+                        errors.append(f"{_where(path)}: missing required field {key!r}")
+                for key, item in value.items():
+                    property_checker = properties.get(key)
+                    if property_checker is not None:
+                        property_checker(item, f"{path}.{key}", errors)
+                    elif additional is not None:
+                        additional(item, f"{path}.{key}", errors)
+                    elif closed:
+                        errors.append(f"{_where(path)}: unknown field {key!r}")
+            elif isinstance(value, list) and items is not None:
+                for index, item in enumerate(value):
+                    items(item, f"{path}[{index}]", errors)
+            for sub in all_of:
+                sub(value, path, errors)
+            if any_of:
+                for sub in any_of:
+                    attempt = []
+                    sub(value, path, attempt)
+                    if not attempt:
+                        break
+                else:
+                    errors.append(f"{_where(path)}: does not match any allowed schema")
+
+        return check
+
+    def validate(self, document: Any) -> list[str]:
+        """Return the schema violations of one manifest (empty when it is valid).
+
+        ``List`` documents are validated item by item. Kinds without a schema are only reported in strict mode.
+        """
+        if not isinstance(document, dict):
+            return [f"expected a mapping, got {_type_name(document)}"]
+        api_version = document.get("apiVersion")
+        kind = document.get("kind")
+        if not isinstance(api_version, str) or not isinstance(kind, str):
+            return ["missing apiVersion or kind"]
+        if kind == "List" and api_version == "v1" and isinstance(document.get("items"), list):
+            errors = []
+            for index, item in enumerate(document["items"]):
+                errors.extend(f"items[{index}]: {error}" for error in self.validate(item))
+            return errors
+        checker = self.checker(api_version, kind)
+        if checker is None:
+            return [f"no schema for {api_version} {kind}"] if self.strict else []
+        errors = []
+        checker(document, "", errors)
+        return errors
+
+
+@cache
+def load_schema_store(schema_dir: Path, strict: bool = False) -> SchemaStore:
+    """Return the ``SchemaStore`` for a directory, loading it once per process."""
+    return SchemaStore(schema_dir, strict)
@@ -0,0 +1,33 @@
+import importlib
+
+import typer
+from typer.core import TyperGroup
+
+
+class LazyGroup(TyperGroup):
+    """Typer group whose sub-apps are imported only when they are dispatched to.
+
+    Subclasses map each subcommand name to ``("module:attribute", help)``, where the attribute is a
+    ``typer.Typer``. Running ``devopstoolbox generate password`` then never imports the Kubernetes client
+    or PyYAML, which the ``k8s`` and ``validate`` modules pull in at import time.
+    """
+
+    lazy_subcommands: dict[str, tuple[str, str]] = {}
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        return [*super().list_commands(ctx), *self.lazy_subcommands]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> TyperGroup:
+        import_path, help = self.lazy_subcommands[cmd_name]
+        module_name, attribute = import_path.split(":")
+        sub_app = getattr(importlib.import_module(module_name), attribute)
+        # get_group keeps single-command apps such as ``generate`` as groups, like add_typer did.
+        group = typer.main.get_group(sub_app)
+        group.name = cmd_name
+        group.help = help
+        return group
@@ -1,21 +1,27 @@
 import typer
 from rich import print
 
-from devopstoolbox import generate, validate
-from devopstoolbox.k8s import certificates, pods, services
+from devopstoolbox.lazy import LazyGroup
 
 __version__ = "DevOpsToolbox v0.1.0"
 
-app = typer.Typer(no_args_is_help=True)
-k8s_app = typer.Typer(no_args_is_help=True)
 
-app.add_typer(k8s_app, name="k8s", help="Kubernetes utilities")
-app.add_typer(generate.app, name="generate", help="Generate utilities")
-app.add_typer(validate.app, name="validate", help="tools for validation files")
+class RootGroup(LazyGroup):
+    # Imported on dispatch: the k8s modules load the Kubernetes client and validate loads PyYAML.
+    lazy_subcommands = {
+        "k8s": ("devopstoolbox.k8s.cli:app", "Kubernetes utilities"),
+        "generate": ("devopstoolbox.generate:app", "Generate utilities"),
+        "validate": ("devopstoolbox.validate:app", "tools for validation files"),
+    }
 
-k8s_app.add_typer(pods.app, name="pods", help="Manager Pods")
-k8s_app.add_typer(services.app, name="services", help="Manager Services")
-k8s_app.add_typer(certificates.app, name="certificates", help="Manager Certificates")
+
+app = typer.Typer(cls=RootGroup, no_args_is_help=True)
+
+
+@app.callback()
+def root():
+    # Without a callback Typer would collapse the app into its only registered command, ``version``.
+    pass
 
 
 @app.command()
@@ -0,0 +1,232 @@
+import os
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+# Directories that never hold files worth validating.
+DEFAULT_EXCLUDES = (".git", ".hg", ".svn", "node_modules")
+
+
+def _translate(pattern: str) -> str:
+    """Translate the glob part of a gitignore pattern into a regular expression."""
+    parts = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+            continue
+        if pattern.startswith("/**", index) and index + 3 == len(pattern):
+            parts.append("/.*")
+            break
+        if pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", index + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[index + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                index = end
+        elif char == "\\" and index + 1 < len(pattern):
+            index += 1
+            parts.append(re.escape(pattern[index]))
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return "".join(parts)
+
+
+class IgnoreRule:
+    """A single gitignore-style pattern, relative to the directory it was declared in."""
+
+    __slots__ = ("pattern", "negate", "dir_only", "regex")
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.negate = pattern.startswith("!")
+        if self.negate:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        prefix = "" if anchored else "(?:.*/)?"
+        self.regex = re.compile(f"{prefix}{_translate(pattern)}\\Z", re.DOTALL)
+
+    def match(self, rel_path: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        return self.regex.match(rel_path) is not None
+
+
+def parse_ignore_lines(lines: Iterable[str]) -> list[IgnoreRule]:
+    """Parse gitignore-formatted lines, skipping blanks and comments."""
+    rules = []
+    for line in lines:
+        line = line.rstrip("\n")
+        if not line.endswith("\\ "):
+            line = line.rstrip(" ")
+        if not line or line.startswith("#"):
+            continue
+        rules.append(IgnoreRule(line))
+    return rules
+
+
+class _RuleSet:
+    __slots__ = ("base", "rules")
+
+    def __init__(self, base: str, rules: list[IgnoreRule]):
+        self.base = base
+        self.rules = rules
+
+
+def _is_ignored(rule_sets: list[_RuleSet], rel_path: str, is_dir: bool) -> bool:
+    ignored = False
+    for rule_set in rule_sets:
+        if rule_set.base:
+            if not rel_path.startswith(rule_set.base + "/"):
+                continue
+            path = rel_path[len(rule_set.base) + 1 :]
+        else:
+            path = rel_path
+        for rule in rule_set.rules:
+            if rule.negate == ignored and rule.match(path, is_dir):
+                ignored = not rule.negate
+    return ignored
+
+
+def _read_gitignore(directory: str) -> list[IgnoreRule]:
+    try:
+        with open(os.path.join(directory, ".gitignore")) as f:
+            return parse_ignore_lines(f)
+    except (OSError, UnicodeDecodeError):
+        return []
+
+
+class PathFilter:
+    """Decide for individual paths under ``root`` whether ``iter_files`` would yield them.
+
+    ``.gitignore`` files are read lazily, once per directory; call ``reset`` after one changes.
+    """
+
+    def __init__(self, root: Path, extensions: Iterable[str], excludes: Iterable[str] = (), use_gitignore: bool = True):
+        self.root = root
+        self.suffixes = tuple(extensions)
+        self.use_gitignore = use_gitignore
+        self._base_rules = [_RuleSet("", parse_ignore_lines([*DEFAULT_EXCLUDES, *excludes]))]
+        self._rule_sets: dict[str, list[_RuleSet]] = {}
+
+    def reset(self) -> None:
+        self._rule_sets.clear()
+
+    def _rules_for(self, rel_dir: str) -> list[_RuleSet]:
+        rule_sets = self._rule_sets.get(rel_dir)
+        if rule_sets is None:
+            rule_sets = self._rules_for(rel_dir.rpartition("/")[0]) if rel_dir else self._base_rules
+            if self.use_gitignore:
+                rules = _read_gitignore(os.path.join(self.root, rel_dir))
+                if rules:
+                    rule_sets = [*rule_sets, _RuleSet(rel_dir, rules)]
+            self._rule_sets[rel_dir] = rule_sets
+        return rule_sets
+
+    def _pruned(self, parts: tuple[str, ...]) -> bool:
+        for depth in range(1, len(parts) + 1):
+            if _is_ignored(self._rules_for("/".join(parts[: depth - 1])), "/".join(parts[:depth]), True):
+                return True
+        return False
+
+    def prunes(self, directory: Path) -> bool:
+        """Return whether ``iter_files`` would skip ``directory``: it is outside ``root``, excluded or inside an excluded directory."""
+        try:
+            parts = directory.relative_to(self.root).parts
+        except ValueError:
+            return True
+        return self._pruned(parts)
+
+    def __call__(self, path: Path) -> bool:
+        if not path.name.endswith(self.suffixes):
+            return False
+        try:
+            parts = path.relative_to(self.root).parts
+        except ValueError:
+            return False
+        if self._pruned(parts[:-1]):
+            return False
+        return not _is_ignored(self._rules_for("/".join(parts[:-1])), "/".join(parts), False)
+
+
+def filter_files(paths: Iterable[Path], root: Path, extensions: Iterable[str], excludes: Iterable[str] = ()) -> Iterator[Path]:
+    """Yield the ``paths`` under ``root`` that ``iter_files`` would have kept, ignoring ``.gitignore`` files."""
+    return filter(PathFilter(root, extensions, excludes, use_gitignore=False), paths)
+
+
+def iter_files(
+    root: Path,
+    extensions: Iterable[str],
+    excludes: Iterable[str] = (),
+    use_gitignore: bool = True,
+    follow_symlinks: bool = False,
+) -> Iterator[Path]:
+    """Walk ``root`` once with ``os.scandir`` and yield files ending with any of ``extensions``.
+
+    Directories matching ``DEFAULT_EXCLUDES``, the gitignore-style ``excludes`` patterns or, when
+    ``use_gitignore`` is set, any ``.gitignore`` found along the way are pruned without being read.
+    Symlinked directories are only entered with ``follow_symlinks``; each physical directory is
+    visited at most once, so symlink loops terminate.
+    """
+    suffixes = tuple(extensions)
+    base_rules = [_RuleSet("", parse_ignore_lines([*DEFAULT_EXCLUDES, *excludes]))]
+    visited = set()
+    # Each entry: (absolute directory, path relative to root, rule sets in effect).
+    stack = [(str(root), "", base_rules)]
+    while stack:
+        directory, rel_dir, rule_sets = stack.pop()
+        try:
+            stat = os.stat(directory)
+        except OSError:
+            continue
+        if (stat.st_dev, stat.st_ino) in visited:
+            continue
+        visited.add((stat.st_dev, stat.st_ino))
+
+        if use_gitignore:
+            rules = _read_gitignore(directory)
+            if rules:
+                rule_sets = [*rule_sets, _RuleSet(rel_dir, rules)]
+
+        try:
+            with os.scandir(directory) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+            except OSError:
+                continue
+            if _is_ignored(rule_sets, rel_path, is_dir):
+                continue
+            if is_dir:
+                subdirectories.append((entry.path, rel_path, rule_sets))
+            elif entry.name.endswith(suffixes):
+                try:
+                    if entry.is_file():
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+        stack.extend(reversed(subdirectories))
@@ -1,36 +1,119 @@
 import json as pyjson
+import os
+import tempfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Optional
 
 import typer
 import yaml as pyyaml
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 
+from devopstoolbox.cache import FileStamp, ValidationCache, file_stamp
+from devopstoolbox.gitdiff import GitError, changed_files, export_staged
+from devopstoolbox.jsonstream import validate_json_stream
+from devopstoolbox.k8sschema import SchemaError, load_schema_store
+from devopstoolbox.scanner import filter_files, iter_files
+from devopstoolbox.watcher import create_watcher
+
 app = typer.Typer(no_args_is_help=True)
 console = Console()
 
+# Upper bound for the number of files shipped to a worker process in one batch.
+MAX_CHUNK_SIZE = 256
 
-def validate_yaml_file(file_path: Path) -> tuple[bool, str]:
-    """Validate a single YAML file and return (is_valid, error_message)."""
+# JSON files larger than this are validated with the constant-memory streaming parser.
+JSON_STREAM_THRESHOLD = 64 * 1024 * 1024
+
+
+class OutputFormat(str, Enum):
+    table = "table"
+    text = "text"
+    jsonl = "jsonl"
+
+
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise.
+YAML_LOADER = getattr(pyyaml, "CSafeLoader", pyyaml.SafeLoader)
+
+
+def _load_yaml(file_path: Path, loader: type) -> None:
+    with open(file_path) as f:
+        for _ in pyyaml.load_all(f, Loader=loader):
+            pass
+
+
+def _format_yaml_error(e: pyyaml.YAMLError) -> str:
+    if hasattr(e, "problem_mark"):
+        mark = e.problem_mark
+        return f"Line {mark.line + 1}, Column {mark.column + 1}: {e.problem}"
+    return str(e)
+
+
+def _scan_yaml(file_path: Path, loader: type) -> None:
+    """Drive the parser over the event stream without composing nodes or constructing objects.
+
+    Alias and anchor checks normally done by the composer are replayed on the events, so the
+    only errors this skips are constructor ones (unknown tags, unhashable keys, bad ``!!int`` values).
+    """
+    anchors = {}
+    with open(file_path) as f:
+        for event in pyyaml.parse(f, Loader=loader):
+            if isinstance(event, pyyaml.DocumentStartEvent):
+                anchors.clear()
+            elif isinstance(event, pyyaml.AliasEvent):
+                if event.anchor not in anchors:
+                    raise pyyaml.composer.ComposerError(None, None, f"found undefined alias {event.anchor!r}", event.start_mark)
+            elif isinstance(event, pyyaml.NodeEvent) and event.anchor is not None:
+                if event.anchor in anchors:
+                    raise pyyaml.composer.ComposerError(f"found duplicate anchor {event.anchor!r}; first occurrence", anchors[event.anchor], "second occurrence", event.start_mark)
+                anchors[event.anchor] = event.start_mark
+
+
+def _check_yaml(file_path: Path, check: Callable[[Path, type], None]) -> tuple[bool, str]:
     try:
-        with open(file_path) as f:
-            list(pyyaml.safe_load_all(f))
+        check(file_path, YAML_LOADER)
         return True, ""
     except pyyaml.YAMLError as e:
-        if hasattr(e, "problem_mark"):
-            mark = e.problem_mark
-            return False, f"Line {mark.line + 1}, Column {mark.column + 1}: {e.problem}"
-        return False, str(e)
+        error = e
     except Exception as e:
         return False, str(e)
 
+    if YAML_LOADER is not pyyaml.SafeLoader:
+        # libyaml words its problems differently; replay the file with the pure-Python loader
+        # so the reported message does not depend on how PyYAML was built.
+        try:
+            check(file_path, pyyaml.SafeLoader)
+        except pyyaml.YAMLError as e:
+            error = e
+        except Exception as e:
+            return False, str(e)
+    return False, _format_yaml_error(error)
+
+
+def validate_yaml_file(file_path: Path) -> tuple[bool, str]:
+    """Validate a single YAML file and return (is_valid, error_message)."""
+    return _check_yaml(file_path, _load_yaml)
+
+
+def validate_yaml_syntax(file_path: Path) -> tuple[bool, str]:
+    """Validate a single YAML file's syntax without building Python objects and return (is_valid, error_message)."""
+    return _check_yaml(file_path, _scan_yaml)
+
 
 def validate_json_file(file_path: Path) -> tuple[bool, str]:
     """Validate a single JSON file and return (is_valid, error_message)."""
     try:
         with open(file_path) as f:
-            pyjson.load(f)
+            if os.fstat(f.fileno()).st_size > JSON_STREAM_THRESHOLD:
+                validate_json_stream(f)
+            else:
+                pyjson.load(f)
         return True, ""
     except pyjson.JSONDecodeError as e:
         line = getattr(e, "lineno", None)
@@ -42,13 +125,106 @@ def validate_json_file(file_path: Path) -> tuple[bool, str]:
         return False, str(e)
 
 
-@app.command()
-def yaml(
-    file: Annotated[Path, typer.Option("--file", "-f", exists=True, file_okay=True, dir_okay=False, resolve_path=True)] = None,
-    directory: Annotated[Path, typer.Option("--directory", "-d", exists=True, file_okay=False, dir_okay=True, resolve_path=True)] = None,
-):
-    """Validate YAML files for syntax errors."""
-    if file is None and directory is None:
+def validate_k8s_manifest_file(file_path: Path, schema_dir: Path, strict: bool = False) -> tuple[bool, str]:
+    """Validate every Kubernetes manifest in a YAML file against the schemas in ``schema_dir`` and return (is_valid, error_message)."""
+    try:
+        with open(file_path) as f:
+            documents = list(pyyaml.load_all(f, Loader=YAML_LOADER))
+    except pyyaml.YAMLError:
+        return _check_yaml(file_path, _load_yaml)
+    except Exception as e:
+        return False, str(e)
+
+    try:
+        store = load_schema_store(schema_dir, strict)
+    except SchemaError as e:
+        return False, str(e)
+
+    errors = []
+    for number, document in enumerate(documents, start=1):
+        if document is None:
+            continue
+        problems = store.validate(document)
+        if problems:
+            name = document.get("metadata", {}).get("name") if isinstance(document, dict) and isinstance(document.get("metadata"), dict) else None
+            label = " ".join(str(part) for part in (document.get("kind") if isinstance(document, dict) else None, name) if part)
+            prefix = f"Document {number} ({label})" if label else f"Document {number}"
+            errors.extend(f"{prefix}: {problem}" for problem in problems)
+    return not errors, "; ".join(errors)
+
+
+def _chunk_size(total: int, jobs: int) -> int:
+    """Split the work in roughly four batches per worker to balance uneven file sizes."""
+    return max(1, min(MAX_CHUNK_SIZE, total // (jobs * 4)))
+
+
+def _validate_files(files: list[Path], validator: Callable[[Path], tuple[bool, str]], jobs: int) -> Iterator[tuple[Path, bool, str]]:
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(files) < 2:
+        for file_path in files:
+            yield (file_path, *validator(file_path))
+        return
+
+    jobs = min(jobs, len(files))
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        results = executor.map(validator, files, chunksize=_chunk_size(len(files), jobs))
+        for file_path, result in zip(files, results):
+            yield (file_path, *result)
+    finally:
+        # Drop chunks that have not started when the consumer stops early (--fail-fast).
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _stamped(validator: Callable[[Path], tuple[bool, str]], file_path: Path) -> tuple[Optional[FileStamp], bool, str]:
+    # Stamp before validating, and in the worker, so the recorded stamp never describes newer content than the result.
+    stamp = file_stamp(file_path)
+    return (stamp, *validator(file_path))
+
+
+def run_validation(
+    files: list[Path],
+    validator: Callable[[Path], tuple[bool, str]],
+    jobs: int = 1,
+    cache: Optional[ValidationCache] = None,
+) -> Iterator[tuple[Path, bool, str]]:
+    """Validate files with the given validator, yielding (path, is_valid, error) in input order.
+
+    When ``jobs`` is greater than one the files are fanned out in chunks to a process pool;
+    results are still yielded in the same order as ``files``. Files with a result in ``cache``
+    are not parsed again, and fresh results are recorded in it.
+    """
+    if cache is None:
+        yield from _validate_files(files, validator, jobs)
+        return
+
+    cached = [cache.get(file_path) for file_path in files]
+    fresh = _validate_files([file_path for file_path, result in zip(files, cached) if result is None], partial(_stamped, validator), jobs)
+    try:
+        for file_path, result in zip(files, cached):
+            if result is None:
+                _, stamp, is_valid, error = next(fresh)
+                if stamp is not None:
+                    cache.put(file_path, is_valid, error, stamp)
+            else:
+                is_valid, error = result
+            yield file_path, is_valid, error
+    finally:
+        fresh.close()
+
+
+def _collect_files(
+    file: Optional[Path],
+    directory: Optional[Path],
+    extensions: tuple[str, ...],
+    exclude: Optional[list[str]],
+    gitignore: bool,
+    follow_symlinks: bool,
+    changed_since: Optional[str],
+    staged: bool,
+) -> list[Path]:
+    git_mode = changed_since is not None or staged
+    if file is None and directory is None and not git_mode:
         console.print("[red]Error: You must provide either a file or a directory.[/red]")
         raise typer.Exit(1)
 
@@ -56,84 +232,284 @@ def yaml(
         console.print("[red]Error: Provide either a file or a directory, not both.[/red]")
         raise typer.Exit(1)
 
-    files_to_validate = []
+    if git_mode and (file or (changed_since is not None and staged)):
+        console.print("[red]Error: --changed-since and --staged cannot be combined with each other or with --file.[/red]")
+        raise typer.Exit(1)
+
     if file:
-        files_to_validate.append(file)
-    elif directory:
-        files_to_validate.extend(directory.glob("**/*.yaml"))
-        files_to_validate.extend(directory.glob("**/*.yml"))
+        return [file]
+    if git_mode:
+        root = directory or Path.cwd().resolve()
+        try:
+            changed = changed_files(root, since=changed_since, staged=staged)
+        except GitError as e:
+            console.print(f"[red]Error: {escape(str(e))}[/red]")
+            raise typer.Exit(1) from None
+        return list(filter_files(changed, root, extensions, exclude or ()))
+    return list(iter_files(directory, extensions, exclude or (), gitignore, follow_symlinks))
 
-    if not files_to_validate:
-        console.print("[yellow]No YAML files found.[/yellow]")
-        raise typer.Exit(0)
 
-    table = Table(title="YAML Validation Results")
-    table.add_column("File", style="cyan")
-    table.add_column("Status", justify="center")
-    table.add_column("Error", style="red")
+@contextmanager
+def _sources(files: list[Path], staged: bool) -> Iterator[dict[Path, Path]]:
+    """Yield ``{path to validate: path to report}`` for ``files``.
+
+    With ``staged`` the index content of each file is written to a temporary directory and validated
+    instead of the working tree, which may hold edits that are not part of the commit.
+    """
+    if not staged:
+        yield {file_path: file_path for file_path in files}
+        return
+    with tempfile.TemporaryDirectory(prefix="devopstoolbox-staged-") as snapshot:
+        try:
+            copies = export_staged(files, Path(snapshot))
+        except GitError as e:
+            console.print(f"[red]Error: {escape(str(e))}[/red]")
+            raise typer.Exit(1) from None
+        yield copies
+
+
+def _report(
+    title: str,
+    files: list[Path],
+    validator: Callable[[Path], tuple[bool, str]],
+    jobs: int,
+    cache: Optional[ValidationCache],
+    output_format: OutputFormat,
+    only_errors: bool,
+    fail_fast: bool,
+    staged: bool = False,
+):
+    table = None
+    if output_format == OutputFormat.table:
+        table = Table(title=title)
+        table.add_column("File", style="cyan")
+        table.add_column("Status", justify="center")
+        table.add_column("Error", style="red")
 
     valid_count = 0
     invalid_count = 0
 
-    for yaml_file in sorted(files_to_validate):
-        is_valid, error = validate_yaml_file(yaml_file)
-        if is_valid:
-            valid_count += 1
-            table.add_row(str(yaml_file), "[green]Valid[/green]", "")
-        else:
-            invalid_count += 1
-            table.add_row(str(yaml_file), "[red]Invalid[/red]", error)
+    with _sources(sorted(files), staged) as sources:
+        results = run_validation(list(sources), validator, jobs, cache)
+        try:
+            for file_path, is_valid, error in results:
+                file_path = sources[file_path]
+                if is_valid:
+                    valid_count += 1
+                else:
+                    invalid_count += 1
+
+                if not (is_valid and only_errors):
+                    if output_format == OutputFormat.jsonl:
+                        typer.echo(pyjson.dumps({"file": str(file_path), "valid": is_valid, "error": error}))
+                    elif output_format == OutputFormat.text:
+                        status = "[green]VALID[/green]" if is_valid else "[red]INVALID[/red]"
+                        console.print(f"{status} {escape(str(file_path))}" + (f": {escape(error)}" if error else ""), highlight=False, soft_wrap=True)
+                    elif is_valid:
+                        table.add_row(escape(str(file_path)), "[green]Valid[/green]", "")
+                    else:
+                        table.add_row(escape(str(file_path)), "[red]Invalid[/red]", escape(error))
 
-    console.print(table)
-    console.print(f"\n[bold]Summary:[/bold] {valid_count} valid, {invalid_count} invalid")
+                if fail_fast and not is_valid:
+                    break
+        finally:
+            results.close()
+            if cache is not None:
+                cache.save()
+
+    if table is not None:
+        console.print(table)
+    if output_format != OutputFormat.jsonl:
+        console.print(f"\n[bold]Summary:[/bold] {valid_count} valid, {invalid_count} invalid")
 
     if invalid_count > 0:
         raise typer.Exit(1)
 
 
+def _print_event(event: str, file_path: Path, error: str, output_format: OutputFormat) -> None:
+    if output_format == OutputFormat.jsonl:
+        typer.echo(pyjson.dumps({"event": event.lower(), "file": str(file_path), "valid": event not in ("INVALID", "REMOVED"), "error": error}))
+        return
+    color = {"INVALID": "red", "FIXED": "green", "VALID": "green", "REMOVED": "yellow"}[event]
+    console.print(f"[{color}]{event}[/{color}] {escape(str(file_path))}" + (f": {escape(error)}" if error else ""), highlight=False, soft_wrap=True)
+
+
+def _watch(
+    directory: Path,
+    extensions: tuple[str, ...],
+    validator: Callable[[Path], tuple[bool, str]],
+    jobs: int,
+    cache: Optional[ValidationCache],
+    exclude: Optional[list[str]],
+    gitignore: bool,
+    follow_symlinks: bool,
+    output_format: OutputFormat,
+    only_errors: bool,
+):
+    """Validate ``directory`` once, then re-validate only the files that change until interrupted."""
+    watcher = create_watcher(directory, extensions, exclude or (), gitignore, follow_symlinks)
+    results = {}
+
+    def summary():
+        if output_format != OutputFormat.jsonl:
+            invalid_count = sum(1 for is_valid, _ in results.values() if not is_valid)
+            console.print(f"[bold]Summary:[/bold] {len(results) - invalid_count} valid, {invalid_count} invalid")
+
+    try:
+        for file_path, is_valid, error in run_validation(watcher.files(), validator, jobs, cache):
+            results[file_path] = (is_valid, error)
+            if not is_valid:
+                _print_event("INVALID", file_path, error, output_format)
+        summary()
+        if output_format != OutputFormat.jsonl:
+            console.print(f"[dim]Watching {escape(str(directory))} for changes (Ctrl+C to stop)...[/dim]")
+
+        while True:
+            changed, removed = watcher.wait()
+            if not changed and not removed:
+                continue
+            for file_path in sorted(removed):
+                if results.pop(file_path, None) is not None:
+                    _print_event("REMOVED", file_path, "", output_format)
+            # Edits arrive a few files at a time; validating them in-process beats starting a pool.
+            for file_path, is_valid, error in run_validation(sorted(changed), validator, 1, cache):
+                previous = results.get(file_path)
+                results[file_path] = (is_valid, error)
+                if not is_valid:
+                    _print_event("INVALID", file_path, error, output_format)
+                elif previous is not None and not previous[0]:
+                    _print_event("FIXED", file_path, "", output_format)
+                elif not only_errors:
+                    _print_event("VALID", file_path, "", output_format)
+            summary()
+            if cache is not None:
+                cache.save()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        if cache is not None:
+            cache.save()
+
+    if any(not is_valid for is_valid, _ in results.values()):
+        raise typer.Exit(1)
+
+
+def _check_watch(watch: bool, directory: Optional[Path], file: Optional[Path], changed_since: Optional[str], staged: bool, fail_fast: bool) -> None:
+    if watch and (directory is None or file or changed_since is not None or staged or fail_fast):
+        console.print("[red]Error: --watch requires --directory and cannot be combined with --file, --changed-since, --staged or --fail-fast.[/red]")
+        raise typer.Exit(1)
+
+
+@app.command()
+def yaml(
+    file: Annotated[Path, typer.Option("--file", "-f", exists=True, file_okay=True, dir_okay=False, resolve_path=True)] = None,
+    directory: Annotated[Path, typer.Option("--directory", "-d", exists=True, file_okay=False, dir_okay=True, resolve_path=True)] = None,
+    jobs: Annotated[int, typer.Option("--jobs", "-j", min=0, help="Number of worker processes (0 uses all CPUs).")] = 1,
+    cache: Annotated[bool, typer.Option("--cache/--no-cache", help="Skip files whose content is unchanged since the last cached run.")] = False,
+    syntax_only: Annotated[bool, typer.Option("--syntax-only", help="Only parse the event stream; skip building Python objects.")] = False,
+    exclude: Annotated[list[str], typer.Option("--exclude", "-e", help="Gitignore-style pattern of paths to skip (repeatable).")] = None,
+    gitignore: Annotated[bool, typer.Option("--gitignore/--no-gitignore", help="Skip paths ignored by .gitignore files.")] = True,
+    follow_symlinks: Annotated[bool, typer.Option("--follow-symlinks", help="Descend into symlinked directories.")] = False,
+    output_format: Annotated[OutputFormat, typer.Option("--format", help="table buffers all rows; text and jsonl print each result as it finishes.")] = OutputFormat.table,
+    only_errors: Annotated[bool, typer.Option("--only-errors", help="Only show invalid files.")] = False,
+    fail_fast: Annotated[bool, typer.Option("--fail-fast", help="Stop at the first invalid file.")] = False,
+    changed_since: Annotated[str, typer.Option("--changed-since", help="Only validate files changed since this git ref (branch point with HEAD).")] = None,
+    staged: Annotated[bool, typer.Option("--staged", help="Only validate files staged in the git index, as they are staged.")] = False,
+    watch: Annotated[bool, typer.Option("--watch", "-w", help="Keep running and re-validate files as they change.")] = False,
+):
+    """Validate YAML files for syntax errors."""
+    _check_watch(watch, directory, file, changed_since, staged, fail_fast)
+    validator, cache_name = (validate_yaml_syntax, "yaml-syntax") if syntax_only else (validate_yaml_file, "yaml")
+    # Staged content is validated from temporary copies, whose paths never repeat.
+    validation_cache = ValidationCache.open(cache_name) if cache and not staged else None
+    if watch:
+        _watch(directory, (".yaml", ".yml"), validator, jobs, validation_cache, exclude, gitignore, follow_symlinks, output_format, only_errors)
+        return
+
+    files_to_validate = _collect_files(file, directory, (".yaml", ".yml"), exclude, gitignore, follow_symlinks, changed_since, staged)
+
+    if not files_to_validate:
+        console.print("[yellow]No YAML files found.[/yellow]")
+        raise typer.Exit(0)
+
+    _report("YAML Validation Results", files_to_validate, validator, jobs, validation_cache, output_format, only_errors, fail_fast, staged)
+
+
 @app.command()
 def json(
     file: Annotated[Path, typer.Option("--file", "-f", exists=True, file_okay=True, dir_okay=False, resolve_path=True)] = None,
     directory: Annotated[Path, typer.Option("--directory", "-d", exists=True, file_okay=False, dir_okay=True, resolve_path=True)] = None,
+    jobs: Annotated[int, typer.Option("--jobs", "-j", min=0, help="Number of worker processes (0 uses all CPUs).")] = 1,
+    cache: Annotated[bool, typer.Option("--cache/--no-cache", help="Skip files whose content is unchanged since the last cached run.")] = False,
+    exclude: Annotated[list[str], typer.Option("--exclude", "-e", help="Gitignore-style pattern of paths to skip (repeatable).")] = None,
+    gitignore: Annotated[bool, typer.Option("--gitignore/--no-gitignore", help="Skip paths ignored by .gitignore files.")] = True,
+    follow_symlinks: Annotated[bool, typer.Option("--follow-symlinks", help="Descend into symlinked directories.")] = False,
+    output_format: Annotated[OutputFormat, typer.Option("--format", help="table buffers all rows; text and jsonl print each result as it finishes.")] = OutputFormat.table,
+    only_errors: Annotated[bool, typer.Option("--only-errors", help="Only show invalid files.")] = False,
+    fail_fast: Annotated[bool, typer.Option("--fail-fast", help="Stop at the first invalid file.")] = False,
+    changed_since: Annotated[str, typer.Option("--changed-since", help="Only validate files changed since this git ref (branch point with HEAD).")] = None,
+    staged: Annotated[bool, typer.Option("--staged", help="Only validate files staged in the git index, as they are staged.")] = False,
+    watch: Annotated[bool, typer.Option("--watch", "-w", help="Keep running and re-validate files as they change.")] = False,
 ):
     """Validate JSON files for syntax errors."""
-    if file is None and directory is None:
-        console.print("[red]Error: You must provide either a file or a directory.[/red]")
-        raise typer.Exit(1)
-
-    if file and directory:
-        console.print("[red]Error: Provide either a file or a directory, not both.[/red]")
-        raise typer.Exit(1)
+    _check_watch(watch, directory, file, changed_since, staged, fail_fast)
+    # Staged content is validated from temporary copies, whose paths never repeat.
+    validation_cache = ValidationCache.open("json") if cache and not staged else None
+    if watch:
+        _watch(directory, (".json",), validate_json_file, jobs, validation_cache, exclude, gitignore, follow_symlinks, output_format, only_errors)
+        return
 
-    files_to_validate = []
-    if file:
-        files_to_validate.append(file)
-    elif directory:
-        files_to_validate.extend(directory.glob("**/*.json"))
+    files_to_validate = _collect_files(file, directory, (".json",), exclude, gitignore, follow_symlinks, changed_since, staged)
 
     if not files_to_validate:
         console.print("[yellow]No JSON files found.[/yellow]")
         raise typer.Exit(0)
 
-    table = Table(title="JSON Validation Results")
-    table.add_column("File", style="cyan")
-    table.add_column("Status", justify="center")
-    table.add_column("Error", style="red")
+    _report("JSON Validation Results", files_to_validate, validate_json_file, jobs, validation_cache, output_format, only_errors, fail_fast, staged)
 
-    valid_count = 0
-    invalid_count = 0
 
-    for json_file in sorted(files_to_validate):
-        is_valid, error = validate_json_file(json_file)
-        if is_valid:
-            valid_count += 1
-            table.add_row(str(json_file), "[green]Valid[/green]", "")
-        else:
-            invalid_count += 1
-            table.add_row(str(json_file), "[red]Invalid[/red]", error)
+@app.command()
+def k8s_manifests(
+    schema_dir: Annotated[
+        Path,
+        typer.Option(
+            "--schema-dir",
+            "-s",
+            envvar="DEVOPSTOOLBOX_K8S_SCHEMA_DIR",
+            exists=True,
+            file_okay=False,
+            dir_okay=True,
+            resolve_path=True,
+            help="Directory of Kubernetes OpenAPI/JSON schemas (swagger.json, OpenAPI v3 or per-kind files).",
+        ),
+    ],
+    file: Annotated[Path, typer.Option("--file", "-f", exists=True, file_okay=True, dir_okay=False, resolve_path=True)] = None,
+    directory: Annotated[Path, typer.Option("--directory", "-d", exists=True, file_okay=False, dir_okay=True, resolve_path=True)] = None,
+    strict: Annotated[bool, typer.Option("--strict", help="Report unknown fields and kinds without a schema.")] = False,
+    jobs: Annotated[int, typer.Option("--jobs", "-j", min=0, help="Number of worker processes (0 uses all CPUs).")] = 1,
+    exclude: Annotated[list[str], typer.Option("--exclude", "-e", help="Gitignore-style pattern of paths to skip (repeatable).")] = None,
+    gitignore: Annotated[bool, typer.Option("--gitignore/--no-gitignore", help="Skip paths ignored by .gitignore files.")] = True,
+    follow_symlinks: Annotated[bool, typer.Option("--follow-symlinks", help="Descend into symlinked directories.")] = False,
+    output_format: Annotated[OutputFormat, typer.Option("--format", help="table buffers all rows; text and jsonl print each result as it finishes.")] = OutputFormat.table,
+    only_errors: Annotated[bool, typer.Option("--only-errors", help="Only show invalid files.")] = False,
+    fail_fast: Annotated[bool, typer.Option("--fail-fast", help="Stop at the first invalid file.")] = False,
+    changed_since: Annotated[str, typer.Option("--changed-since", help="Only validate files changed since this git ref (branch point with HEAD).")] = None,
+    staged: Annotated[bool, typer.Option("--staged", help="Only validate files staged in the git index, as they are staged.")] = False,
+):
+    """Validate Kubernetes manifests against OpenAPI schemas from a local directory."""
+    try:
+        # Load the index once up front: errors surface before any file, and forked workers inherit it.
+        load_schema_store(schema_dir, strict)
+    except SchemaError as e:
+        console.print(f"[red]Error: {escape(str(e))}[/red]")
+        raise typer.Exit(1) from None
+
+    files_to_validate = _collect_files(file, directory, (".yaml", ".yml"), exclude, gitignore, follow_symlinks, changed_since, staged)
 
-    console.print(table)
-    console.print(f"\n[bold]Summary:[/bold] {valid_count} valid, {invalid_count} invalid")
+    if not files_to_validate:
+        console.print("[yellow]No YAML files found.[/yellow]")
+        raise typer.Exit(0)
 
-    if invalid_count > 0:
-        raise typer.Exit(1)
+    validator = partial(validate_k8s_manifest_file, schema_dir=schema_dir, strict=strict)
+    _report("Kubernetes Manifest Validation Results", files_to_validate, validator, jobs, None, output_format, only_errors, fail_fast, staged)
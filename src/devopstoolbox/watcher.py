@@ -0,0 +1,158 @@
+import os
+import queue
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from devopstoolbox.scanner import PathFilter, iter_files
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - exercised when the optional dependency is missing
+    FileSystemEventHandler = object
+    Observer = None
+
+# How long to keep collecting events after the first one, so an editor's write+rename is one batch.
+DEBOUNCE_SECONDS = 0.02
+POLL_INTERVAL_SECONDS = 0.5
+
+
+class PollingWatcher:
+    """Detect changed files by re-scanning the tree and comparing size and mtime."""
+
+    def __init__(self, root: Path, extensions: Iterable[str], excludes: Iterable[str] = (), use_gitignore: bool = True, follow_symlinks: bool = False):
+        self.root = root
+        self.extensions = tuple(extensions)
+        self.excludes = tuple(excludes)
+        self.use_gitignore = use_gitignore
+        self.follow_symlinks = follow_symlinks
+        self.interval = POLL_INTERVAL_SECONDS
+        self.snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot = {}
+        for path in iter_files(self.root, self.extensions, self.excludes, self.use_gitignore, self.follow_symlinks):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def files(self) -> list[Path]:
+        return sorted(self.snapshot)
+
+    def wait(self, timeout: float = None) -> tuple[set[Path], set[Path]]:
+        """Sleep one interval and return the (changed, removed) files since the previous call."""
+        time.sleep(self.interval if timeout is None else min(self.interval, timeout))
+        snapshot = self._scan()
+        changed = {path for path, signature in snapshot.items() if self.snapshot.get(path) != signature}
+        removed = set(self.snapshot) - set(snapshot)
+        self.snapshot = snapshot
+        return changed, removed
+
+    def close(self) -> None:
+        pass
+
+
+class _EventQueue(FileSystemEventHandler):
+    def __init__(self):
+        super().__init__()
+        self.events = queue.Queue()
+
+    def on_any_event(self, event):
+        if event.event_type in ("opened", "closed_no_write"):
+            return
+        self.events.put(event)
+
+
+class EventWatcher:
+    """Detect changed files from filesystem notifications (inotify, FSEvents, ...) through watchdog."""
+
+    def __init__(self, root: Path, extensions: Iterable[str], excludes: Iterable[str] = (), use_gitignore: bool = True, follow_symlinks: bool = False):
+        self.root = root
+        self.extensions = tuple(extensions)
+        self.excludes = tuple(excludes)
+        self.use_gitignore = use_gitignore
+        self.follow_symlinks = follow_symlinks
+        self.accept = PathFilter(root, self.extensions, self.excludes, use_gitignore)
+        self.known = set(iter_files(root, self.extensions, self.excludes, use_gitignore, follow_symlinks))
+        self.handler = _EventQueue()
+        self.observer = Observer()
+        self.observer.schedule(self.handler, str(root), recursive=True)
+        self.observer.start()
+
+    def files(self) -> list[Path]:
+        return sorted(self.known)
+
+    def wait(self, timeout: float = None) -> tuple[set[Path], set[Path]]:
+        """Block until filesystem events arrive and return the (changed, removed) files they touch."""
+        try:
+            events = [self.handler.events.get(timeout=timeout)]
+        except queue.Empty:
+            return set(), set()
+        deadline = time.monotonic() + DEBOUNCE_SECONDS
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                events.append(self.handler.events.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        paths = set()
+        rescan = set()
+        for event in events:
+            # The parent directory of every created, deleted or renamed file reports a modification too.
+            if event.is_directory and event.event_type == "modified":
+                continue
+            for raw_path in (event.src_path, getattr(event, "dest_path", "")):
+                if not raw_path:
+                    continue
+                path = Path(os.fsdecode(raw_path))
+                if event.is_directory:
+                    rescan.add(path)
+                elif path.name == ".gitignore":
+                    rescan.add(path.parent)
+                else:
+                    paths.add(path)
+
+        if rescan:
+            # A directory appeared, moved or a .gitignore changed: reconcile those subtrees only.
+            self.accept.reset()
+        for directory in self._outermost(rescan):
+            paths.update(self._rescan(directory))
+
+        changed = {path for path in paths if path.is_file() and self.accept(path)}
+        removed = {path for path in paths if path in self.known and path not in changed}
+        self.known = (self.known - removed) | changed
+        return changed, removed
+
+    def _outermost(self, directories: set[Path]) -> list[Path]:
+        """Drop pruned directories (``.git``, ``node_modules``, excludes) and those inside another one."""
+        outermost = []
+        for directory in sorted(directories):
+            if self.accept.prunes(directory) or any(directory.is_relative_to(parent) for parent in outermost):
+                continue
+            outermost.append(directory)
+        return outermost
+
+    def _rescan(self, directory: Path) -> set[Path]:
+        """Return the files under ``directory`` that appeared or disappeared since they were last seen.
+
+        Only that subtree is walked, with the same pruning as the initial scan; the filter then applies
+        the ``.gitignore`` files and anchored patterns of the directories above it.
+        """
+        known = {path for path in self.known if path.is_relative_to(directory)}
+        current = {path for path in known if path.exists() and self.accept(path)}
+        current.update(path for path in iter_files(directory, self.extensions, self.excludes, self.use_gitignore, self.follow_symlinks) if self.accept(path))
+        return current ^ known
+
+    def close(self) -> None:
+        self.observer.stop()
+        self.observer.join()
+
+
+def create_watcher(root: Path, extensions: Iterable[str], excludes: Iterable[str] = (), use_gitignore: bool = True, follow_symlinks: bool = False):
+    """Return an ``EventWatcher`` when watchdog is installed, a ``PollingWatcher`` otherwise."""
+    watcher_class = EventWatcher if Observer is not None else PollingWatcher
+    return watcher_class(root, extensions, excludes, use_gitignore, follow_symlinks)
@@ -1,5 +1,78 @@
 """Pytest configuration and shared fixtures."""
 
+import json
+import socket
+from unittest.mock import Mock
+
+import pytest
+
+from devopstoolbox.k8s import kubeconfig, utils
 
 # Note: Each test file patches kubernetes config at import time.
 # This conftest provides additional shared fixtures if needed.
+
+KUBECONFIG = """apiVersion: v1
+kind: Config
+current-context: prod
+clusters:
+  - name: prod
+    cluster: {server: "https://prod.example.com", insecure-skip-tls-verify: true}
+  - name: stage
+    cluster: {server: "https://stage.example.com", insecure-skip-tls-verify: true}
+contexts:
+  - name: prod
+    context: {cluster: prod, user: admin, namespace: payments}
+  - name: stage
+    context: {cluster: stage, user: admin}
+users:
+  - name: admin
+    user: {token: secret-token}
+"""
+
+
+@pytest.fixture(autouse=True)
+def reset_api_clients():
+    """Do not let one test's shared API clients, parsed kubeconfig or their settings leak into the next."""
+    yield
+    utils.reset_api_clients()
+    utils.configure_api_clients()
+    kubeconfig.reset_kube_config()
+    kubeconfig.configure_kube_config()
+
+
+@pytest.fixture
+def kubeconfig_file(tmp_path, monkeypatch):
+    """Point KUBECONFIG at a file with a current ``prod`` context (namespace ``payments``) and a ``stage`` context."""
+    path = tmp_path / "kubeconfig"
+    path.write_text(KUBECONFIG)
+    monkeypatch.setenv("KUBECONFIG", str(path))
+    return path
+
+
+@pytest.fixture
+def silent_apiserver(tmp_path):
+    """Listen on a local port that accepts connections but never answers, and return a kubeconfig whose contexts point at it."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(16)
+    path = tmp_path / "silent-kubeconfig"
+    path.write_text(
+        KUBECONFIG.replace("https://prod.example.com", f"http://127.0.0.1:{server.getsockname()[1]}").replace(
+            "https://stage.example.com", f"http://127.0.0.1:{server.getsockname()[1]}"
+        )
+    )
+    yield path
+    server.close()
+
+
+@pytest.fixture
+def list_response():
+    """Build the raw response of a Kubernetes list call made with ``_preload_content=False``."""
+
+    def build(*items, continue_token=None, resource_version=None):
+        metadata = {"continue": continue_token} if continue_token else {}
+        if resource_version:
+            metadata["resourceVersion"] = resource_version
+        return Mock(data=json.dumps({"items": list(items), "metadata": metadata}).encode())
+
+    return build
@@ -0,0 +1,127 @@
+"""Tests for devopstoolbox.cache module."""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from devopstoolbox import cache as cache_module
+from devopstoolbox.cache import ValidationCache, get_cache_dir
+from devopstoolbox.main import app as main_app
+from devopstoolbox.validate import run_validation
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("DEVOPSTOOLBOX_CACHE_DIR", str(directory))
+    return directory
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    file_path = tmp_path / "manifest.yaml"
+    file_path.write_text("key: value\n")
+    return file_path
+
+
+class TestGetCacheDir:
+    def test_env_override(self, cache_dir):
+        assert get_cache_dir() == cache_dir
+
+    def test_xdg_cache_home(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("DEVOPSTOOLBOX_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert get_cache_dir() == tmp_path / "devopstoolbox"
+
+
+class TestValidationCache:
+    def test_miss_then_hit(self, cache_dir, manifest):
+        cache = ValidationCache.open("yaml")
+        assert cache.get(manifest) is None
+        cache.put(manifest, False, "Line 1, Column 1: boom")
+        cache.save()
+
+        reloaded = ValidationCache.open("yaml")
+        assert reloaded.get(manifest) == (False, "Line 1, Column 1: boom")
+
+    def test_content_change_invalidates(self, cache_dir, manifest):
+        cache = ValidationCache.open("yaml")
+        cache.put(manifest, True, "")
+        manifest.write_text("key: other value\n")
+        assert cache.get(manifest) is None
+
+    def test_touched_file_with_same_content_hits_by_hash(self, cache_dir, manifest):
+        cache = ValidationCache.open("yaml")
+        cache.put(manifest, True, "")
+        stat = manifest.stat()
+        os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+        with patch.object(cache_module, "file_digest", wraps=cache_module.file_digest) as digest:
+            assert cache.get(manifest) == (True, "")
+            assert cache.get(manifest) == (True, "")
+        assert digest.call_count == 1
+
+    def test_evicts_least_recently_used_above_cap(self, cache_dir, tmp_path):
+        cache = ValidationCache.open("yaml", max_entries=2)
+        files = []
+        for index in range(3):
+            file_path = tmp_path / f"file{index}.yaml"
+            file_path.write_text(f"index: {index}\n")
+            cache.put(file_path, True, "")
+            cache.entries[str(file_path)][5] = time.time() - 10 + index
+            files.append(file_path)
+        cache.save()
+        assert set(ValidationCache.open("yaml").entries) == {str(files[1]), str(files[2])}
+
+    def test_drops_stale_entries(self, cache_dir, manifest):
+        cache = ValidationCache.open("yaml")
+        cache.put(manifest, True, "")
+        cache.entries[str(manifest)][5] = time.time() - cache_module.STALE_AFTER - 1
+        cache.save()
+        assert ValidationCache.open("yaml").entries == {}
+
+    def test_ignores_corrupt_cache_file(self, cache_dir):
+        cache_dir.mkdir()
+        (cache_dir / "validate-yaml.json").write_text("{not json")
+        assert ValidationCache.open("yaml").entries == {}
+
+
+class TestValidateWithCache:
+    def test_second_run_skips_parsing(self, cache_dir, manifest):
+        result = runner.invoke(main_app, ["validate", "yaml", "-f", str(manifest), "--cache"])
+        assert result.exit_code == 0
+        assert (cache_dir / "validate-yaml.json").exists()
+
+        with patch("devopstoolbox.validate.validate_yaml_file") as validator:
+            result = runner.invoke(main_app, ["validate", "yaml", "-f", str(manifest), "--cache"])
+        assert result.exit_code == 0
+        assert "1 valid, 0 invalid" in result.stdout
+        validator.assert_not_called()
+
+    def test_file_saved_during_validation_is_not_cached_as_new_content(self, cache_dir, manifest):
+        """Test that a result is recorded under the stamp taken before validating, so the new content misses."""
+
+        def validator(file_path):
+            file_path.write_text("key: [unclosed\n")
+            return True, ""
+
+        cache = ValidationCache.open("yaml")
+        assert list(run_validation([manifest], validator, cache=cache)) == [(manifest, True, "")]
+        assert cache.get(manifest) is None
+
+    def test_cached_invalid_result_still_fails(self, cache_dir, tmp_path):
+        broken = tmp_path / "broken.json"
+        broken.write_text('{"key": }')
+        for _ in range(2):
+            result = runner.invoke(main_app, ["validate", "json", "-f", str(broken), "--cache"])
+            assert result.exit_code == 1
+            assert "0 valid, 1 invalid" in result.stdout
+
+    def test_cache_disabled_by_default(self, cache_dir, manifest):
+        result = runner.invoke(main_app, ["validate", "yaml", "-f", str(manifest)])
+        assert result.exit_code == 0
+        assert not cache_dir.exists()
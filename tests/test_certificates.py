@@ -98,6 +98,20 @@ class TestCertificatesListCommand:
         assert result.exit_code == 0
         mock_custom_api.list_cluster_custom_object.assert_called_once_with(group="cert-manager.io", version="v1", plural="certificates")
 
+    @patch("devopstoolbox.k8s.certificates.CustomObjectsApi")
+    def test_list_certificates_with_selectors(self, mock_custom_api_class, mock_ready_certificate):
+        """Test that label and field selectors are sent to the apiserver."""
+        mock_custom_api = Mock()
+        mock_custom_api_class.return_value = mock_custom_api
+        mock_custom_api.list_cluster_custom_object.return_value = {"items": [mock_ready_certificate]}
+
+        result = runner.invoke(certificates.app, ["list", "-A", "-l", "issuer=letsencrypt", "--field-selector", "metadata.namespace!=kube-system"])
+
+        assert result.exit_code == 0
+        mock_custom_api.list_cluster_custom_object.assert_called_once_with(
+            group="cert-manager.io", version="v1", plural="certificates", label_selector="issuer=letsencrypt", field_selector="metadata.namespace!=kube-system"
+        )
+
     @patch("devopstoolbox.k8s.certificates.CustomObjectsApi")
     def test_list_certificates_empty_response(self, mock_custom_api_class):
         """Test handling empty certificates response."""
@@ -133,6 +147,22 @@ class TestCertificatesListCommand:
         assert result.exit_code == 0
         assert "Error" in result.output or "Certificate" in result.output
 
+    @patch("devopstoolbox.k8s.certificates.CustomObjectsApi")
+    def test_list_certificates_multiple_namespaces(self, mock_custom_api_class):
+        """Test that certificates from several namespaces are merged into one table."""
+        mock_custom_api = Mock()
+        mock_custom_api_class.return_value = mock_custom_api
+        mock_custom_api.list_namespaced_custom_object.side_effect = lambda namespace, **kwargs: {
+            "items": [{"metadata": {"namespace": namespace, "name": f"{namespace}-cert"}, "status": {}}]
+        }
+
+        result = runner.invoke(certificates.app, ["list", "-n", "team-a", "-n", "team-b"])
+
+        assert result.exit_code == 0
+        assert mock_custom_api.list_namespaced_custom_object.call_count == 2
+        assert "team-a-cert" in result.output
+        assert "team-b-cert" in result.output
+
 
 class TestCertificatesNotReadyCommand:
     """Tests for certificates not-ready command."""
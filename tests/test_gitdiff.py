@@ -0,0 +1,125 @@
+"""Tests for devopstoolbox.gitdiff module."""
+
+import subprocess
+
+import pytest
+from typer.testing import CliRunner
+
+from devopstoolbox.gitdiff import GitError, changed_files, export_staged
+from devopstoolbox.main import app as main_app
+
+runner = CliRunner()
+
+
+def git(repo, *args):
+    subprocess.run(["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a repository with a `main` branch and a feature branch on top of it."""
+    git(tmp_path, "init", "-q", "-b", "main")
+    (tmp_path / "base.yaml").write_text("key: value\n")
+    (tmp_path / "deleted.yaml").write_text("key: value\n")
+    (tmp_path / "config.json").write_text("{}")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "base")
+    git(tmp_path, "checkout", "-q", "-b", "feature")
+    (tmp_path / "feature.yaml").write_text("key: value\n  bad: indent\n")
+    (tmp_path / "deleted.yaml").unlink()
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "feature")
+    return tmp_path
+
+
+def names(files):
+    return sorted(path.name for path in files)
+
+
+class TestChangedFiles:
+    def test_changed_since_ref(self, repo):
+        (repo / "untracked.yaml").write_text("key: value\n")
+        (repo / "base.yaml").write_text("key: changed\n")
+        assert names(changed_files(repo, since="main")) == ["base.yaml", "feature.yaml", "untracked.yaml"]
+
+    def test_ignores_changes_on_ref_after_branch_point(self, repo):
+        git(repo, "checkout", "-q", "main")
+        (repo / "main-only.yaml").write_text("key: value\n")
+        git(repo, "add", ".")
+        git(repo, "commit", "-q", "-m", "main moved")
+        git(repo, "checkout", "-q", "feature")
+        assert names(changed_files(repo, since="main")) == ["feature.yaml"]
+
+    def test_staged(self, repo):
+        (repo / "staged.json").write_text("{}")
+        (repo / "unstaged.json").write_text("{}")
+        git(repo, "add", "staged.json")
+        assert names(changed_files(repo, staged=True)) == ["staged.json"]
+
+    def test_export_staged(self, repo, tmp_path_factory):
+        (repo / "sub").mkdir()
+        (repo / "sub" / "staged.json").write_text('{"staged": true}')
+        git(repo, "add", "sub/staged.json")
+        (repo / "sub" / "staged.json").write_text('{"staged": false}')
+        destination = tmp_path_factory.mktemp("snapshot")
+
+        copies = export_staged(changed_files(repo, staged=True), destination)
+
+        assert copies == {destination / "sub" / "staged.json": repo / "sub" / "staged.json"}
+        assert (destination / "sub" / "staged.json").read_text() == '{"staged": true}'
+
+    def test_unknown_ref(self, repo):
+        with pytest.raises(GitError):
+            changed_files(repo, since="does-not-exist")
+
+    def test_not_a_repository(self, tmp_path):
+        with pytest.raises(GitError):
+            changed_files(tmp_path, staged=True)
+
+
+class TestValidateChangedFiles:
+    def test_yaml_changed_since(self, repo):
+        result = runner.invoke(main_app, ["validate", "yaml", "-d", str(repo), "--changed-since", "main", "--format", "text"])
+        assert result.exit_code == 1
+        assert "feature.yaml" in result.stdout
+        assert "base.yaml" not in result.stdout
+        assert "0 valid, 1 invalid" in result.stdout
+
+    def test_json_staged_nothing_changed(self, repo):
+        result = runner.invoke(main_app, ["validate", "json", "-d", str(repo), "--staged"])
+        assert result.exit_code == 0
+        assert "No JSON files found" in result.stdout
+
+    def test_staged_validates_index_content(self, repo):
+        """Test that a partially staged file is validated as staged, and reported under its own path."""
+        (repo / "partial.json").write_text('{"key": }')
+        git(repo, "add", "partial.json")
+        (repo / "partial.json").write_text("{}")
+        result = runner.invoke(main_app, ["validate", "json", "-d", str(repo), "--staged", "--format", "text"])
+        assert result.exit_code == 1
+        assert f"INVALID {repo / 'partial.json'}" in result.stdout
+
+        git(repo, "add", "partial.json")
+        (repo / "partial.json").write_text('{"key": }')
+        result = runner.invoke(main_app, ["validate", "json", "-d", str(repo), "--staged", "--format", "text"])
+        assert result.exit_code == 0
+        assert "1 valid, 0 invalid" in result.stdout
+
+    def test_restricted_to_directory_and_excludes(self, repo):
+        (repo / "sub").mkdir()
+        (repo / "sub" / "a.yaml").write_text("key: value\n")
+        (repo / "sub" / "skip.yaml").write_text("key: value\n")
+        result = runner.invoke(main_app, ["validate", "yaml", "-d", str(repo / "sub"), "--changed-since", "main", "-e", "skip.yaml", "--format", "text"])
+        assert result.exit_code == 0
+        assert "a.yaml" in result.stdout
+        assert "skip.yaml" not in result.stdout
+
+    def test_bad_ref_reports_error(self, repo):
+        result = runner.invoke(main_app, ["validate", "yaml", "-d", str(repo), "--changed-since", "nope"])
+        assert result.exit_code == 1
+        assert "Error" in result.stdout
+
+    def test_cannot_combine_with_file(self, repo):
+        result = runner.invoke(main_app, ["validate", "yaml", "-f", str(repo / "base.yaml"), "--staged"])
+        assert result.exit_code == 1
+        assert "cannot be combined" in result.stdout
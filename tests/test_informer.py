@@ -0,0 +1,188 @@
+"""Tests for devopstoolbox.k8s.informer module."""
+
+import json
+import threading
+import time
+from unittest.mock import Mock, call
+
+from devopstoolbox.k8s import informer as informer_module
+from devopstoolbox.k8s import listcache
+from devopstoolbox.k8s.informer import Informer, SharedInformers, Store
+
+
+def pod(name, uid, namespace="default", labels=None, phase="Running", resource_version=None):
+    metadata = {"namespace": namespace, "name": name, "uid": uid, "labels": labels or {}}
+    if resource_version:
+        metadata["resourceVersion"] = resource_version
+    return {"metadata": metadata, "status": {"phase": phase}}
+
+
+def watch_response(*events):
+    """Build the raw response of a watch call made with ``_preload_content=False``."""
+    return Mock(stream=Mock(return_value=[json.dumps(event).encode() + b"\n" for event in events]))
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def make_list_func(lists, watches):
+    """Serve list calls from ``lists`` and watch calls from ``watches``, then block until ``done`` is set."""
+    done = threading.Event()
+
+    def list_func(*args, **kwargs):
+        if kwargs.get("watch"):
+            if watches:
+                result = watches.pop(0)
+                if isinstance(result, Exception):
+                    raise result
+                return result
+            done.wait(5)
+            return watch_response()
+        return lists.pop(0)
+
+    return Mock(side_effect=list_func), done
+
+
+def names(objects):
+    return sorted(obj["metadata"]["name"] for obj in objects)
+
+
+class TestStore:
+    """Tests for the indexed Store."""
+
+    def test_namespace_and_label_indexes(self):
+        store = Store()
+        store.replace([pod("a", "1", labels={"app": "web"}), pod("b", "2", labels={"app": "db"}), pod("c", "3", namespace="apps", labels={"app": "web", "tier": "x"})])
+
+        assert names(store.list()) == ["a", "b", "c"]
+        assert names(store.list(namespace="default")) == ["a", "b"]
+        assert names(store.list(labels={"app": "web"})) == ["a", "c"]
+        assert names(store.list(namespace="apps", labels={"app": "web", "tier": "x"})) == ["c"]
+        assert store.list(namespace="missing") == []
+        assert store.get("2")["metadata"]["name"] == "b"
+
+    def test_updates_move_objects_between_indexes(self):
+        """Test that a modified object is only found under its new namespace and labels."""
+        store = Store()
+        store.upsert(pod("a", "1", labels={"app": "web"}))
+
+        store.apply("MODIFIED", pod("a", "1", labels={"app": "api"}))
+        assert store.list(labels={"app": "web"}) == []
+        assert names(store.list(labels={"app": "api"})) == ["a"]
+
+        store.apply("DELETED", pod("a", "1", labels={"app": "api"}))
+        assert len(store) == 0
+        assert store.list(namespace="default") == []
+
+    def test_managed_fields_are_dropped(self):
+        store = Store()
+        obj = pod("a", "1")
+        obj["metadata"]["managedFields"] = [{"manager": "kubectl"}]
+
+        store.upsert(obj)
+
+        assert "managedFields" not in store.get("1")["metadata"]
+
+
+class TestInformer:
+    """Tests for list+watch synchronisation."""
+
+    def test_applies_events_after_initial_list(self, list_response):
+        """Test that the initial list is updated from ADDED/MODIFIED/DELETED events."""
+        list_func, done = make_list_func(
+            [list_response(pod("a", "1", phase="Pending"), pod("b", "2"), resource_version="10")],
+            [
+                watch_response(
+                    {"type": "MODIFIED", "object": pod("a", "1", resource_version="11")},
+                    {"type": "DELETED", "object": pod("b", "2")},
+                    {"type": "ADDED", "object": pod("c", "3", resource_version="12")},
+                )
+            ],
+        )
+        on_change = Mock()
+        informer = Informer(list_func, "default", on_change=on_change)
+
+        informer.start()
+        try:
+            assert informer.wait_for_sync(5)
+            wait_for(lambda: names(informer.store.list()) == ["a", "c"])
+        finally:
+            informer.stop()
+            done.set()
+        assert informer.store.get("1")["status"]["phase"] == "Running"
+        assert list_func.call_args_list[1] == call(
+            "default",
+            watch=True,
+            resource_version="10",
+            allow_watch_bookmarks=True,
+            timeout_seconds=informer_module.WATCH_TIMEOUT_SECONDS,
+            _preload_content=False,
+            _request_timeout=informer_module.WATCH_TIMEOUT_SECONDS + listcache.WATCH_READ_GRACE_SECONDS,
+        )
+        assert on_change.call_count >= 4
+
+    def test_relists_after_gone(self, list_response):
+        """Test that a 410 Gone replaces the store with a fresh list."""
+        gone = watch_response({"type": "ERROR", "object": {"code": 410, "message": "too old resource version"}})
+        list_func, done = make_list_func([list_response(pod("old", "1")), list_response(pod("new", "2"))], [gone])
+        informer = Informer(list_func)
+
+        informer.start()
+        try:
+            wait_for(lambda: names(informer.store.list()) == ["new"])
+        finally:
+            informer.stop()
+            done.set()
+
+    def test_reconnects_with_backoff(self, list_response, monkeypatch):
+        """Test that a failed watch is reported, retried, and no longer reported once the watch is back."""
+        monkeypatch.setattr(informer_module, "INITIAL_BACKOFF", 0.01)
+        list_func, done = make_list_func(
+            [list_response(pod("a", "1"), resource_version="5")], [ConnectionError("reset"), watch_response({"type": "ADDED", "object": pod("b", "2")})]
+        )
+        errors = []
+        informer = Informer(list_func, on_change=lambda: errors.append(informer.error))
+
+        informer.start()
+        try:
+            wait_for(lambda: names(informer.store.list()) == ["a", "b"])
+        finally:
+            informer.stop()
+            done.set()
+        assert informer.error is None
+        assert list_func.call_args_list[2].kwargs["resource_version"] == "5"
+        assert any(isinstance(error, ConnectionError) for error in errors)
+
+    def test_resync_relists(self, list_response):
+        """Test that the store is listed again once the resync period has passed."""
+        list_func, done = make_list_func([list_response(pod("a", "1")), list_response(pod("b", "2"))], [watch_response()])
+        informer = Informer(list_func, resync_period=0)
+
+        informer.start()
+        try:
+            wait_for(lambda: names(informer.store.list()) == ["b"])
+        finally:
+            informer.stop()
+            done.set()
+
+
+class TestSharedInformers:
+    def test_same_key_shares_one_informer(self, list_response):
+        list_func, done = make_list_func([list_response(pod("a", "1"))], [])
+        informers = SharedInformers()
+        first_listener, second_listener = Mock(), Mock()
+
+        try:
+            first = informers.get(("ctx", "pods", None), list_func, on_change=first_listener)
+            second = informers.get(("ctx", "pods", None), list_func, on_change=second_listener)
+            assert first is second
+            assert first.wait_for_sync(5)
+        finally:
+            informers.stop_all()
+            done.set()
+        assert first.listeners == [first_listener, second_listener]
+        assert first.stopped.is_set()
@@ -0,0 +1,106 @@
+"""Tests for devopstoolbox.jsonstream module."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from devopstoolbox import validate
+from devopstoolbox.jsonstream import validate_json_stream
+from devopstoolbox.validate import validate_json_file
+
+VALID_DOCUMENTS = [
+    "{}",
+    "[]",
+    '"text"',
+    "0",
+    "-12.5e+3",
+    "null",
+    "[NaN, Infinity, -Infinity]",
+    '{"key": "value", "list": ["item1", "item2"], "nested": {"a": [1, 2, {"b": null}]}}',
+    '{\n  "escaped": "line\\nbreak \\u00e9 \\"quoted\\"",\n  "empty": {}\n}\n',
+]
+
+INVALID_DOCUMENTS = [
+    "",
+    "   \n  ",
+    '{"key": "value", "bad": }',
+    '{\n  "key": "value",\n  "bad": \n}',
+    '{"key" "value"}',
+    "{key: 1}",
+    '{"a": 1 "b": 2}',
+    '{"a": 1,}',
+    "[1, 2,]",
+    "[1 2]",
+    "[1.]",
+    "[01]",
+    "[-]",
+    '["unterminated]',
+    '["bad \\x escape"]',
+    '["bad \\u12 escape"]',
+    '["control \x01 character"]',
+    "{} []",
+    "[tru]",
+    "﻿{}",
+]
+
+
+def stream_error(document: str, chunk_size: int):
+    try:
+        validate_json_stream(io.StringIO(document), chunk_size=chunk_size)
+    except json.JSONDecodeError as e:
+        return e.msg, e.pos, e.lineno, e.colno
+    return None
+
+
+def json_error(document: str):
+    try:
+        json.loads(document)
+    except json.JSONDecodeError as e:
+        return e.msg, e.pos, e.lineno, e.colno
+    return None
+
+
+class TestValidateJsonStream:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+    @pytest.mark.parametrize("document", VALID_DOCUMENTS)
+    def test_valid_documents(self, document, chunk_size):
+        assert stream_error(document, chunk_size) is None
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+    @pytest.mark.parametrize("document", INVALID_DOCUMENTS)
+    def test_errors_match_json_module(self, document, chunk_size):
+        expected = json_error(document)
+        assert expected is not None
+        assert stream_error(document, chunk_size) == expected
+
+    def test_error_position_after_many_chunks(self):
+        document = "[\n" + ",\n".join(json.dumps({"id": index, "name": f"item-{index}"}) for index in range(2000)) + ",\n}\n"
+        assert stream_error(document, 256) == json_error(document)
+
+    def test_long_string_spanning_chunks(self):
+        document = json.dumps({"blob": "x" * 100_000, "after": [1, 2, 3]})
+        assert stream_error(document, 64) is None
+
+    def test_deep_nesting_does_not_recurse(self):
+        document = "[" * 100_000 + "]" * 100_000
+        assert stream_error(document, 4096) is None
+
+
+class TestValidateJsonFileStreaming:
+    def test_large_files_use_streaming_parser(self, tmp_path):
+        json_file = tmp_path / "large.json"
+        json_file.write_text('{\n  "key": "value",\n  "bad": \n}')
+        expected = validate_json_file(json_file)
+        with patch.object(validate, "JSON_STREAM_THRESHOLD", 0), patch.object(validate.pyjson, "load") as load:
+            assert validate_json_file(json_file) == expected
+        load.assert_not_called()
+        assert expected == (False, "Line 4, Column 1: Expecting value")
+
+    def test_small_files_use_json_load(self, tmp_path):
+        json_file = tmp_path / "small.json"
+        json_file.write_text("{}")
+        with patch("devopstoolbox.validate.validate_json_stream") as stream:
+            assert validate_json_file(json_file) == (True, "")
+        stream.assert_not_called()
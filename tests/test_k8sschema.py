@@ -0,0 +1,282 @@
+"""Tests for devopstoolbox.k8sschema module and the validate k8s-manifests command."""
+
+import json
+import pickle
+from functools import partial
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from devopstoolbox.k8sschema import SchemaError, SchemaStore
+from devopstoolbox.main import app as main_app
+from devopstoolbox.validate import validate_k8s_manifest_file
+
+runner = CliRunner()
+
+DEFINITIONS = {
+    "io.k8s.api.apps.v1.Deployment": {
+        "type": "object",
+        "properties": {
+            "apiVersion": {"type": "string"},
+            "kind": {"type": "string"},
+            "metadata": {"$ref": "#/definitions/io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta"},
+            "spec": {"$ref": "#/definitions/io.k8s.api.apps.v1.DeploymentSpec"},
+        },
+        "x-kubernetes-group-version-kind": [{"group": "apps", "kind": "Deployment", "version": "v1"}],
+    },
+    "io.k8s.api.apps.v1.DeploymentSpec": {
+        "type": "object",
+        "required": ["selector", "template"],
+        "properties": {
+            "replicas": {"type": "integer", "format": "int32"},
+            "selector": {"type": "object", "properties": {"matchLabels": {"type": "object", "additionalProperties": {"type": "string"}}}},
+            "strategy": {"type": "object", "properties": {"type": {"type": "string", "enum": ["Recreate", "RollingUpdate"]}}},
+            "template": {"type": "object", "properties": {"spec": {"$ref": "#/definitions/io.k8s.api.core.v1.PodSpec"}}},
+        },
+    },
+    "io.k8s.api.core.v1.PodSpec": {
+        "type": "object",
+        "required": ["containers"],
+        "properties": {
+            "containers": {"type": "array", "items": {"$ref": "#/definitions/io.k8s.api.core.v1.Container"}},
+        },
+    },
+    "io.k8s.api.core.v1.Container": {
+        "type": "object",
+        "required": ["name"],
+        "properties": {
+            "name": {"type": "string"},
+            "image": {"type": "string"},
+            "ports": {"type": "array", "items": {"type": "object", "properties": {"containerPort": {"type": "integer"}}}},
+            "resources": {
+                "type": "object",
+                "properties": {"limits": {"type": "object", "additionalProperties": {"$ref": "#/definitions/io.k8s.apimachinery.pkg.api.resource.Quantity"}}},
+            },
+            "livenessProbe": {"type": "object", "properties": {"port": {"$ref": "#/definitions/io.k8s.apimachinery.pkg.util.intstr.IntOrString"}}},
+            "stdin": {"type": "boolean"},
+        },
+    },
+    "io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta": {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "creationTimestamp": {"type": "string", "format": "date-time"},
+            "labels": {"type": "object", "additionalProperties": {"type": "string"}},
+        },
+    },
+    "io.k8s.apimachinery.pkg.api.resource.Quantity": {"type": "string"},
+    "io.k8s.apimachinery.pkg.util.intstr.IntOrString": {"type": "string", "format": "int-or-string"},
+    "io.k8s.api.core.v1.ConfigMap": {
+        "type": "object",
+        "properties": {
+            "apiVersion": {"type": "string"},
+            "kind": {"type": "string"},
+            "metadata": {"$ref": "#/definitions/io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta"},
+            "data": {"type": "object", "additionalProperties": {"type": "string"}},
+        },
+        "x-kubernetes-group-version-kind": [{"group": "", "kind": "ConfigMap", "version": "v1"}],
+    },
+}
+
+# Standalone schema in the kubernetes-json-schema / CRD layout: no extension, kinds from enums.
+WIDGET_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "apiVersion": {"type": "string", "enum": ["example.com/v1"]},
+        "kind": {"type": "string", "enum": ["Widget"]},
+        "metadata": {"type": "object"},
+        "spec": {"type": "object", "properties": {"size": {"type": "integer"}}, "x-kubernetes-preserve-unknown-fields": True},
+    },
+}
+
+DEPLOYMENT = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: web
+  creationTimestamp: 2024-01-01T00:00:00Z
+spec:
+  replicas: 3
+  selector:
+    matchLabels:
+      app: web
+  template:
+    spec:
+      containers:
+        - name: web
+          image: nginx
+          ports:
+            - containerPort: 80
+          resources:
+            limits:
+              cpu: 1
+              memory: 128Mi
+          livenessProbe:
+            port: http
+"""
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    directory = tmp_path / "schemas"
+    directory.mkdir()
+    (directory / "_definitions.json").write_text(json.dumps({"definitions": DEFINITIONS}))
+    (directory / "widget-example-v1.json").write_text(json.dumps(WIDGET_SCHEMA))
+    return directory
+
+
+@pytest.fixture
+def store(schema_dir):
+    return SchemaStore(schema_dir)
+
+
+class TestSchemaStore:
+    def test_indexes_kinds(self, store):
+        assert len(store) == 3
+        assert store.checker("apps/v1", "Deployment") is not None
+        assert store.checker("v1", "ConfigMap") is not None
+        assert store.checker("example.com/v1", "Widget") is not None
+        assert store.checker("v1", "Deployment") is None
+
+    def test_checker_is_compiled_once(self, store):
+        assert store.checker("apps/v1", "Deployment") is store.checker("apps/v1", "Deployment")
+
+    def test_openapi_v3_components(self, tmp_path):
+        (tmp_path / "apps-v1.json").write_text(json.dumps({"openapi": "3.0.0", "components": {"schemas": DEFINITIONS}}))
+        assert SchemaStore(tmp_path).checker("apps/v1", "Deployment") is not None
+
+    def test_missing_directory(self, tmp_path):
+        with pytest.raises(SchemaError, match="not found"):
+            SchemaStore(tmp_path / "missing")
+
+    def test_empty_directory(self, tmp_path):
+        with pytest.raises(SchemaError, match="No Kubernetes schemas"):
+            SchemaStore(tmp_path)
+
+    def test_unreadable_schema(self, tmp_path):
+        (tmp_path / "broken.json").write_text("{")
+        with pytest.raises(SchemaError, match="broken.json"):
+            SchemaStore(tmp_path)
+
+
+class TestValidateDocument:
+    def deployment(self):
+        return yaml.safe_load(DEPLOYMENT)
+
+    def test_valid_deployment(self, store):
+        assert store.validate(self.deployment()) == []
+
+    def test_wrong_type(self, store):
+        document = self.deployment()
+        document["spec"]["replicas"] = "3"
+        assert store.validate(document) == ["spec.replicas: expected integer, got string"]
+
+    def test_boolean_is_not_integer(self, store):
+        document = self.deployment()
+        document["spec"]["replicas"] = True
+        assert store.validate(document) == ["spec.replicas: expected integer, got boolean"]
+
+    def test_nested_array_path(self, store):
+        document = self.deployment()
+        document["spec"]["template"]["spec"]["containers"][0]["ports"][0]["containerPort"] = "http"
+        assert store.validate(document) == ["spec.template.spec.containers[0].ports[0].containerPort: expected integer, got string"]
+
+    def test_missing_required_field(self, store):
+        document = self.deployment()
+        del document["spec"]["template"]["spec"]["containers"][0]["name"]
+        assert store.validate(document) == ["spec.template.spec.containers[0]: missing required field 'name'"]
+
+    def test_enum(self, store):
+        document = self.deployment()
+        document["spec"]["strategy"] = {"type": "BlueGreen"}
+        assert store.validate(document) == ["spec.strategy.type: 'BlueGreen' is not one of 'Recreate', 'RollingUpdate'"]
+
+    def test_additional_properties_schema(self, store):
+        document = self.deployment()
+        document["metadata"]["labels"] = {"app": 1}
+        assert store.validate(document) == ["metadata.labels.app: expected string, got integer"]
+
+    def test_null_is_omitted(self, store):
+        document = self.deployment()
+        document["metadata"]["creationTimestamp"] = None
+        assert store.validate(document) == []
+
+    def test_unknown_field_only_reported_in_strict_mode(self, schema_dir):
+        document = self.deployment()
+        document["spec"]["replica"] = 3
+        assert SchemaStore(schema_dir).validate(document) == []
+        assert SchemaStore(schema_dir, strict=True).validate(document) == ["spec: unknown field 'replica'"]
+
+    def test_strict_respects_open_objects(self, schema_dir):
+        widget = {"apiVersion": "example.com/v1", "kind": "Widget", "metadata": {"name": "w", "anything": 1}, "spec": {"size": 2, "color": "red"}}
+        assert SchemaStore(schema_dir, strict=True).validate(widget) == []
+
+    def test_unknown_kind(self, schema_dir):
+        document = {"apiVersion": "example.com/v1", "kind": "Gadget"}
+        assert SchemaStore(schema_dir).validate(document) == []
+        assert SchemaStore(schema_dir, strict=True).validate(document) == ["no schema for example.com/v1 Gadget"]
+
+    def test_list_items(self, store):
+        document = {"apiVersion": "v1", "kind": "List", "items": [{"apiVersion": "v1", "kind": "ConfigMap", "data": {"key": []}}]}
+        assert store.validate(document) == ["items[0]: data.key: expected string, got array"]
+
+    @pytest.mark.parametrize("document, error", [(["a"], "expected a mapping, got array"), ({"kind": "ConfigMap"}, "missing apiVersion or kind")])
+    def test_not_a_manifest(self, store, document, error):
+        assert store.validate(document) == [error]
+
+
+class TestValidateK8sManifestFile:
+    def test_valid_multi_document(self, tmp_path, schema_dir):
+        manifest = tmp_path / "app.yaml"
+        manifest.write_text(DEPLOYMENT + "---\n---\napiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: settings\n")
+        assert validate_k8s_manifest_file(manifest, schema_dir) == (True, "")
+
+    def test_reports_document_and_name(self, tmp_path, schema_dir):
+        manifest = tmp_path / "app.yaml"
+        manifest.write_text(DEPLOYMENT + "---\napiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: settings\ndata:\n  key: [1]\n")
+        assert validate_k8s_manifest_file(manifest, schema_dir) == (False, "Document 2 (ConfigMap settings): data.key: expected string, got array")
+
+    def test_yaml_syntax_error(self, tmp_path, schema_dir):
+        manifest = tmp_path / "app.yaml"
+        manifest.write_text("key: value\n  bad indent: here\n")
+        is_valid, error = validate_k8s_manifest_file(manifest, schema_dir)
+        assert not is_valid
+        assert error.startswith("Line 2, Column")
+
+    def test_validator_is_picklable(self, schema_dir):
+        validator = partial(validate_k8s_manifest_file, schema_dir=schema_dir, strict=True)
+        assert pickle.loads(pickle.dumps(validator)).keywords == {"schema_dir": schema_dir, "strict": True}
+
+
+class TestValidateK8sManifestsCommand:
+    @pytest.fixture
+    def manifests(self, tmp_path):
+        directory = tmp_path / "manifests"
+        directory.mkdir()
+        (directory / "good.yaml").write_text(DEPLOYMENT)
+        (directory / "bad.yml").write_text(DEPLOYMENT.replace("replicas: 3", "replicas: three"))
+        return directory
+
+    def test_directory(self, manifests, schema_dir):
+        result = runner.invoke(main_app, ["validate", "k8s-manifests", "-s", str(schema_dir), "-d", str(manifests), "--format", "text"])
+        assert result.exit_code == 1
+        assert "INVALID" in result.stdout
+        assert "spec.replicas: expected integer, got string" in result.stdout
+        assert "Summary: 1 valid, 1 invalid" in result.stdout
+
+    def test_parallel_matches_serial(self, manifests, schema_dir):
+        args = ["validate", "k8s-manifests", "-s", str(schema_dir), "-d", str(manifests), "--format", "jsonl"]
+        assert runner.invoke(main_app, [*args, "--jobs", "2"]).stdout == runner.invoke(main_app, args).stdout
+
+    def test_schema_dir_from_environment(self, manifests, schema_dir):
+        result = runner.invoke(main_app, ["validate", "k8s-manifests", "-f", str(manifests / "good.yaml")], env={"DEVOPSTOOLBOX_K8S_SCHEMA_DIR": str(schema_dir)})
+        assert result.exit_code == 0
+        assert "Summary: 1 valid, 0 invalid" in result.stdout
+
+    def test_empty_schema_dir(self, manifests, tmp_path):
+        empty = tmp_path / "empty"
+        empty.mkdir()
+        result = runner.invoke(main_app, ["validate", "k8s-manifests", "-s", str(empty), "-d", str(manifests)])
+        assert result.exit_code == 1
+        assert "No Kubernetes schemas found" in result.stdout
@@ -0,0 +1,105 @@
+"""Tests for devopstoolbox.k8s.kubeconfig module."""
+
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+from kubernetes.client import Configuration
+
+from devopstoolbox.k8s import kubeconfig
+from devopstoolbox.k8s.kubeconfig import KubeConfigMerger
+
+OTHER_KUBECONFIG = """apiVersion: v1
+kind: Config
+current-context: dev
+clusters:
+  - name: dev
+    cluster: {server: "https://dev.example.com", certificate-authority: certs/ca.crt}
+contexts:
+  - name: dev
+    context: {cluster: dev, user: dev-user, namespace: sandbox}
+  - name: prod
+    context: {cluster: dev, user: dev-user}
+users:
+  - name: dev-user
+    user: {token: dev-token}
+"""
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("DEVOPSTOOLBOX_CACHE_DIR", str(tmp_path / "cache"))
+    kubeconfig.configure_kube_config(disk_cache=True)
+    return tmp_path / "cache" / "kubeconfig"
+
+
+def new_configuration(kube_config, context=None):
+    configuration = Configuration()
+    kube_config.load_and_set(configuration, context)
+    return configuration
+
+
+class TestLoad:
+    def test_parsed_once_per_process(self, kubeconfig_file):
+        with patch("devopstoolbox.k8s.kubeconfig.KubeConfigMerger", wraps=KubeConfigMerger) as mock_merger:
+            first = kubeconfig.load()
+            second = kubeconfig.load()
+
+        assert first is second
+        mock_merger.assert_called_once()
+        assert [entry["name"] for entry in first.contexts()] == ["prod", "stage"]
+        assert first.context()["context"]["namespace"] == "payments"
+
+    def test_files_are_merged_in_order(self, kubeconfig_file, tmp_path, monkeypatch):
+        """Test that the first file wins on duplicate names and relative paths resolve against their own file."""
+        other = tmp_path / "other" / "config"
+        (other.parent / "certs").mkdir(parents=True)
+        (other.parent / "certs" / "ca.crt").write_text("ca")
+        other.write_text(OTHER_KUBECONFIG)
+        monkeypatch.setenv("KUBECONFIG", os.pathsep.join([str(kubeconfig_file), str(tmp_path / "missing"), str(other)]))
+
+        kube_config = kubeconfig.load()
+
+        assert [entry["name"] for entry in kube_config.contexts()] == ["prod", "stage", "dev"]
+        assert kube_config.context("prod")["context"]["namespace"] == "payments"
+        assert new_configuration(kube_config, "dev").ssl_ca_cert == str(other.parent / "certs" / "ca.crt")
+
+    def test_unknown_context(self, kubeconfig_file):
+        with pytest.raises(kubeconfig.ConfigException, match="missing"):
+            kubeconfig.load().context("missing")
+
+    def test_no_kubeconfig(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("KUBECONFIG", str(tmp_path / "missing"))
+
+        with pytest.raises(kubeconfig.ConfigException):
+            kubeconfig.load()
+
+
+class TestDiskCache:
+    def test_second_process_skips_yaml(self, kubeconfig_file, disk_cache):
+        """Test that a cached copy is used once the in-process one is gone."""
+        first = kubeconfig.load()
+        kubeconfig.reset_kube_config()
+
+        with patch("devopstoolbox.k8s.kubeconfig.KubeConfigMerger") as mock_merger:
+            second = kubeconfig.load()
+
+        mock_merger.assert_not_called()
+        assert second.contexts() == first.contexts()
+        assert new_configuration(second, "stage").host == "https://stage.example.com"
+        assert new_configuration(second).api_key == {"BearerToken": "Bearer secret-token"}
+
+    def test_entry_is_private(self, kubeconfig_file, disk_cache):
+        kubeconfig.load()
+
+        (entry,) = disk_cache.iterdir()
+        assert stat.S_IMODE(entry.stat().st_mode) == 0o600
+
+    def test_changed_file_is_parsed_again(self, kubeconfig_file, disk_cache):
+        kubeconfig.load()
+        kubeconfig.reset_kube_config()
+        kubeconfig_file.write_text(kubeconfig_file.read_text().replace("current-context: prod", "current-context: stage"))
+        os.utime(kubeconfig_file, ns=(0, kubeconfig_file.stat().st_mtime_ns + 1))
+
+        assert kubeconfig.load().context()["name"] == "stage"
@@ -0,0 +1,178 @@
+"""Tests for devopstoolbox.k8s.listcache module."""
+
+import json
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from kubernetes.client.exceptions import ApiException
+from rich.console import Console
+from typer.testing import CliRunner
+
+from devopstoolbox.k8s import kubeconfig, listcache, pods
+from devopstoolbox.k8s.listcache import ListCache, watch_events
+
+runner = CliRunner()
+
+
+def pod(name, uid, namespace="default", resource_version="1"):
+    return {"metadata": {"namespace": namespace, "name": name, "uid": uid, "resourceVersion": resource_version}, "status": {"phase": "Running"}}
+
+
+def list_body(*items, resource_version="100", continue_token=None):
+    metadata = {"resourceVersion": resource_version}
+    if continue_token:
+        metadata["continue"] = continue_token
+    return Mock(data=json.dumps({"items": list(items), "metadata": metadata}).encode())
+
+
+def watch_body(*events, chunk_size=7):
+    data = b"".join(json.dumps(event).encode() + b"\n" for event in events)
+    return Mock(stream=Mock(return_value=[data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """A cache whose entries are always stale and always revalidated with a watch."""
+    return ListCache(tmp_path / "k8s-lists", ttl=0, relist_max_items=0)
+
+
+@pytest.fixture(autouse=True)
+def current_context(kubeconfig_file):
+    """Resolve cache keys against the test kubeconfig, whose current context is ``prod``."""
+    return kubeconfig_file
+
+
+def names(pages):
+    return [item["metadata"]["name"] for page in pages for item in page]
+
+
+class TestWatchEvents:
+    def test_events_split_across_chunks(self):
+        """Test that events are decoded regardless of how the stream is chunked."""
+        response = watch_body({"type": "ADDED", "object": {"a": 1}}, {"type": "DELETED", "object": {"b": 2}}, chunk_size=3)
+
+        assert [event["type"] for event in watch_events(response)] == ["ADDED", "DELETED"]
+        response.release_conn.assert_called_once()
+
+
+class TestListCache:
+    def test_first_run_lists_and_saves(self, cache):
+        """Test that a missing entry is listed page by page and stored with its resourceVersion."""
+        list_func = Mock(side_effect=[list_body(pod("a", "1"), continue_token="next"), list_body(pod("b", "2"), resource_version="101")])
+
+        assert names(cache.pages(None, "pods", "default", list_func, "default", page_size=1)) == ["a", "b"]
+
+        list_func.assert_called_with("default", limit=1, _preload_content=False, _continue="next")
+        entry = cache.load(cache.path(None, "pods", "default", {}))
+        assert entry["resourceVersion"] == "101"
+        assert set(entry["items"]) == {"1", "2"}
+
+    def test_fresh_entry_is_served_without_requests(self, cache):
+        """Test that an entry younger than the TTL never contacts the apiserver."""
+        list_func = Mock(return_value=list_body(pod("a", "1")))
+        list(cache.pages(None, "pods", None, list_func))
+        cache.ttl = 60
+        list_func.reset_mock()
+
+        assert names(cache.pages(None, "pods", None, list_func)) == ["a"]
+        list_func.assert_not_called()
+
+    def test_stale_entry_applies_watch_deltas(self, cache, monkeypatch):
+        """Test that a stale entry is revalidated from its resourceVersion with only the changes."""
+        monkeypatch.setattr(listcache, "REVALIDATE_QUIET_SECONDS", 0)
+        list(cache.pages(None, "pods", None, Mock(return_value=list_body(pod("a", "1"), pod("b", "2"))), label_selector="app=web"))
+        list_func = Mock(
+            return_value=watch_body(
+                {"type": "MODIFIED", "object": pod("a", "1", resource_version="150")},
+                {"type": "DELETED", "object": pod("b", "2", resource_version="151")},
+                {"type": "ADDED", "object": pod("c", "3", namespace="apps", resource_version="152")},
+                {"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "160"}}},
+            )
+        )
+
+        assert names(cache.pages(None, "pods", None, list_func, label_selector="app=web")) == ["c", "a"]
+        list_func.assert_called_once_with(
+            watch=True, resource_version="100", allow_watch_bookmarks=True, timeout_seconds=1, _preload_content=False, _request_timeout=11, label_selector="app=web"
+        )
+        assert cache.load(cache.path(None, "pods", None, {"label_selector": "app=web"}))["resourceVersion"] == "160"
+        assert cache.stale == []
+
+    def test_watch_cut_off_mid_stream_is_flagged(self, cache):
+        """Test that a watch closed right after an event is reported, and revalidated again on the next run."""
+        list(cache.pages("prod", "pods", "default", Mock(return_value=list_body(pod("a", "1")))))
+        list_func = Mock(return_value=watch_body({"type": "ADDED", "object": pod("b", "2", resource_version="150")}))
+
+        assert names(cache.pages("prod", "pods", "default", list_func)) == ["a", "b"]
+
+        assert cache.stale == ["pods in namespace default of context prod"]
+        entry = cache.load(cache.path("prod", "pods", "default", {}))
+        assert entry["resourceVersion"] == "150"
+        assert entry["fetchedAt"] == 0
+        console = Console(width=200, record=True)
+        cache.warn_stale(console)
+        assert "cached pods in namespace default of context prod may be missing recent changes" in console.export_text()
+
+    def test_small_stale_entry_is_listed_again(self, tmp_path):
+        """Test that a stale list that fits the relist limit is listed instead of watched."""
+        cache = ListCache(tmp_path / "k8s-lists", ttl=0, relist_max_items=1)
+        list(cache.pages(None, "pods", None, Mock(return_value=list_body(pod("a", "1")))))
+        list_func = Mock(return_value=list_body(pod("b", "2"), resource_version="200"))
+
+        assert names(cache.pages(None, "pods", None, list_func)) == ["b"]
+        list_func.assert_called_once_with(limit=500, _preload_content=False)
+        assert cache.load(cache.path(None, "pods", None, {}))["resourceVersion"] == "200"
+
+    def test_gone_event_falls_back_to_relist(self, cache):
+        """Test that a 410 ERROR event triggers a full list."""
+        list(cache.pages(None, "pods", None, Mock(return_value=list_body(pod("a", "1")))))
+        gone = watch_body({"type": "ERROR", "object": {"kind": "Status", "code": 410, "message": "too old resource version"}})
+        list_func = Mock(side_effect=[gone, list_body(pod("b", "2"), resource_version="200")])
+
+        assert names(cache.pages(None, "pods", None, list_func)) == ["b"]
+        assert cache.load(cache.path(None, "pods", None, {}))["resourceVersion"] == "200"
+
+    def test_gone_status_falls_back_to_relist(self, cache):
+        """Test that a watch rejected with HTTP 410 triggers a full list."""
+        list(cache.pages(None, "pods", None, Mock(return_value=list_body(pod("a", "1")))))
+        list_func = Mock(side_effect=[ApiException(status=410), list_body(pod("b", "2"))])
+
+        assert names(cache.pages(None, "pods", None, list_func)) == ["b"]
+
+    def test_managed_fields_are_not_stored(self, cache):
+        item = pod("a", "1")
+        item["metadata"]["managedFields"] = [{"manager": "kubectl"}]
+
+        list(cache.pages(None, "pods", None, Mock(return_value=list_body(item))))
+
+        assert "managedFields" not in cache.load(cache.path(None, "pods", None, {}))["items"]["1"]["metadata"]
+
+    def test_entries_are_keyed_by_cluster(self, cache, kubeconfig_file):
+        """Test that a context name reused by another kubeconfig for another apiserver gets its own entry."""
+        assert cache.path("prod", "pods", None, {}) != cache.path("stage", "pods", None, {})
+        assert cache.path(None, "pods", None, {}) == cache.path("prod", "pods", None, {})
+        prod_path = cache.path("prod", "pods", None, {})
+
+        kubeconfig_file.write_text(kubeconfig_file.read_text().replace("https://prod.example.com", "https://other.example.com"))
+        kubeconfig.reset_kube_config()
+
+        assert cache.path("prod", "pods", None, {}) != prod_path
+
+
+class TestPodsListCache:
+    @patch("devopstoolbox.k8s.utils.load_kube_config")
+    @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
+    def test_list_pods_with_cache(self, mock_api, mock_load, tmp_path, monkeypatch):
+        """Test that a second run inside the TTL is served from the cache."""
+        monkeypatch.setenv("DEVOPSTOOLBOX_CACHE_DIR", str(tmp_path))
+        mock_v1 = Mock()
+        mock_api.return_value = mock_v1
+        mock_v1.list_pod_for_all_namespaces.return_value = list_body(pod("cached-pod", "1"))
+
+        first = runner.invoke(pods.app, ["list", "-A", "--cache", "--cache-ttl", "60"])
+        second = runner.invoke(pods.app, ["list", "-A", "--cache", "--cache-ttl", "60"])
+
+        assert first.exit_code == 0
+        assert "cached-pod" in second.output
+        mock_v1.list_pod_for_all_namespaces.assert_called_once_with(limit=500, _preload_content=False)
+        assert time.time() - json.loads(next((tmp_path / "k8s-lists").iterdir()).read_text())["fetchedAt"] < 60
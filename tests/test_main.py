@@ -1,5 +1,7 @@
 """Tests for devopstoolbox.main module."""
 
+import subprocess
+import sys
 from unittest.mock import patch
 
 from typer.testing import CliRunner
@@ -66,3 +68,38 @@ class TestAppStructure:
         assert result.exit_code == 0
         assert "list" in result.output
         assert "not-ready" in result.output
+
+    @patch("devopstoolbox.k8s.cli.utils.configure_api_clients")
+    def test_k8s_client_options(self, mock_configure):
+        """Test that connection options of the k8s group configure the shared API clients."""
+        result = runner.invoke(app, ["k8s", "--pool-size", "4", "--request-timeout", "10", "services", "--help"])
+
+        assert result.exit_code == 0
+        mock_configure.assert_called_once_with(4, 10.0, False)
+
+
+class TestLazyImports:
+    """Tests that subcommand modules are only imported when dispatched to."""
+
+    def imported_modules(self, *args):
+        """Run the CLI with ``args`` in a fresh interpreter and return the names of the modules it imported."""
+        code = "import sys\nfrom devopstoolbox.main import app\ntry:\n    app(sys.argv[1:])\nexcept SystemExit:\n    pass\nprint(' '.join(sys.modules))"
+        result = subprocess.run([sys.executable, "-c", code, *args], capture_output=True, text=True, check=True)
+        return set(result.stdout.splitlines()[-1].split())
+
+    def test_version_skips_heavy_modules(self):
+        modules = self.imported_modules("version")
+
+        assert not {"kubernetes", "yaml", "devopstoolbox.validate", "devopstoolbox.k8s.utils"} & modules
+
+    def test_generate_skips_heavy_modules(self):
+        modules = self.imported_modules("generate", "password")
+
+        assert "devopstoolbox.generate" in modules
+        assert not {"kubernetes", "yaml", "devopstoolbox.validate"} & modules
+
+    def test_k8s_loads_only_dispatched_group(self):
+        modules = self.imported_modules("k8s", "services", "--help")
+
+        assert "devopstoolbox.k8s.services" in modules
+        assert not {"devopstoolbox.k8s.pods", "devopstoolbox.k8s.certificates", "devopstoolbox.validate", "numpy"} & modules
@@ -1,6 +1,7 @@
 """Tests for devopstoolbox.k8s.pods module."""
 
-from unittest.mock import Mock, patch
+import threading
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 from typer.testing import CliRunner
@@ -19,41 +20,25 @@ def mock_kube_config():
 
 @pytest.fixture
 def mock_pod():
-    """Create a mock pod object."""
-    pod = Mock()
-    pod.metadata.namespace = "default"
-    pod.metadata.name = "test-pod"
-    pod.status.phase = "Running"
-
-    container_status = Mock()
-    container_status.restart_count = 2
-    pod.status.container_statuses = [container_status]
-
-    return pod
+    """Create a pod as returned by the API."""
+    return {
+        "metadata": {"namespace": "default", "name": "test-pod"},
+        "status": {"phase": "Running", "containerStatuses": [{"restartCount": 2}]},
+    }
 
 
 @pytest.fixture
 def mock_unhealthy_pod():
-    """Create a mock unhealthy pod object."""
-    pod = Mock()
-    pod.metadata.namespace = "default"
-    pod.metadata.name = "failing-pod"
-    pod.status.phase = "CrashLoopBackOff"
-
-    container_status = Mock()
-    container_status.restart_count = 10
-    pod.status.container_statuses = [container_status]
-
-    return pod
+    """Create an unhealthy pod as returned by the API."""
+    return {
+        "metadata": {"namespace": "default", "name": "failing-pod"},
+        "status": {"phase": "CrashLoopBackOff", "containerStatuses": [{"restartCount": 10}]},
+    }
 
 
 @pytest.fixture
 def mock_container():
-    container = Mock()
-    container.name = "main"
-    container.resources.requests = {"cpu": "100m", "memory": "128Mi"}
-    container.resources.limits = {"cpu": "200m", "memory": "256Mi"}
-    return container
+    return {"name": "main", "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}, "limits": {"cpu": "200m", "memory": "256Mi"}}}
 
 
 @pytest.fixture
@@ -72,95 +57,145 @@ class TestPodsListCommand:
     """Tests for pods list command."""
 
     @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
-    def test_list_pods_default_namespace(self, mock_api, mock_pod):
+    def test_list_pods_default_namespace(self, mock_api, mock_pod, list_response):
         """Test listing pods in default namespace."""
         mock_v1 = Mock()
         mock_api.return_value = mock_v1
 
-        mock_pods = Mock()
-        mock_pods.items = [mock_pod]
-        mock_v1.list_namespaced_pod.return_value = mock_pods
+        mock_v1.list_namespaced_pod.return_value = list_response(mock_pod)
 
         result = runner.invoke(pods.app, ["list", "-n", "default"])
 
         assert result.exit_code == 0
-        mock_v1.list_namespaced_pod.assert_called_once_with("default", watch=False)
+        mock_v1.list_namespaced_pod.assert_called_once_with("default", watch=False, limit=500, _preload_content=False)
 
     @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
-    def test_list_pods_specific_namespace_long(self, mock_api, mock_pod):
+    def test_list_pods_specific_namespace_long(self, mock_api, mock_pod, list_response):
         """Test listing pods in a specific namespace."""
         mock_v1 = Mock()
         mock_api.return_value = mock_v1
 
-        mock_pods = Mock()
-        mock_pods.items = [mock_pod]
-        mock_v1.list_namespaced_pod.return_value = mock_pods
+        mock_v1.list_namespaced_pod.return_value = list_response(mock_pod)
 
         result = runner.invoke(pods.app, ["list", "--namespace", "kube-system"])
 
         assert result.exit_code == 0
-        mock_v1.list_namespaced_pod.assert_called_once_with("kube-system", watch=False)
+        mock_v1.list_namespaced_pod.assert_called_once_with("kube-system", watch=False, limit=500, _preload_content=False)
 
     @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
-    def test_list_pods_specific_namespace_short(self, mock_api, mock_pod):
+    def test_list_pods_specific_namespace_short(self, mock_api, mock_pod, list_response):
         """Test listing pods in a specific namespace."""
         mock_v1 = Mock()
         mock_api.return_value = mock_v1
 
-        mock_pods = Mock()
-        mock_pods.items = [mock_pod]
-        mock_v1.list_namespaced_pod.return_value = mock_pods
+        mock_v1.list_namespaced_pod.return_value = list_response(mock_pod)
 
         result = runner.invoke(pods.app, ["list", "-n", "kube-system"])
 
         assert result.exit_code == 0
-        mock_v1.list_namespaced_pod.assert_called_once_with("kube-system", watch=False)
+        mock_v1.list_namespaced_pod.assert_called_once_with("kube-system", watch=False, limit=500, _preload_content=False)
 
     @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
-    def test_list_pods_all_namespaces_long(self, mock_api, mock_pod):
+    def test_list_pods_all_namespaces_long(self, mock_api, mock_pod, list_response):
         """Test listing pods across all namespaces."""
         mock_v1 = Mock()
         mock_api.return_value = mock_v1
 
-        mock_pods = Mock()
-        mock_pods.items = [mock_pod]
-        mock_v1.list_pod_for_all_namespaces.return_value = mock_pods
+        mock_v1.list_pod_for_all_namespaces.return_value = list_response(mock_pod)
 
         result = runner.invoke(pods.app, ["list", "--all-namespaces"])
 
         assert result.exit_code == 0
-        mock_v1.list_pod_for_all_namespaces.assert_called_once_with(watch=False)
+        mock_v1.list_pod_for_all_namespaces.assert_called_once_with(watch=False, limit=500, _preload_content=False)
 
     @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
-    def test_list_pods_all_namespaces_short(self, mock_api, mock_pod):
+    def test_list_pods_all_namespaces_short(self, mock_api, mock_pod, list_response):
         """Test listing pods across all namespaces."""
         mock_v1 = Mock()
         mock_api.return_value = mock_v1
 
-        mock_pods = Mock()
-        mock_pods.items = [mock_pod]
-        mock_v1.list_pod_for_all_namespaces.return_value = mock_pods
+        mock_v1.list_pod_for_all_namespaces.return_value = list_response(mock_pod)
 
         result = runner.invoke(pods.app, ["list", "-A"])
 
         assert result.exit_code == 0
-        mock_v1.list_pod_for_all_namespaces.assert_called_once_with(watch=False)
+        mock_v1.list_pod_for_all_namespaces.assert_called_once_with(watch=False, limit=500, _preload_content=False)
+
+    @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
+    def test_list_pods_paginates(self, mock_api, mock_pod, mock_unhealthy_pod, list_response):
+        """Test that every page is listed with the requested page size."""
+        mock_v1 = Mock()
+        mock_api.return_value = mock_v1
+        mock_v1.list_pod_for_all_namespaces.side_effect = [
+            list_response(mock_pod, continue_token="next-page"),
+            list_response(mock_unhealthy_pod),
+        ]
+
+        result = runner.invoke(pods.app, ["list", "-A", "--page-size", "1"])
+
+        assert result.exit_code == 0
+        assert "test-pod" in result.output
+        assert "failing-pod" in result.output
+        assert mock_v1.list_pod_for_all_namespaces.call_args_list == [
+            call(watch=False, limit=1, _preload_content=False),
+            call(watch=False, limit=1, _preload_content=False, _continue="next-page"),
+        ]
+
+    @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
+    def test_list_pods_with_selectors(self, mock_api, mock_pod, list_response):
+        """Test that label and field selectors are sent to the apiserver."""
+        mock_v1 = Mock()
+        mock_api.return_value = mock_v1
+        mock_v1.list_namespaced_pod.return_value = list_response(mock_pod)
+
+        result = runner.invoke(pods.app, ["list", "-n", "default", "-l", "app=web", "--field-selector", "status.phase=Running"])
+
+        assert result.exit_code == 0
+        mock_v1.list_namespaced_pod.assert_called_once_with(
+            "default", watch=False, limit=500, _preload_content=False, label_selector="app=web", field_selector="status.phase=Running"
+        )
+
+    @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
+    def test_list_pods_multiple_namespaces(self, mock_api, list_response):
+        """Test that several namespaces are each listed and merged in the order given."""
+        mock_v1 = Mock()
+        mock_api.return_value = mock_v1
+        mock_v1.list_namespaced_pod.side_effect = lambda namespace, **kwargs: list_response(
+            {"metadata": {"namespace": namespace, "name": f"{namespace}-pod"}, "status": {"phase": "Running"}}
+        )
+
+        result = runner.invoke(pods.app, ["list", "-n", "team-a", "-n", "team-b,team-c", "-n", "team-a"])
+
+        assert result.exit_code == 0
+        assert sorted(c.args[0] for c in mock_v1.list_namespaced_pod.call_args_list) == ["team-a", "team-b", "team-c"]
+        assert result.output.index("team-a-pod") < result.output.index("team-b-pod") < result.output.index("team-c-pod")
+        assert "namespaces team-a, team-b, team-c" in result.output
+
+    @patch("devopstoolbox.k8s.utils.ApiClient")
+    @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
+    def test_list_pods_multiple_contexts(self, mock_api, mock_api_client, mock_pod, list_response, kubeconfig_file):
+        """Test that every context is listed with its own client under a Cluster column."""
+        clients = {"https://prod.example.com": MagicMock(), "https://stage.example.com": MagicMock()}
+        mock_api_client.side_effect = lambda configuration: clients[configuration.host]
+        mock_api.side_effect = lambda api_client: Mock(list_pod_for_all_namespaces=Mock(return_value=list_response(mock_pod)))
+
+        result = runner.invoke(pods.app, ["list", "-A", "--context", "prod", "--context", "stage"])
+
+        assert result.exit_code == 0
+        assert {c.args[0] for c in mock_api.call_args_list} == set(clients.values())
+        assert "Cluster" in result.output
+        assert result.output.count("test-pod") == 2
+        assert "all namespaces of contexts prod, stage" in result.output
 
     @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
-    def test_list_pods_handles_no_container_statuses(self, mock_api):
+    def test_list_pods_handles_no_container_statuses(self, mock_api, list_response):
         """Test handling pods with no container statuses."""
         mock_v1 = Mock()
         mock_api.return_value = mock_v1
 
-        pod = Mock()
-        pod.metadata.namespace = "default"
-        pod.metadata.name = "pending-pod"
-        pod.status.phase = "Pending"
-        pod.status.container_statuses = None
+        pod = {"metadata": {"namespace": "default", "name": "pending-pod"}, "status": {"phase": "Pending", "containerStatuses": None}}
 
-        mock_pods = Mock()
-        mock_pods.items = [pod]
-        mock_v1.list_namespaced_pod.return_value = mock_pods
+        mock_v1.list_namespaced_pod.return_value = list_response(pod)
 
         result = runner.invoke(pods.app, ["list"])
 
@@ -183,36 +218,48 @@ class TestPodsUnhealthyCommand:
     """Tests for pods unhealthy command."""
 
     @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
-    def test_unhealthy_filters_running_pods(self, mock_api, mock_pod, mock_unhealthy_pod):
-        """Test that running pods are filtered out."""
+    def test_unhealthy_filters_running_pods(self, mock_api, mock_pod, mock_unhealthy_pod, list_response):
+        """Test that running and succeeded pods are filtered out by the apiserver."""
         mock_v1 = Mock()
         mock_api.return_value = mock_v1
 
-        mock_pods = Mock()
-        mock_pods.items = [mock_pod, mock_unhealthy_pod]
-        mock_v1.list_namespaced_pod.return_value = mock_pods
+        mock_v1.list_namespaced_pod.return_value = list_response(mock_unhealthy_pod)
 
-        result = runner.invoke(pods.app, ["unhealthy"])
+        result = runner.invoke(pods.app, ["unhealthy", "-n", "default"])
+
+        assert result.exit_code == 0
+        assert "failing-pod" in result.output
+        mock_v1.list_namespaced_pod.assert_called_once_with(
+            "default", watch=False, limit=500, _preload_content=False, field_selector="status.phase!=Running,status.phase!=Succeeded"
+        )
+
+    @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
+    def test_unhealthy_combines_selectors(self, mock_api, list_response):
+        """Test that user selectors are ANDed with the phase filter."""
+        mock_v1 = Mock()
+        mock_api.return_value = mock_v1
+        mock_v1.list_pod_for_all_namespaces.return_value = list_response()
+
+        result = runner.invoke(pods.app, ["unhealthy", "-A", "-l", "app=web", "--field-selector", "spec.nodeName=node-1"])
 
         assert result.exit_code == 0
-        # Should show the unhealthy pod but not the running one
-        assert "failing-pod" in result.output or "CrashLoopBackOff" in result.output or result.exit_code == 0
+        mock_v1.list_pod_for_all_namespaces.assert_called_once_with(
+            watch=False,
+            limit=500,
+            _preload_content=False,
+            label_selector="app=web",
+            field_selector="status.phase!=Running,status.phase!=Succeeded,spec.nodeName=node-1",
+        )
 
     @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
-    def test_unhealthy_filters_succeeded_pods(self, mock_api):
+    def test_unhealthy_filters_succeeded_pods(self, mock_api, list_response):
         """Test that succeeded pods are filtered out."""
         mock_v1 = Mock()
         mock_api.return_value = mock_v1
 
-        succeeded_pod = Mock()
-        succeeded_pod.metadata.namespace = "default"
-        succeeded_pod.metadata.name = "completed-job"
-        succeeded_pod.status.phase = "Succeeded"
-        succeeded_pod.status.container_statuses = []
+        succeeded_pod = {"metadata": {"namespace": "default", "name": "completed-job"}, "status": {"phase": "Succeeded", "containerStatuses": []}}
 
-        mock_pods = Mock()
-        mock_pods.items = [succeeded_pod]
-        mock_v1.list_namespaced_pod.return_value = mock_pods
+        mock_v1.list_namespaced_pod.return_value = list_response(succeeded_pod)
 
         result = runner.invoke(pods.app, ["unhealthy"])
 
@@ -257,7 +304,7 @@ class TestPodsMetricsCommand:
 
     @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
     @patch("devopstoolbox.k8s.pods.CustomObjectsApi")
-    def test_metrics_specific_namespace(self, mock_custom_api_class, mock_core_api, mock_container):
+    def test_metrics_specific_namespace(self, mock_custom_api_class, mock_core_api, mock_container, list_response):
         mock_custom_api = Mock()
         mock_custom_api_class.return_value = mock_custom_api
         mock_custom_api.list_namespaced_custom_object.return_value = {"items": []}
@@ -265,14 +312,9 @@ class TestPodsMetricsCommand:
         mock_v1 = Mock()
         mock_core_api.return_value = mock_v1
 
-        pod = Mock()
-        pod.metadata.namespace = "default"
-        pod.metadata.name = "test-pod"
-        pod.spec.containers = [mock_container]
+        pod = {"metadata": {"namespace": "default", "name": "test-pod"}, "spec": {"containers": [mock_container]}}
 
-        mock_pods = Mock()
-        mock_pods.items = [pod]
-        mock_v1.list_namespaced_pod.return_value = mock_pods
+        mock_v1.list_namespaced_pod.return_value = list_response(pod)
 
         result = runner.invoke(pods.app, ["metrics", "--namespace", "kube-system"])
 
@@ -280,14 +322,14 @@ class TestPodsMetricsCommand:
 
     @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
     @patch("devopstoolbox.k8s.pods.CustomObjectsApi")
-    def test_metrics_all_namespaces(self, mock_custom_api_class, mock_core_api):
+    def test_metrics_all_namespaces(self, mock_custom_api_class, mock_core_api, list_response):
         mock_custom_api = Mock()
         mock_custom_api_class.return_value = mock_custom_api
         mock_custom_api.list_cluster_custom_object.return_value = {"items": []}
 
         mock_v1 = Mock()
         mock_core_api.return_value = mock_v1
-        mock_v1.list_pod_for_all_namespaces.return_value = Mock(items=[])
+        mock_v1.list_pod_for_all_namespaces.return_value = list_response()
 
         result = runner.invoke(pods.app, ["metrics", "--all-namespaces"])
 
@@ -297,7 +339,7 @@ class TestPodsMetricsCommand:
 
     @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
     @patch("devopstoolbox.k8s.pods.CustomObjectsApi")
-    def test_metrics_displays_all_fields(self, mock_custom_api_class, mock_core_api, mock_container, mock_pod_metrics):
+    def test_metrics_displays_all_fields(self, mock_custom_api_class, mock_core_api, mock_container, mock_pod_metrics, list_response):
         mock_custom_api = Mock()
         mock_custom_api_class.return_value = mock_custom_api
         mock_custom_api.list_namespaced_custom_object.return_value = mock_pod_metrics
@@ -305,15 +347,9 @@ class TestPodsMetricsCommand:
         mock_v1 = Mock()
         mock_core_api.return_value = mock_v1
 
-        pod = Mock()
-        pod.metadata.namespace = "default"
-        pod.metadata.name = "test-pod"
-        mock_container.name = "main"
-        pod.spec.containers = [mock_container]
+        pod = {"metadata": {"namespace": "default", "name": "test-pod"}, "spec": {"containers": [mock_container]}}
 
-        mock_pods = Mock()
-        mock_pods.items = [pod]
-        mock_v1.list_namespaced_pod.return_value = mock_pods
+        mock_v1.list_namespaced_pod.return_value = list_response(pod)
 
         result = runner.invoke(pods.app, ["metrics", "-n", "default"])
 
@@ -321,3 +357,185 @@ class TestPodsMetricsCommand:
         assert "Pod Resources" in result.output
         mock_custom_api.list_namespaced_custom_object.assert_called_once()
         mock_v1.list_namespaced_pod.assert_called_once()
+
+    def test_metrics_usage_and_percentages(self, mock_container, mock_pod_metrics):
+        """Test that usage is converted and compared with the limits of the matching container."""
+        mock_custom_api = Mock()
+        mock_custom_api.list_namespaced_custom_object.return_value = mock_pod_metrics
+        other = {"name": "sidecar", "resources": {}}
+        pod = {"metadata": {"namespace": "default", "name": "test-pod"}, "spec": {"containers": [mock_container, other]}}
+
+        rows = pods._container_rows([pod], pods._fetch_metrics(mock_custom_api, ["default"], False, 500, None))
+
+        assert rows == [
+            ("default", "test-pod", "main", "100m", "200m", "50.00m", "25.00%", "128Mi", "256Mi", "64.00 Mi", "25.00%"),
+            ("default", "test-pod", "sidecar", "-", "-", "-", "-", "-", "-", "-", "-"),
+        ]
+
+    @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
+    @patch("devopstoolbox.k8s.pods.CustomObjectsApi")
+    def test_metrics_label_selector(self, mock_custom_api_class, mock_core_api, list_response):
+        """Test that the label selector filters both metrics and pods, the field selector only pods."""
+        mock_custom_api = Mock()
+        mock_custom_api_class.return_value = mock_custom_api
+        mock_custom_api.list_namespaced_custom_object.return_value = {"items": []}
+
+        mock_v1 = Mock()
+        mock_core_api.return_value = mock_v1
+        mock_v1.list_namespaced_pod.return_value = list_response()
+
+        result = runner.invoke(pods.app, ["metrics", "-n", "default", "-l", "app=web", "--field-selector", "spec.nodeName=node-1"])
+
+        assert result.exit_code == 0
+        assert mock_custom_api.list_namespaced_custom_object.call_args.kwargs["label_selector"] == "app=web"
+        assert "field_selector" not in mock_custom_api.list_namespaced_custom_object.call_args.kwargs
+        assert mock_v1.list_namespaced_pod.call_args.kwargs["field_selector"] == "spec.nodeName=node-1"
+
+    @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
+    @patch("devopstoolbox.k8s.pods.CustomObjectsApi")
+    def test_metrics_and_pods_are_fetched_concurrently(self, mock_custom_api_class, mock_core_api, mock_container, mock_pod_metrics, list_response):
+        """Test that the metrics request is still in flight when the pod list is requested."""
+        pods_requested = threading.Event()
+
+        def list_metrics(**kwargs):
+            # Deadlocks (and times out into a warning) if the pod list waits for the metrics.
+            assert pods_requested.wait(timeout=5)
+            return mock_pod_metrics
+
+        def list_pods(*args, **kwargs):
+            pods_requested.set()
+            return list_response({"metadata": {"namespace": "default", "name": "test-pod"}, "spec": {"containers": [mock_container]}})
+
+        mock_custom_api = Mock()
+        mock_custom_api_class.return_value = mock_custom_api
+        mock_custom_api.list_namespaced_custom_object.side_effect = list_metrics
+        mock_v1 = Mock()
+        mock_core_api.return_value = mock_v1
+        mock_v1.list_namespaced_pod.side_effect = list_pods
+
+        result = runner.invoke(pods.app, ["metrics", "-n", "default"])
+
+        assert result.exit_code == 0
+        assert "Warning" not in result.output
+        assert "Pod Resources" in result.output
+
+    @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
+    @patch("devopstoolbox.k8s.pods.CustomObjectsApi")
+    def test_metrics_failure_still_lists_pods(self, mock_custom_api_class, mock_core_api, mock_container, list_response):
+        """Test that pods are listed without usage when the metrics request fails."""
+        mock_custom_api = Mock()
+        mock_custom_api_class.return_value = mock_custom_api
+        mock_custom_api.list_namespaced_custom_object.side_effect = Exception("metrics unavailable")
+        mock_v1 = Mock()
+        mock_core_api.return_value = mock_v1
+        mock_v1.list_namespaced_pod.return_value = list_response({"metadata": {"namespace": "default", "name": "test-pod"}, "spec": {"containers": [mock_container]}})
+
+        result = runner.invoke(pods.app, ["metrics", "-n", "default"])
+
+        assert result.exit_code == 0
+        assert "Warning: Could not fetch metrics" in result.output
+        assert "metrics unavailable" in result.output
+        assert "Pod Resources" in result.output
+
+
+class TestPodsWatch:
+    """Tests for the --watch mode of pods list and unhealthy."""
+
+    def test_render_shows_rows_and_errors(self):
+        informer = Mock(error=Exception("connection reset"))
+        informer.store.list.return_value = [
+            {"metadata": {"namespace": "default", "name": "b"}, "status": {"phase": "Running"}},
+            {"metadata": {"namespace": "default", "name": "a"}, "status": {"phase": "Failed"}},
+        ]
+
+        table = pods._render_watch("Pods", [], [(None, informer)])
+
+        assert table.row_count == 2
+        assert "connection reset" in table.caption
+
+    @patch("devopstoolbox.k8s.pods._watch_pods")
+    def test_watch_flag(self, mock_watch):
+        """Test that --watch hands the selectors to the live view instead of listing once."""
+        result = runner.invoke(pods.app, ["unhealthy", "-n", "default", "--watch"])
+
+        assert result.exit_code == 0
+        mock_watch.assert_called_once_with("Pods in namespace default", [], ["default"], False, 500, {"field_selector": pods.UNHEALTHY_FIELD_SELECTOR})
+
+
+def workload_pod(name, node, owner=None, template_hash=None, labels=None, cpu="100m", memory="128Mi"):
+    metadata = {"namespace": "default", "name": name, "labels": {**(labels or {})}}
+    if template_hash:
+        metadata["labels"]["pod-template-hash"] = template_hash
+    if owner:
+        metadata["ownerReferences"] = [{"kind": owner[0], "name": owner[1], "controller": True}]
+    resources = {"requests": {"cpu": cpu, "memory": memory}, "limits": {"cpu": "1", "memory": "1Gi"}}
+    return {"metadata": metadata, "spec": {"nodeName": node, "containers": [{"name": "main", "resources": resources}]}}
+
+
+class TestPodsMetricsGroupBy:
+    """Tests for pods metrics --group-by."""
+
+    @pytest.fixture
+    def workload(self):
+        pods_ = [
+            workload_pod("web-7d4b9-a", "node-1", ("ReplicaSet", "web-7d4b9"), "7d4b9", {"team": "shop"}),
+            workload_pod("web-7d4b9-b", "node-2", ("ReplicaSet", "web-7d4b9"), "7d4b9", {"team": "shop"}),
+            workload_pod("db-0", "node-1", ("StatefulSet", "db"), labels={"team": "data"}, cpu="1", memory="1.5Gi"),
+            workload_pod("debug", "node-2"),
+        ]
+        usage = {
+            ("default", "web-7d4b9-a", "main"): {"cpu": "50000000n", "memory": "64Mi"},
+            ("default", "web-7d4b9-b", "main"): {"cpu": "100m", "memory": "128Mi"},
+            ("default", "db-0", "main"): {"cpu": "2", "memory": "768Mi"},
+        }
+        return pods_, usage
+
+    def test_group_keys(self, workload):
+        pods_, _ = workload
+
+        assert [pods._group_key_func("owner")(pod) for pod in pods_] == ["default/Deployment/web", "default/Deployment/web", "default/StatefulSet/db", "default/Pod/debug"]
+        assert [pods._group_key_func("node")(pod) for pod in pods_] == ["node-1", "node-2", "node-1", "node-2"]
+        assert [pods._group_key_func("label=team")(pod) for pod in pods_] == ["shop", "shop", "data", "-"]
+        assert pods._group_key_func("namespace")(pods_[0]) == "default"
+        assert pods._group_key_func("pod") is None
+        assert pods._group_key_func("label=") is None
+
+    def test_aggregation(self, workload):
+        """Test exact sums and usage/request percentiles per group, busiest group first."""
+        pods_, usage = workload
+
+        rows = pods._group_rows(pods._aggregate([(pods_[:2], usage), (pods_[2:], usage)], pods._group_key_func("owner")))
+
+        assert rows == [
+            ("default/StatefulSet/db", "1", "1", "1000.00m", "1000.00m", "2000.00m", "200% / 200% / 200%", "1.50 Gi", "1.00 Gi", "768.00 Mi", "50% / 50% / 50%"),
+            ("default/Deployment/web", "2", "2", "200.00m", "2000.00m", "150.00m", "50% / 100% / 100%", "256.00 Mi", "2.00 Gi", "192.00 Mi", "50% / 100% / 100%"),
+            ("default/Pod/debug", "1", "1", "100.00m", "1000.00m", "0.00m", "-", "128.00 Mi", "1.00 Gi", "0 B", "-"),
+        ]
+
+    @patch("devopstoolbox.k8s.pods.client.CoreV1Api")
+    @patch("devopstoolbox.k8s.pods.CustomObjectsApi")
+    def test_group_by_top(self, mock_custom_api_class, mock_core_api, workload, list_response):
+        pods_, usage = workload
+        mock_custom_api_class.return_value.list_namespaced_custom_object.return_value = {
+            "items": [{"metadata": {"namespace": ns, "name": name}, "containers": [{"name": container, "usage": value}]} for (ns, name, container), value in usage.items()]
+        }
+        mock_core_api.return_value.list_namespaced_pod.return_value = list_response(*pods_)
+
+        result = runner.invoke(pods.app, ["metrics", "-n", "default", "--group-by", "label=team", "--top", "1"])
+
+        assert result.exit_code == 0
+        assert "Pod Resources by label=team" in result.output
+        assert "data" in result.output
+        assert "shop" not in result.output
+
+    def test_invalid_group_by(self):
+        result = runner.invoke(pods.app, ["metrics", "--group-by", "pod"])
+
+        assert result.exit_code == 1
+        assert "--group-by must be" in result.output
+
+    def test_top_requires_group_by(self):
+        result = runner.invoke(pods.app, ["metrics", "--top", "5"])
+
+        assert result.exit_code == 1
+        assert "--top requires --group-by" in result.output
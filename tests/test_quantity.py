@@ -0,0 +1,106 @@
+"""Tests for devopstoolbox.k8s.quantity module."""
+
+import math
+
+import pytest
+
+from devopstoolbox.k8s import quantity
+from devopstoolbox.k8s.quantity import Quantity, format_cpu, format_memory, format_percentages, parse_quantities, parse_quantity, percentages
+
+
+class TestParseQuantity:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("128974848", 128974848),
+            ("129e6", 129e6),
+            ("129E+6", 129e6),
+            ("129M", 129e6),
+            ("123Mi", 123 * 2**20),
+            ("1.5Gi", 1.5 * 2**30),
+            ("2Ei", 2 * 2**60),
+            ("1Pi", 2**50),
+            ("500k", 500e3),
+            ("1E", 1e18),
+            ("250m", 0.25),
+            ("0.5", 0.5),
+            (".5", 0.5),
+            ("1.", 1),
+            ("25160674n", 0.025160674),
+            ("100u", 0.0001),
+            ("-1", -1),
+            ("1e-3", 0.001),
+        ],
+    )
+    def test_grammar(self, value, expected):
+        assert parse_quantity(value) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("value", [None, "", "x", "100MB", "1Ki1", "1.2.3", "Mi", "1 Gi"])
+    def test_invalid_is_nan(self, value):
+        assert math.isnan(parse_quantity(value))
+
+
+class TestQuantity:
+    def test_canonical_form(self):
+        """Test that equal amounts written differently parse to the same exact value."""
+        assert Quantity.parse("1.5Gi") == Quantity.parse("1536Mi") == Quantity.parse("1610612736")
+        assert Quantity.parse("1.5").nanos == Quantity.parse("1500m").nanos == 1_500_000_000
+        assert Quantity.parse("129e6") == Quantity.parse("129M") == Quantity.parse("0.129G")
+
+    def test_exact_arithmetic(self):
+        assert Quantity.parse("0.1") + Quantity.parse("0.2") == Quantity.parse("300m")
+        assert sum([Quantity.parse("100m")] * 3) == Quantity.parse("300m")
+        assert Quantity.parse("1Gi") / Quantity.parse("4Gi") == 0.25
+        assert Quantity.parse("250m") < Quantity.parse("1")
+        assert float(Quantity.parse("1500m")) == 1.5
+
+    def test_rounds_up_to_nano(self):
+        assert Quantity.parse("0.1n").nanos == 1
+        assert Quantity.parse("1e-12").nanos == 1
+        assert not Quantity.parse("0")
+
+    def test_invalid(self):
+        assert Quantity.parse("1e100") is None
+        assert Quantity.parse("x") is None
+        assert Quantity.parse(None) is None
+        assert Quantity.parse(1024) is None
+
+    def test_compact_and_memoized(self):
+        assert not hasattr(Quantity(), "__dict__")
+        assert Quantity.parse("64Mi") is Quantity.parse("64Mi")
+
+
+class TestColumns:
+    """Tests for the column helpers, run with NumPy columns and with the ``array("d")`` fallback."""
+
+    @pytest.fixture(autouse=True, params=["numpy", "array"])
+    def backend(self, request, monkeypatch):
+        monkeypatch.setattr(quantity, "numpy", pytest.importorskip("numpy") if request.param == "numpy" else None)
+        return request.param
+
+    def test_column_type(self, backend):
+        column = parse_quantities(["1", "3"])
+
+        if backend == "numpy":
+            assert isinstance(column, quantity.numpy.ndarray)
+        else:
+            assert column.typecode == "d"
+
+    def test_parse_quantities(self):
+        column = parse_quantities(["100m", None, "100m", "1Gi"])
+
+        assert column[0] == column[2] == pytest.approx(0.1)
+        assert math.isnan(column[1])
+        assert column[3] == 2**30
+
+    def test_percentages_skip_missing_and_zero(self):
+        result = percentages(parse_quantities(["50m", "1", None, "1"]), parse_quantities(["200m", "0", "1", None]))
+
+        assert result[0] == pytest.approx(25)
+        assert all(math.isnan(value) for value in result[1:])
+
+    def test_formatting(self):
+        assert format_cpu(parse_quantities(["25160674n", "1", None])) == ["25.16m", "1000.00m", "-"]
+        assert format_memory(parse_quantities(["7988Ki", "1Ti", "512", "0", None])) == ["7.80 Mi", "1024.00 Gi", "512 B", "0 B", "-"]
+        assert format_percentages(percentages(parse_quantities(["1"]), parse_quantities(["3"]))) == ["33.33%"]
+        assert format_percentages(percentages(parse_quantities(["1", "1"]), parse_quantities(["3", "0"]))) == ["33.33%", "-"]
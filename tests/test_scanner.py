@@ -0,0 +1,123 @@
+"""Tests for devopstoolbox.scanner module."""
+
+import pytest
+from typer.testing import CliRunner
+
+from devopstoolbox.main import app as main_app
+from devopstoolbox.scanner import IgnoreRule, iter_files
+
+runner = CliRunner()
+
+
+def relative(root, files):
+    return sorted(str(path.relative_to(root)) for path in files)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Create a small repository-like tree."""
+    for rel_path in [
+        "app.yaml",
+        "app.yml",
+        "config.json",
+        "notes.txt",
+        "charts/web/values.yaml",
+        "charts/web/charts/redis/values.yaml",
+        "node_modules/pkg/package.json",
+        ".git/config.yaml",
+        "build/output.yaml",
+        "env/prod/secret.yaml",
+        "env/prod/keep.yaml",
+    ]:
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('{"key": "value"}' if path.suffix == ".json" else "key: value\n")
+    return tmp_path
+
+
+class TestIgnoreRule:
+    @pytest.mark.parametrize(
+        "pattern, path, is_dir, expected",
+        [
+            ("*.yaml", "a/b/c.yaml", False, True),
+            ("*.yaml", "a/b/c.json", False, False),
+            ("build/", "build", True, True),
+            ("build/", "build", False, False),
+            ("/build", "sub/build", True, False),
+            ("docs/*.md", "docs/a.md", False, True),
+            ("docs/*.md", "docs/sub/a.md", False, False),
+            ("**/charts", "a/b/charts", True, True),
+            ("charts/**", "charts/a/b.yaml", False, True),
+            ("a/**/b", "a/x/y/b", True, True),
+            ("a/**/b", "a/b", True, True),
+            ("file?.yaml", "file1.yaml", False, True),
+            ("file[!0-9].yaml", "file1.yaml", False, False),
+            ("file[!0-9].yaml", "filex.yaml", False, True),
+        ],
+    )
+    def test_match(self, pattern, path, is_dir, expected):
+        assert IgnoreRule(pattern).match(path, is_dir) is expected
+
+    def test_negation(self):
+        rule = IgnoreRule("!keep.yaml")
+        assert rule.negate is True
+        assert rule.match("env/keep.yaml", False) is True
+
+
+class TestIterFiles:
+    def test_single_pass_multiple_extensions(self, tree):
+        files = iter_files(tree, (".yaml", ".yml"))
+        assert relative(tree, files) == [
+            "app.yaml",
+            "app.yml",
+            "build/output.yaml",
+            "charts/web/charts/redis/values.yaml",
+            "charts/web/values.yaml",
+            "env/prod/keep.yaml",
+            "env/prod/secret.yaml",
+        ]
+
+    def test_prunes_default_directories(self, tree):
+        assert relative(tree, iter_files(tree, (".json",))) == ["config.json"]
+
+    def test_exclude_patterns(self, tree):
+        files = iter_files(tree, (".yaml",), excludes=["charts/*/charts", "build/"])
+        assert "charts/web/charts/redis/values.yaml" not in relative(tree, files)
+        assert "build/output.yaml" not in relative(tree, iter_files(tree, (".yaml",), excludes=["build/"]))
+
+    def test_respects_nested_gitignore(self, tree):
+        (tree / ".gitignore").write_text("# build output\nbuild/\n")
+        (tree / "env" / ".gitignore").write_text("prod/*.yaml\n!prod/keep.yaml\n")
+        files = relative(tree, iter_files(tree, (".yaml",)))
+        assert "build/output.yaml" not in files
+        assert "env/prod/secret.yaml" not in files
+        assert "env/prod/keep.yaml" in files
+
+    def test_gitignore_can_be_disabled(self, tree):
+        (tree / ".gitignore").write_text("build/\n")
+        assert "build/output.yaml" in relative(tree, iter_files(tree, (".yaml",), use_gitignore=False))
+
+    def test_symlinked_directories_skipped_by_default(self, tree):
+        (tree / "link").symlink_to(tree / "charts", target_is_directory=True)
+        assert not any(path.startswith("link/") for path in relative(tree, iter_files(tree, (".yaml",))))
+
+    def test_symlink_loop_terminates(self, tree):
+        (tree / "charts" / "web" / "loop").symlink_to(tree, target_is_directory=True)
+        files = relative(tree, iter_files(tree, (".yaml",), follow_symlinks=True))
+        assert files.count("app.yaml") == 1
+        assert not any("loop" in path for path in files)
+
+
+class TestValidateCommandsUseScanner:
+    def test_yaml_skips_ignored_paths(self, tree):
+        (tree / ".gitignore").write_text("build/\nenv/\n")
+        (tree / "build" / "output.yaml").write_text("key: value\n  bad: indent\n")
+        result = runner.invoke(main_app, ["validate", "yaml", "-d", str(tree), "--exclude", "charts/"])
+        assert result.exit_code == 0
+        assert "2 valid, 0 invalid" in result.stdout
+
+    def test_json_no_gitignore(self, tree):
+        (tree / ".gitignore").write_text("*.json\n")
+        result = runner.invoke(main_app, ["validate", "json", "-d", str(tree), "--no-gitignore"])
+        assert result.exit_code == 0
+        assert "1 valid, 0 invalid" in result.stdout
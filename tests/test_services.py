@@ -1,6 +1,6 @@
 """Tests for devopstoolbox.k8s.services module."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 from typer.testing import CliRunner
@@ -19,78 +19,61 @@ def mock_kube_config():
 
 @pytest.fixture
 def mock_service():
-    """Create a mock service object."""
-    service = Mock()
-    service.metadata.namespace = "default"
-    service.metadata.name = "test-service"
-    service.spec.type = "ClusterIP"
-    service.spec.internal_traffic_policy = "Cluster"
-    return service
+    """Create a service as returned by the API."""
+    return {"metadata": {"namespace": "default", "name": "test-service"}, "spec": {"type": "ClusterIP", "internalTrafficPolicy": "Cluster"}}
 
 
 class TestServicesListCommand:
     """Tests for services list command."""
 
     @patch("devopstoolbox.k8s.services.client.CoreV1Api")
-    def test_list_services_default_namespace(self, mock_api, mock_service):
+    def test_list_services_default_namespace(self, mock_api, mock_service, list_response):
         """Test listing services in default namespace."""
         mock_v1 = Mock()
         mock_api.return_value = mock_v1
 
-        mock_services = Mock()
-        mock_services.items = [mock_service]
-        mock_v1.list_namespaced_service.return_value = mock_services
+        mock_v1.list_namespaced_service.return_value = list_response(mock_service)
 
         result = runner.invoke(services.app, ["-n", "default"])
 
         assert result.exit_code == 0
-        mock_v1.list_namespaced_service.assert_called_once_with("default", watch=False)
+        mock_v1.list_namespaced_service.assert_called_once_with("default", watch=False, limit=500, _preload_content=False)
 
     @patch("devopstoolbox.k8s.services.client.CoreV1Api")
-    def test_list_services_specific_namespace(self, mock_api, mock_service):
+    def test_list_services_specific_namespace(self, mock_api, mock_service, list_response):
         """Test listing services in a specific namespace."""
         mock_v1 = Mock()
         mock_api.return_value = mock_v1
 
-        mock_services = Mock()
-        mock_services.items = [mock_service]
-        mock_v1.list_namespaced_service.return_value = mock_services
+        mock_v1.list_namespaced_service.return_value = list_response(mock_service)
 
         result = runner.invoke(services.app, ["--namespace", "kube-system"])
 
         assert result.exit_code == 0
-        mock_v1.list_namespaced_service.assert_called_once_with("kube-system", watch=False)
+        mock_v1.list_namespaced_service.assert_called_once_with("kube-system", watch=False, limit=500, _preload_content=False)
 
     @patch("devopstoolbox.k8s.services.client.CoreV1Api")
-    def test_list_services_all_namespaces(self, mock_api, mock_service):
+    def test_list_services_all_namespaces(self, mock_api, mock_service, list_response):
         """Test listing services across all namespaces."""
         mock_v1 = Mock()
         mock_api.return_value = mock_v1
 
-        mock_services = Mock()
-        mock_services.items = [mock_service]
-        mock_v1.list_service_for_all_namespaces.return_value = mock_services
+        mock_v1.list_service_for_all_namespaces.return_value = list_response(mock_service)
 
         result = runner.invoke(services.app, ["--all-namespaces"])
 
         assert result.exit_code == 0
-        mock_v1.list_service_for_all_namespaces.assert_called_once_with(watch=False)
+        mock_v1.list_service_for_all_namespaces.assert_called_once_with(watch=False, limit=500, _preload_content=False)
 
     @patch("devopstoolbox.k8s.services.client.CoreV1Api")
-    def test_list_services_no_traffic_policy(self, mock_api):
+    def test_list_services_no_traffic_policy(self, mock_api, list_response):
         """Test handling services with no internal traffic policy."""
         mock_v1 = Mock()
         mock_api.return_value = mock_v1
 
-        service = Mock()
-        service.metadata.namespace = "default"
-        service.metadata.name = "external-service"
-        service.spec.type = "LoadBalancer"
-        service.spec.internal_traffic_policy = None
+        service = {"metadata": {"namespace": "default", "name": "external-service"}, "spec": {"type": "LoadBalancer", "internalTrafficPolicy": None}}
 
-        mock_services = Mock()
-        mock_services.items = [service]
-        mock_v1.list_namespaced_service.return_value = mock_services
+        mock_v1.list_namespaced_service.return_value = list_response(service)
 
         result = runner.invoke(services.app, [])
 
@@ -109,33 +92,47 @@ class TestServicesListCommand:
         assert "Error" in result.output
 
     @patch("devopstoolbox.k8s.services.client.CoreV1Api")
-    def test_list_services_multiple_types(self, mock_api):
+    def test_list_services_multiple_types(self, mock_api, list_response):
         """Test listing services of different types."""
         mock_v1 = Mock()
         mock_api.return_value = mock_v1
 
-        cluster_ip_svc = Mock()
-        cluster_ip_svc.metadata.namespace = "default"
-        cluster_ip_svc.metadata.name = "cluster-svc"
-        cluster_ip_svc.spec.type = "ClusterIP"
-        cluster_ip_svc.spec.internal_traffic_policy = "Cluster"
+        cluster_ip_svc = {"metadata": {"namespace": "default", "name": "cluster-svc"}, "spec": {"type": "ClusterIP", "internalTrafficPolicy": "Cluster"}}
+        node_port_svc = {"metadata": {"namespace": "default", "name": "nodeport-svc"}, "spec": {"type": "NodePort", "internalTrafficPolicy": "Local"}}
+        lb_svc = {"metadata": {"namespace": "default", "name": "lb-svc"}, "spec": {"type": "LoadBalancer", "internalTrafficPolicy": None}}
 
-        node_port_svc = Mock()
-        node_port_svc.metadata.namespace = "default"
-        node_port_svc.metadata.name = "nodeport-svc"
-        node_port_svc.spec.type = "NodePort"
-        node_port_svc.spec.internal_traffic_policy = "Local"
+        mock_v1.list_namespaced_service.return_value = list_response(cluster_ip_svc, node_port_svc, lb_svc)
 
-        lb_svc = Mock()
-        lb_svc.metadata.namespace = "default"
-        lb_svc.metadata.name = "lb-svc"
-        lb_svc.spec.type = "LoadBalancer"
-        lb_svc.spec.internal_traffic_policy = None
+        result = runner.invoke(services.app, [])
 
-        mock_services = Mock()
-        mock_services.items = [cluster_ip_svc, node_port_svc, lb_svc]
-        mock_v1.list_namespaced_service.return_value = mock_services
+        assert result.exit_code == 0
+        assert "nodeport-svc" in result.output
+        assert "LoadBalancer" in result.output
 
-        result = runner.invoke(services.app, [])
+    @patch("devopstoolbox.k8s.services.client.CoreV1Api")
+    def test_list_services_with_selectors(self, mock_api, mock_service, list_response):
+        """Test that label and field selectors are sent to the apiserver."""
+        mock_v1 = Mock()
+        mock_api.return_value = mock_v1
+        mock_v1.list_service_for_all_namespaces.return_value = list_response(mock_service)
+
+        result = runner.invoke(services.app, ["-A", "--label-selector", "team=payments", "--field-selector", "metadata.name!=kubernetes"])
+
+        assert result.exit_code == 0
+        mock_v1.list_service_for_all_namespaces.assert_called_once_with(
+            watch=False, limit=500, _preload_content=False, label_selector="team=payments", field_selector="metadata.name!=kubernetes"
+        )
+
+    @patch("devopstoolbox.k8s.services.client.CoreV1Api")
+    def test_list_services_multiple_namespaces(self, mock_api, mock_service, list_response):
+        """Test that every requested namespace is listed."""
+        mock_v1 = Mock()
+        mock_api.return_value = mock_v1
+        mock_v1.list_namespaced_service.return_value = list_response(mock_service)
+
+        result = runner.invoke(services.app, ["-n", "default,kube-system"])
 
         assert result.exit_code == 0
+        mock_v1.list_namespaced_service.assert_has_calls(
+            [call("default", watch=False, limit=500, _preload_content=False), call("kube-system", watch=False, limit=500, _preload_content=False)], any_order=True
+        )
@@ -1,6 +1,17 @@
 """Tests for devopstoolbox.k8s.utils module."""
 
-from unittest.mock import patch
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, Mock, call, patch
+
+import pytest
+import urllib3
+from kubernetes.client import Configuration, CoreV1Api
+from kubernetes.utils.keepalive import tcp_keepalive_socket_options
+from rich.console import Console
+from rich.table import Table
 
 from devopstoolbox.k8s import utils
 from devopstoolbox.k8s.utils import calculate_cpu_percentage, calculate_memory_percentage, parse_cpu, parse_memory
@@ -152,6 +163,12 @@ class TestMemoryPercentage:
         assert calculate_memory_percentage("1024", "512") == "200.00%"
         assert calculate_memory_percentage("512", "1024") == "50.00%"
 
+    def test_calculate_mixed_units(self):
+        assert calculate_memory_percentage("1.5Gi", "3Gi") == "50.00%"
+        assert calculate_memory_percentage("500M", "1G") == "50.00%"
+        assert calculate_memory_percentage("128974848", "129e6") == "99.98%"
+        assert calculate_memory_percentage("64Mi", "0") == "-"
+
 
 class TestLoadKubeConfig:
     """Tests for load_kube_config function."""
@@ -159,16 +176,18 @@ class TestLoadKubeConfig:
     def setup_method(self):
         utils._kube_config_loaded = False
 
-    @patch("devopstoolbox.k8s.utils.config.load_kube_config")
-    def test_load_kube_config_success(self, mock_load):
+    @patch("devopstoolbox.k8s.utils.Configuration.set_default")
+    @patch("devopstoolbox.k8s.utils.kubeconfig.load")
+    def test_load_kube_config_success(self, mock_load, mock_set_default):
         """Test successful kubeconfig loading."""
         utils.load_kube_config()
 
-        mock_load.assert_called_once()
+        mock_load.return_value.load_and_set.assert_called_once()
+        mock_set_default.assert_called_once_with(mock_load.return_value.load_and_set.call_args.args[0])
         assert utils._kube_config_loaded is True
 
     @patch("devopstoolbox.k8s.utils.config.load_incluster_config")
-    @patch("devopstoolbox.k8s.utils.config.load_kube_config")
+    @patch("devopstoolbox.k8s.utils.kubeconfig.load")
     def test_load_kube_config_fallback_to_incluster(self, mock_load, mock_incluster):
         """Test fallback to in-cluster config when kubeconfig fails."""
         mock_load.side_effect = utils.config.ConfigException("No kubeconfig")
@@ -179,8 +198,9 @@ class TestLoadKubeConfig:
         mock_incluster.assert_called_once()
         assert utils._kube_config_loaded is True
 
-    @patch("devopstoolbox.k8s.utils.config.load_kube_config")
-    def test_load_kube_config_only_loads_once(self, mock_load):
+    @patch("devopstoolbox.k8s.utils.Configuration.set_default")
+    @patch("devopstoolbox.k8s.utils.kubeconfig.load")
+    def test_load_kube_config_only_loads_once(self, mock_load, mock_set_default):
         """Test that config is only loaded once."""
         utils.load_kube_config()
         utils.load_kube_config()
@@ -192,35 +212,295 @@ class TestLoadKubeConfig:
 class TestGetCurrentNamespace:
     """Tests for get_current_namespace function."""
 
-    @patch("devopstoolbox.k8s.utils.config.list_kube_config_contexts")
-    def test_get_namespace_from_context(self, mock_contexts):
+    def test_get_namespace_from_context(self, kubeconfig_file):
         """Test getting namespace from active context."""
-        mock_contexts.return_value = (
-            [],
-            {"context": {"namespace": "my-namespace"}},
+        assert utils.get_current_namespace() == "payments"
+        assert utils.current_context_name() == "prod"
+
+    def test_cluster_identity(self, kubeconfig_file):
+        assert utils.cluster_identity() == ("prod", "https://prod.example.com", "admin")
+        assert utils.cluster_identity("stage") == ("stage", "https://stage.example.com", "admin")
+
+    def test_get_default_when_no_namespace_in_context(self, kubeconfig_file):
+        """Test returning default when no namespace in context."""
+        assert utils.get_current_namespace("stage") == "default"
+
+    def test_get_default_on_exception(self, tmp_path, monkeypatch):
+        """Test returning default on exception."""
+        monkeypatch.setenv("KUBECONFIG", str(tmp_path / "missing"))
+
+        assert utils.get_current_namespace() == "default"
+        assert utils.current_context_name() == "in-cluster"
+
+
+class TestSelectorKwargs:
+    """Tests for selector_kwargs function."""
+
+    def test_no_selectors(self):
+        assert utils.selector_kwargs(None, None) == {}
+
+    def test_field_selectors_are_joined(self):
+        assert utils.selector_kwargs("app=web", "status.phase!=Running", None, "spec.nodeName=n1") == {
+            "label_selector": "app=web",
+            "field_selector": "status.phase!=Running,spec.nodeName=n1",
+        }
+
+
+class TestPaginate:
+    """Tests for paginate function."""
+
+    def test_follows_continue_tokens(self):
+        """Test that every page is requested with the previous continue token."""
+        list_func = Mock(
+            side_effect=[
+                Mock(items=["a", "b"], metadata=Mock(_continue="token-1")),
+                Mock(items=["c"], metadata=Mock(_continue=None)),
+            ]
         )
 
-        result = utils.get_current_namespace()
+        pages = list(utils.paginate(list_func, "default", watch=False, page_size=2))
 
-        assert result == "my-namespace"
+        assert pages == [["a", "b"], ["c"]]
+        assert list_func.call_args_list == [
+            call("default", watch=False, limit=2),
+            call("default", watch=False, limit=2, _continue="token-1"),
+        ]
 
-    @patch("devopstoolbox.k8s.utils.config.list_kube_config_contexts")
-    def test_get_default_when_no_namespace_in_context(self, mock_contexts):
-        """Test returning default when no namespace in context."""
-        mock_contexts.return_value = (
-            [],
-            {"context": {}},
+    def test_custom_object_dicts(self):
+        """Test pagination of dict responses returned by CustomObjectsApi."""
+        list_func = Mock(side_effect=[{"items": [1], "metadata": {"continue": "next"}}, {"items": [2], "metadata": {}}])
+
+        assert list(utils.paginate(list_func, plural="pods", page_size=1)) == [[1], [2]]
+        assert list_func.call_args_list[1] == call(plural="pods", limit=1, _continue="next")
+
+    def test_page_size_zero_fetches_everything(self):
+        """Test that a page size of 0 sends no limit."""
+        list_func = Mock(return_value={"items": [1, 2, 3]})
+
+        assert list(utils.paginate(list_func, page_size=0)) == [[1, 2, 3]]
+        list_func.assert_called_once_with()
+
+    def test_pages_are_fetched_lazily(self):
+        """Test that the next page is only requested once the previous one is consumed."""
+        list_func = Mock(side_effect=[{"items": [1], "metadata": {"continue": "next"}}, {"items": [2]}])
+
+        pages = utils.paginate(list_func)
+        next(pages)
+
+        list_func.assert_called_once()
+
+
+class TestPrintTablePages:
+    """Tests for print_table_pages function."""
+
+    def make_table(self):
+        table = Table(title="Pods")
+        table.add_column("Name", justify="center")
+        table.add_column("Status", justify="center")
+        return table
+
+    def test_pages_share_column_widths(self):
+        """Test that later pages line up with the first one."""
+        console = Console(width=80, record=True)
+
+        count = utils.print_table_pages(console, self.make_table(), [[("a-long-pod-name", "Running")], [], [("b", "Failed")]])
+
+        lines = console.export_text().splitlines()
+        assert count == 2
+        assert lines[0].strip() == "Pods"
+        assert len({len(line) for line in lines[1:]}) == 1
+        assert sum("Name" in line for line in lines) == 1
+
+    def test_empty_result_prints_header(self):
+        """Test that an empty listing still prints the table header."""
+        console = Console(width=80, record=True)
+
+        assert utils.print_table_pages(console, self.make_table(), [[]]) == 0
+        assert "Name" in console.export_text()
+
+
+class TestResolveNamespaces:
+    """Tests for resolve_namespaces and describe_scope functions."""
+
+    def test_repeated_and_comma_separated_values(self):
+        """Test that values are split, stripped and deduplicated in order."""
+        assert utils.resolve_namespaces(["b", "a, c", "b"]) == ["b", "a", "c"]
+
+    @patch("devopstoolbox.k8s.utils.get_current_namespace", return_value="dev")
+    def test_defaults_to_current_namespace(self, mock_namespace):
+        """Test that the context's namespace is used when none is given."""
+        assert utils.resolve_namespaces(None) == ["dev"]
+
+    def test_describe_scope(self):
+        assert utils.describe_scope(["a"], True) == "all namespaces"
+        assert utils.describe_scope(["a"], False) == "namespace a"
+        assert utils.describe_scope(["a", "b"], False) == "namespaces a, b"
+        assert utils.describe_scope(None, False, ["prod", "stage"]) == "each context's namespace of contexts prod, stage"
+        assert utils.describe_scope(None, True, ["prod"]) == "all namespaces of context prod"
+
+
+class TestFanOutPages:
+    """Tests for fan_out_pages function."""
+
+    def test_all_namespaces_streams_pages(self):
+        """Test that a cluster-wide listing keeps its pages."""
+        fetch_pages = Mock(return_value=iter([[1], [2]]))
+
+        assert list(utils.fan_out_pages(fetch_pages, ["a"], True)) == [[1], [2]]
+        fetch_pages.assert_called_once_with(None)
+
+    def test_namespaces_are_queried_concurrently(self):
+        """Test that several namespaces are in flight at once and merged in order."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch_pages(namespace):
+            barrier.wait()
+            return [[f"{namespace}-1"], [f"{namespace}-2"]]
+
+        assert list(utils.fan_out_pages(fetch_pages, ["a", "b", "c"], False)) == [["a-1", "a-2"], ["b-1", "b-2"], ["c-1", "c-2"]]
+
+
+class TestQueryClusters:
+    """Tests for resolve_contexts and query_clusters functions."""
+
+    def test_resolve_contexts(self, kubeconfig_file):
+        """Test explicit, comma-separated and all-context selection."""
+        assert utils.resolve_contexts(None) == []
+        assert utils.resolve_contexts(["b,a", "b"]) == ["b", "a"]
+        assert utils.resolve_contexts(None, all_contexts=True) == ["prod", "stage"]
+
+    @patch("devopstoolbox.k8s.utils.get_api_client")
+    def test_current_context_streams_pages(self, mock_get_client):
+        """Test that without contexts the shared client is used and pages pass through."""
+        fetch_pages = Mock(return_value=iter([[("a",)], [("b",)]]))
+
+        assert list(utils.query_clusters(Console(), [], fetch_pages)) == [[("a",)], [("b",)]]
+        fetch_pages.assert_called_once_with(mock_get_client.return_value, None)
+        mock_get_client.assert_called_once_with()
+
+    @patch("devopstoolbox.k8s.utils.ApiClient")
+    def test_contexts_are_queried_in_parallel(self, mock_api_client, kubeconfig_file):
+        """Test that clusters run concurrently, each with its own client, and rows get a cluster column."""
+        mock_api_client.side_effect = lambda configuration: MagicMock(configuration=configuration)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch_pages(api_client, context):
+            barrier.wait()
+            return [[(f"{context}-pod",)]]
+
+        pages = list(utils.query_clusters(Console(), ["prod", "stage"], fetch_pages))
+
+        assert pages == [[("prod", "prod-pod")], [("stage", "stage-pod")]]
+        assert sorted(c.args[0].host for c in mock_api_client.call_args_list) == ["https://prod.example.com", "https://stage.example.com"]
+
+    @patch("devopstoolbox.k8s.utils.ApiClient")
+    @patch("devopstoolbox.k8s.utils.kubeconfig.load")
+    def test_failed_and_slow_clusters_are_skipped(self, mock_load, mock_api_client):
+        """Test that one failing or hung cluster does not hide the others."""
+        release = threading.Event()
+
+        def fetch_pages(api_client, context):
+            if context == "broken":
+                raise RuntimeError("connection refused")
+            if context == "slow":
+                release.wait(5)
+            return [[("pod",)]]
+
+        console = Console(width=200, record=True)
+        try:
+            pages = list(utils.query_clusters(console, ["broken", "slow", "ok"], fetch_pages, timeout=0.2))
+        finally:
+            release.set()
+
+        output = console.export_text()
+        assert pages == [[("ok", "pod")]]
+        assert "could not query context broken" in output
+        assert "connection refused" in output
+        assert "context slow did not answer within 0.2s" in output
+
+    @patch("devopstoolbox.k8s.utils.get_api_client")
+    def test_queued_clusters_get_their_full_timeout(self, mock_get_client, monkeypatch):
+        """Test that a cluster waiting for a free slot does not use up its timeout while queued."""
+        monkeypatch.setattr(utils, "MAX_PARALLEL_REQUESTS", 1)
+
+        def fetch_pages(api_client, context):
+            time.sleep(0.2)
+            return [[("pod",)]]
+
+        console = Console(width=200, record=True)
+        pages = list(utils.query_clusters(console, ["first", "second"], fetch_pages, timeout=0.3))
+
+        assert pages == [[("first", "pod")], [("second", "pod")]]
+        assert "did not answer" not in console.export_text()
+
+    def test_hung_cluster_does_not_delay_exit(self):
+        """Test that the process exits once a hung cluster has been given up on, without waiting for it."""
+        code = (
+            "import time\n"
+            "from rich.console import Console\n"
+            "from devopstoolbox.k8s import utils\n"
+            "utils.get_api_client = lambda *args: None\n"
+            "pages = utils.query_clusters(Console(), ['hung'], lambda api_client, context: time.sleep(60), timeout=0.2)\n"
+            "print(list(pages))"
         )
+        start = time.monotonic()
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=30)
 
-        result = utils.get_current_namespace()
+        assert time.monotonic() - start < 20
+        assert result.stdout.splitlines()[-1] == "[]"
 
-        assert result == "default"
 
-    @patch("devopstoolbox.k8s.utils.config.list_kube_config_contexts")
-    def test_get_default_on_exception(self, mock_contexts):
-        """Test returning default on exception."""
-        mock_contexts.side_effect = Exception("No kubeconfig")
+class TestApiClients:
+    """Tests for the shared, pooled API clients."""
 
-        result = utils.get_current_namespace()
+    @patch("devopstoolbox.k8s.utils.load_kube_config")
+    def test_current_context_client_is_shared(self, mock_load):
+        """Test that one pooled client is created and reused for the current context."""
+        utils.configure_api_clients(pool_maxsize=32)
+
+        api_client = utils.get_api_client()
+
+        assert utils.get_api_client() is api_client
+        assert api_client.configuration.connection_pool_maxsize == 32
+        assert api_client.configuration.keep_alive
+        assert api_client.rest_client.pool_manager.connection_pool_kw["socket_options"] == tcp_keepalive_socket_options()
+        mock_load.assert_called_once()
 
-        assert result == "default"
+    def test_request_timeout_bounds_current_context_requests(self, silent_apiserver, monkeypatch):
+        """Test that --request-timeout makes requests to an apiserver that never answers give up."""
+        monkeypatch.setenv("KUBECONFIG", str(silent_apiserver))
+        # Load the silent kubeconfig as the default configuration, and restore the previous one afterwards.
+        monkeypatch.setattr(utils, "_kube_config_loaded", False)
+        monkeypatch.setattr(Configuration, "_default", Configuration._default)
+        utils.configure_api_clients(request_timeout=0.2)
+
+        start = time.monotonic()
+        with pytest.raises(urllib3.exceptions.HTTPError):
+            CoreV1Api(utils.get_api_client()).list_namespaced_pod("default")
+        assert time.monotonic() - start < 5
+
+    def test_context_clients_get_timeout(self, silent_apiserver, monkeypatch):
+        """Test that each context gets its own client whose requests give up after the timeout."""
+        monkeypatch.setenv("KUBECONFIG", str(silent_apiserver))
+
+        prod = utils.get_api_client("prod", 0.2)
+
+        assert utils.get_api_client("stage") is not prod
+        assert prod.configuration.connection_pool_maxsize == utils.DEFAULT_CONNECTION_POOL_MAXSIZE
+        start = time.monotonic()
+        with pytest.raises(urllib3.exceptions.HTTPError):
+            CoreV1Api(prod).list_namespaced_pod("default")
+        assert time.monotonic() - start < 5
+
+    @patch("devopstoolbox.k8s.utils.load_kube_config")
+    @patch("kubernetes.client.rest.RESTClientObject.request", return_value=Mock(status=200))
+    def test_request_timings(self, mock_request, mock_load):
+        """Test that requests are timed when enabled and printed as a table."""
+        utils.configure_api_clients(record_timings=True)
+
+        utils.get_api_client().rest_client.request("GET", "https://k8s/api/v1/pods")
+
+        assert [(method, url, status) for method, url, status, _ in utils.request_timings()] == [("GET", "https://k8s/api/v1/pods", 200)]
+        console = Console(width=200, record=True)
+        utils.print_request_timings(console)
+        assert "/api/v1/pods" in console.export_text()
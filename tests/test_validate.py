@@ -1,10 +1,16 @@
 """Tests for devopstoolbox.validate module."""
 
+import json as pyjson
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
+import yaml as pyyaml
 from typer.testing import CliRunner
 
+from devopstoolbox import validate
 from devopstoolbox.main import app as main_app
-from devopstoolbox.validate import validate_json_file, validate_yaml_file
+from devopstoolbox.validate import run_validation, validate_json_file, validate_yaml_file, validate_yaml_syntax
 
 runner = CliRunner()
 
@@ -108,6 +114,42 @@ class TestValidateYamlFile:
         assert is_valid is True
         assert error == ""
 
+    @pytest.mark.parametrize("content", [INVALID_YAML, "a: [1, 2\n", "- a\nb: c\n", "a: *missing\n", "a: 'unterminated\n"])
+    def test_error_message_independent_of_loader(self, tmp_path, content):
+        yaml_file = tmp_path / "broken.yaml"
+        yaml_file.write_text(content)
+        with patch.object(validate, "YAML_LOADER", pyyaml.SafeLoader):
+            expected = validate_yaml_file(yaml_file)
+        assert validate_yaml_file(yaml_file) == expected
+        assert expected[0] is False
+        assert expected[1].startswith("Line ")
+
+    def test_uses_libyaml_when_available(self):
+        if pyyaml.__with_libyaml__:
+            assert validate.YAML_LOADER is pyyaml.CSafeLoader
+        else:
+            assert validate.YAML_LOADER is pyyaml.SafeLoader
+
+
+class TestValidateYamlSyntax:
+    @pytest.mark.parametrize("content", [VALID_YAML, MULTI_DOC_YAML, EMPTY_YAML, "base: &b {x: 1}\nderived: *b\n", "---\na: &x 1\n---\nb: &x 2\n"])
+    def test_valid_yaml(self, tmp_path, content):
+        yaml_file = tmp_path / "valid.yaml"
+        yaml_file.write_text(content)
+        assert validate_yaml_syntax(yaml_file) == (True, "")
+
+    @pytest.mark.parametrize("content", [INVALID_YAML, "a: [1, 2\n", "a: *missing\n", "a: &x 1\nb: &x 2\n", "---\na: &x 1\n---\nb: *x\n"])
+    def test_reports_same_errors_as_full_validation(self, tmp_path, content):
+        yaml_file = tmp_path / "broken.yaml"
+        yaml_file.write_text(content)
+        assert validate_yaml_syntax(yaml_file) == validate_yaml_file(yaml_file)
+
+    def test_skips_object_construction(self, tmp_path):
+        yaml_file = tmp_path / "tagged.yaml"
+        yaml_file.write_text("value: !!int not-a-number\n")
+        assert validate_yaml_file(yaml_file)[0] is False
+        assert validate_yaml_syntax(yaml_file) == (True, "")
+
 
 class TestValidateYamlCommand:
     def test_validate_single_valid_file(self, valid_yaml_file):
@@ -152,6 +194,85 @@ class TestValidateYamlCommand:
         assert result.exit_code == 0
         assert "2 valid, 0 invalid" in result.stdout
 
+    def test_validate_directory_with_jobs(self, directory_with_mixed_files):
+        result = runner.invoke(main_app, ["validate", "yaml", "-d", str(directory_with_mixed_files), "--jobs", "2"])
+        assert result.exit_code == 1
+        assert "1 valid, 1 invalid" in result.stdout
+
+    def test_validate_syntax_only(self, directory_with_mixed_files):
+        result = runner.invoke(main_app, ["validate", "yaml", "-d", str(directory_with_mixed_files), "--syntax-only"])
+        assert result.exit_code == 1
+        assert "1 valid, 1 invalid" in result.stdout
+
+    def test_negative_jobs_rejected(self, valid_yaml_file):
+        result = runner.invoke(main_app, ["validate", "yaml", "-f", str(valid_yaml_file), "-j", "-1"])
+        assert result.exit_code == 2
+
+
+class TestValidateOutputFormats:
+    def test_text_format_streams_lines(self, directory_with_mixed_files):
+        result = runner.invoke(main_app, ["validate", "yaml", "-d", str(directory_with_mixed_files), "--format", "text"])
+        assert result.exit_code == 1
+        lines = result.stdout.splitlines()
+        assert lines[0].startswith("INVALID ") and "invalid.yaml: Line" in lines[0]
+        assert lines[1].startswith("VALID ") and lines[1].endswith("valid.yaml")
+        assert "1 valid, 1 invalid" in result.stdout
+
+    def test_jsonl_format(self, directory_with_mixed_files):
+        result = runner.invoke(main_app, ["validate", "yaml", "-d", str(directory_with_mixed_files), "--format", "jsonl"])
+        assert result.exit_code == 1
+        records = [pyjson.loads(line) for line in result.stdout.splitlines()]
+        assert [(Path(record["file"]).name, record["valid"]) for record in records] == [("invalid.yaml", False), ("valid.yaml", True)]
+        assert records[0]["error"].startswith("Line 3, Column 13")
+
+    def test_only_errors(self, directory_with_mixed_json_files):
+        result = runner.invoke(main_app, ["validate", "json", "-d", str(directory_with_mixed_json_files), "--format", "jsonl", "--only-errors"])
+        assert result.exit_code == 1
+        records = [pyjson.loads(line) for line in result.stdout.splitlines()]
+        assert [Path(record["file"]).name for record in records] == ["invalid.json"]
+
+    def test_only_errors_table(self, directory_with_mixed_files):
+        result = runner.invoke(main_app, ["validate", "yaml", "-d", str(directory_with_mixed_files), "--only-errors"])
+        assert "Invalid" in result.stdout
+        # Only the "YAML Validation Results" title; no "Valid" status cell.
+        assert result.stdout.count("Valid") == 1
+        assert "1 valid, 1 invalid" in result.stdout
+
+    def test_fail_fast_stops_at_first_invalid(self, tmp_path):
+        for name in ("a.yaml", "c.yaml"):
+            (tmp_path / name).write_text(SIMPLE_YAML)
+        (tmp_path / "b.yaml").write_text(INVALID_YAML)
+        result = runner.invoke(main_app, ["validate", "yaml", "-d", str(tmp_path), "--format", "text", "--fail-fast", "-j", "2"])
+        assert result.exit_code == 1
+        assert "c.yaml" not in result.stdout
+        assert "1 valid, 1 invalid" in result.stdout
+
+    def test_error_markup_is_escaped(self, tmp_path):
+        yaml_file = tmp_path / "flow.yaml"
+        yaml_file.write_text("a: [1, 2\n")
+        result = runner.invoke(main_app, ["validate", "yaml", "-f", str(yaml_file), "--format", "text"])
+        assert "expected ',' or ']'" in result.stdout
+
+
+class TestRunValidation:
+    def test_serial_preserves_order(self, tmp_path):
+        files = [tmp_path / f"{name}.yaml" for name in ("b", "a", "c")]
+        for file_path in files:
+            file_path.write_text(SIMPLE_YAML)
+        results = list(run_validation(files, validate_yaml_file))
+        assert [path for path, _, _ in results] == files
+        assert all(is_valid for _, is_valid, _ in results)
+
+    def test_parallel_matches_serial(self, tmp_path):
+        files = []
+        for index in range(20):
+            file_path = tmp_path / f"file{index:02d}.yaml"
+            file_path.write_text(INVALID_YAML if index % 3 == 0 else SIMPLE_YAML)
+            files.append(file_path)
+        serial = list(run_validation(files, validate_yaml_file, jobs=1))
+        parallel = list(run_validation(files, validate_yaml_file, jobs=4))
+        assert parallel == serial
+
 
 @pytest.fixture
 def valid_json_file(tmp_path):
@@ -263,3 +384,8 @@ class TestValidateJsonCommand:
         result = runner.invoke(main_app, ["validate", "json", "-d", str(nested_json_directory)])
         assert result.exit_code == 0
         assert "2 valid, 0 invalid" in result.stdout
+
+    def test_validate_directory_with_jobs(self, directory_with_mixed_json_files):
+        result = runner.invoke(main_app, ["validate", "json", "-d", str(directory_with_mixed_json_files), "-j", "2"])
+        assert result.exit_code == 1
+        assert "1 valid, 1 invalid" in result.stdout
@@ -0,0 +1,253 @@
+"""Tests for devopstoolbox.watcher module."""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+from typer.testing import CliRunner
+
+from devopstoolbox import validate, watcher
+from devopstoolbox.main import app as main_app
+from devopstoolbox.scanner import PathFilter, iter_files
+from devopstoolbox.watcher import EventWatcher, PollingWatcher, create_watcher
+
+runner = CliRunner()
+
+
+def touch(path, content):
+    """Write ``content`` and move the mtime forward so coarse filesystem clocks still see a change."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    touch(tmp_path / "a.yaml", "key: value\n")
+    touch(tmp_path / "sub/b.yml", "key: value\n")
+    touch(tmp_path / "ignored/c.yaml", "key: value\n")
+    touch(tmp_path / "notes.txt", "text\n")
+    (tmp_path / ".gitignore").write_text("ignored/\n")
+    return tmp_path
+
+
+class TestPathFilter:
+    def test_matches_iter_files(self, tree):
+        accept = PathFilter(tree, (".yaml", ".yml"))
+        candidates = [path for path in tree.rglob("*") if path.is_file()]
+        assert sorted(filter(accept, candidates)) == sorted(iter_files(tree, (".yaml", ".yml")))
+
+    def test_reset_rereads_gitignore(self, tree):
+        accept = PathFilter(tree, (".yaml",))
+        assert not accept(tree / "ignored" / "c.yaml")
+        (tree / ".gitignore").write_text("")
+        accept.reset()
+        assert accept(tree / "ignored" / "c.yaml")
+
+    def test_paths_outside_root_rejected(self, tree, tmp_path_factory):
+        other = tmp_path_factory.mktemp("other") / "x.yaml"
+        assert not PathFilter(tree, (".yaml",))(other)
+
+
+class TestPollingWatcher:
+    @pytest.fixture
+    def poller(self, tree):
+        poller = PollingWatcher(tree, (".yaml", ".yml"))
+        poller.interval = 0
+        return poller
+
+    def test_initial_files(self, tree, poller):
+        assert poller.files() == [tree / "a.yaml", tree / "sub" / "b.yml"]
+
+    def test_no_changes(self, poller):
+        assert poller.wait() == (set(), set())
+
+    def test_modified_created_and_removed(self, tree, poller):
+        touch(tree / "a.yaml", "key: other\n")
+        touch(tree / "new.yaml", "key: value\n")
+        (tree / "sub" / "b.yml").unlink()
+        touch(tree / "ignored" / "d.yaml", "key: value\n")
+        assert poller.wait() == ({tree / "a.yaml", tree / "new.yaml"}, {tree / "sub" / "b.yml"})
+        assert poller.wait() == (set(), set())
+
+
+@pytest.mark.skipif(watcher.Observer is None, reason="watchdog is not installed")
+class TestEventWatcher:
+    def wait_for(self, event_watcher, expected_changed=(), expected_removed=()):
+        changed, removed = set(), set()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and (changed != set(expected_changed) or removed != set(expected_removed)):
+            new_changed, new_removed = event_watcher.wait(timeout=0.2)
+            changed = (changed - new_removed) | new_changed
+            removed = (removed - new_changed) | new_removed
+        return changed, removed
+
+    def test_reports_changes(self, tree):
+        event_watcher = create_watcher(tree, (".yaml", ".yml"))
+        try:
+            touch(tree / "a.yaml", "key: other\n")
+            touch(tree / "ignored" / "d.yaml", "key: value\n")
+            assert self.wait_for(event_watcher, [tree / "a.yaml"]) == ({tree / "a.yaml"}, set())
+            (tree / "sub" / "b.yml").unlink()
+            assert self.wait_for(event_watcher, (), [tree / "sub" / "b.yml"]) == (set(), {tree / "sub" / "b.yml"})
+        finally:
+            event_watcher.close()
+
+
+class FakeObserver:
+    def schedule(self, handler, path, recursive=False):
+        self.handler = handler
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def join(self):
+        pass
+
+
+def fs_event(event_type, src_path, dest_path="", is_directory=False):
+    return SimpleNamespace(event_type=event_type, src_path=str(src_path), dest_path=str(dest_path) if dest_path else "", is_directory=is_directory)
+
+
+class TestEventWatcherRescans:
+    """Tests for how EventWatcher turns events into changes, fed by a fake observer."""
+
+    @pytest.fixture
+    def event_watcher(self, tree, monkeypatch):
+        monkeypatch.setattr(watcher, "Observer", FakeObserver)
+        walked = []
+
+        def recording_iter_files(root, *args):
+            walked.append(root)
+            return iter_files(root, *args)
+
+        monkeypatch.setattr(watcher, "iter_files", recording_iter_files)
+        event_watcher = EventWatcher(tree, (".yaml", ".yml"))
+        event_watcher.walked = walked
+        walked.clear()
+        return event_watcher
+
+    def send(self, event_watcher, *events):
+        for event in events:
+            event_watcher.handler.on_any_event(event)
+        return event_watcher.wait(timeout=0)
+
+    def test_file_save_does_not_walk(self, tree, event_watcher):
+        """Test that the parent directory's modified event of an editor's write+rename triggers no walk."""
+        touch(tree / "sub" / "b.yml", "key: other\n")
+        changes = self.send(
+            event_watcher,
+            fs_event("created", tree / "sub" / ".b.yml.swp"),
+            fs_event("moved", tree / "sub" / ".b.yml.swp", tree / "sub" / "b.yml"),
+            fs_event("modified", tree / "sub", is_directory=True),
+        )
+        assert changes == ({tree / "sub" / "b.yml"}, set())
+        assert event_watcher.walked == []
+
+    def test_excluded_directories_are_ignored(self, tree, event_watcher):
+        touch(tree / ".git" / "refs" / "x.yaml", "key: value\n")
+        touch(tree / "ignored" / "new" / "d.yaml", "key: value\n")
+        changes = self.send(
+            event_watcher,
+            fs_event("created", tree / ".git" / "refs", is_directory=True),
+            fs_event("created", tree / "ignored" / "new", is_directory=True),
+        )
+        assert changes == (set(), set())
+        assert event_watcher.walked == []
+
+    def test_new_and_removed_directories_rescan_their_subtree(self, tree, event_watcher):
+        touch(tree / "sub" / "deep" / "c.yaml", "key: value\n")
+        changes = self.send(event_watcher, fs_event("created", tree / "sub" / "deep", is_directory=True), fs_event("created", tree / "sub" / "deep" / "c.yaml"))
+        assert changes == ({tree / "sub" / "deep" / "c.yaml"}, set())
+        assert event_watcher.walked == [tree / "sub" / "deep"]
+
+        (tree / "sub").rename(tree / "ignored" / "sub")
+        changes = self.send(event_watcher, fs_event("moved", tree / "sub", tree / "ignored" / "sub", is_directory=True))
+        assert changes == (set(), {tree / "sub" / "b.yml", tree / "sub" / "deep" / "c.yaml"})
+        assert event_watcher.files() == [tree / "a.yaml"]
+        assert event_watcher.walked == [tree / "sub" / "deep", tree / "sub"]
+
+    def test_gitignore_change_rescans_its_directory(self, tree, event_watcher):
+        (tree / ".gitignore").write_text("")
+        changes = self.send(event_watcher, fs_event("modified", tree / ".gitignore"))
+        assert changes == ({tree / "ignored" / "c.yaml"}, set())
+        assert event_watcher.walked == [tree]
+
+
+class FakeWatcher:
+    """Replays scripted (changed, removed) batches, then interrupts the watch loop."""
+
+    def __init__(self, files, batches):
+        self._files = files
+        self.batches = list(batches)
+        self.closed = False
+
+    def files(self):
+        return sorted(self._files)
+
+    def wait(self, timeout=None):
+        if not self.batches:
+            raise KeyboardInterrupt
+        action, changed, removed = self.batches.pop(0)
+        action()
+        return changed, removed
+
+    def close(self):
+        self.closed = True
+
+
+class TestWatchCommand:
+    def run(self, tree, batches, *args):
+        fake = FakeWatcher(list(iter_files(tree, (".yaml", ".yml"))), batches)
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(validate, "create_watcher", lambda *a: fake)
+            result = runner.invoke(main_app, ["validate", "yaml", "-d", str(tree), "--watch", *args])
+        assert fake.closed
+        return result
+
+    def test_revalidates_changed_files(self, tree):
+        a_yaml = tree / "a.yaml"
+        batches = [
+            (lambda: a_yaml.write_text("key: value\n  bad: indent\n"), {a_yaml}, set()),
+            (lambda: a_yaml.write_text("key: value\n"), {a_yaml}, set()),
+        ]
+        result = self.run(tree, batches, "--format", "text")
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert lines[0] == "Summary: 2 valid, 0 invalid"
+        assert any(line.startswith(f"INVALID {a_yaml}") for line in lines)
+        assert f"FIXED {a_yaml}" in lines
+        assert lines[-1] == "Summary: 2 valid, 0 invalid"
+
+    def test_exit_code_reflects_remaining_errors(self, tree):
+        b_yml = tree / "sub" / "b.yml"
+        new_yaml = tree / "new.yaml"
+        batches = [
+            (lambda: b_yml.unlink(), set(), {b_yml}),
+            (lambda: new_yaml.write_text("a: [\n"), {new_yaml}, set()),
+        ]
+        result = self.run(tree, batches, "--format", "jsonl")
+        assert result.exit_code == 1
+        events = [validate.pyjson.loads(line) for line in result.stdout.splitlines()]
+        assert [(event["event"], event["file"]) for event in events] == [("removed", str(b_yml)), ("invalid", str(new_yaml))]
+
+    @pytest.mark.parametrize("args", [["--fail-fast"], ["--staged"], ["--changed-since", "main"]])
+    def test_incompatible_options(self, tree, args):
+        result = runner.invoke(main_app, ["validate", "yaml", "-d", str(tree), "--watch", *args])
+        assert result.exit_code == 1
+        assert "--watch requires --directory" in result.stdout
+
+    def test_requires_directory(self, tree):
+        result = runner.invoke(main_app, ["validate", "json", "-f", str(tree / "a.yaml"), "--watch"])
+        assert result.exit_code == 1
+        assert "--watch requires --directory" in result.stdout
+
+
+def test_create_watcher_falls_back_to_polling(tree, monkeypatch):
+    monkeypatch.setattr(watcher, "Observer", None)
+    assert isinstance(create_watcher(tree, (".yaml",)), PollingWatcher)